@@ -0,0 +1,111 @@
+"""Import-time benchmark of the application module.
+
+Runs ``python -X importtime -c "import <module>"`` in fresh interpreters and
+reports the cumulative import time of the module together with the slowest
+packages it pulls in. The module is imported, and the server started, on
+every cold start, so this tracks the time before uvicorn can bind.
+
+``--json`` appends the run to a file so results can be compared across
+releases, and ``--max-ms`` fails the run when the median exceeds a budget.
+
+Usage:
+    python benchmarks/bench_import_time.py --runs 7
+    python benchmarks/bench_import_time.py --json import_times.jsonl --max-ms 900
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from content_reviewer_agent import __version__
+
+DEFAULT_MODULE = "content_reviewer_agent.main"
+
+
+def measure(module: str) -> Tuple[int, Dict[str, int]]:
+    """Import a module in a fresh interpreter.
+
+    Args:
+        module: Dotted module name
+
+    Returns:
+        Cumulative import time of the module and of every top-level package
+        it imported, in microseconds
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    total = 0
+    packages: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        name = name.strip()
+        if name == module:
+            total = int(cumulative)
+            break
+        if depth == 0:
+            # Imported by the interpreter before the module, such as site
+            packages.clear()
+        elif depth == 1:
+            # A direct import of the module, which lists after its own imports
+            root = name.split(".")[0]
+            packages[root] = max(packages.get(root, 0), int(cumulative))
+    return total, packages
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark and report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--json", help="Append the result to this JSON lines file")
+    parser.add_argument("--max-ms", type=float, help="Fail above this median")
+    args = parser.parse_args()
+
+    totals: List[int] = []
+    packages: Dict[str, List[int]] = {}
+    for _ in range(args.runs):
+        total, run_packages = measure(args.module)
+        totals.append(total)
+        for name, micros in run_packages.items():
+            packages.setdefault(name, []).append(micros)
+
+    median_ms = statistics.median(totals) / 1000
+    print(f"{args.module} {__version__}: median {median_ms:.1f} ms")
+    print(f"  (min {min(totals) / 1000:.1f} ms, max {max(totals) / 1000:.1f} ms)")
+    slowest = sorted(
+        ((statistics.median(v) / 1000, name) for name, v in packages.items()),
+        reverse=True,
+    )
+    for ms, name in slowest[: args.top]:
+        print(f"  {name:<28} {ms:>8.1f} ms")
+
+    if args.json:
+        record = {
+            "module": args.module,
+            "version": __version__,
+            "python": sys.version.split()[0],
+            "timestamp": time.time(),
+            "median_ms": round(median_ms, 1),
+            "runs_ms": [round(t / 1000, 1) for t in totals],
+        }
+        with open(args.json, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+    if args.max_ms is not None and median_ms > args.max_ms:
+        sys.exit(f"Import time {median_ms:.1f} ms exceeds {args.max_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark of corpus scans on a generated corpus.
+
+Generates a tree of small Markdown and Python files, then times the first
+scan (every file hashed and queued), a re-scan with nothing changed (stat
+only) and a re-scan after editing one file in a thousand.
+
+Usage:
+    python benchmarks/bench_scanner.py --files 100000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from content_reviewer_agent.services.jobs import ReviewJobQueue
+from content_reviewer_agent.services.scanner import CorpusScanner
+
+
+def generate(root: str, files: int, per_directory: int = 200) -> list:
+    """Write a corpus of small files and return their paths."""
+    paths = []
+    for i in range(files):
+        directory = os.path.join(root, f"disciplina{i // per_directory:04d}")
+        if i % per_directory == 0:
+            os.makedirs(directory)
+        extension = ".py" if i % 5 == 0 else ".md"
+        path = os.path.join(directory, f"aula{i:06d}{extension}")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"# Aula {i}\n\nConteúdo da aula número {i}.\n")
+        paths.append(path)
+    return paths
+
+
+async def run(files: int) -> None:
+    """Time the scans of a generated corpus and print the reports."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, "corpus")
+        paths = generate(root, files)
+        queue = ReviewJobQueue(service=None, path=os.path.join(tmp, "jobs.db"))
+        scanner = CorpusScanner(queue, queue.path, roots=[root])
+
+        for label in ("first scan", "unchanged re-scan"):
+            report = await scanner.scan()
+            print(
+                f"{label:<22} {report.elapsed_seconds:>7.2f}s  "
+                f"queued {report.queued}, unchanged {report.unchanged}"
+            )
+
+        time.sleep(0.01)
+        for path in paths[::1000]:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("Revisado.\n")
+        report = await scanner.scan()
+        print(
+            f"{'re-scan, 0.1% edited':<22} {report.elapsed_seconds:>7.2f}s  "
+            f"queued {report.queued}, unchanged {report.unchanged}"
+        )
+        scanner.close()
+        queue.close()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100000)
+    args = parser.parse_args()
+    asyncio.run(run(args.files))
+
+
+if __name__ == "__main__":
+    main()
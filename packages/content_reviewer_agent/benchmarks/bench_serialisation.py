@@ -0,0 +1,174 @@
+"""Microbenchmark of per-issue overhead from model response to HTTP body.
+
+Compares the previous path (type maps rebuilt per issue, then FastAPI's
+re-validation of the result against ``response_model``, ``jsonable_encoder``
+and ``json.dumps``) with the current one (module-level maps and a single
+pydantic-core serialisation of the result, without re-validation).
+
+Building issues with ``model_construct`` was measured too and is slower than
+validating them with pydantic-core, so issues are still validated once.
+
+Usage:
+    python benchmarks/bench_serialisation.py --issues 100 1000 10000
+"""
+
+import argparse
+import json
+import time
+from typing import Callable, List
+
+from fastapi.encoders import jsonable_encoder
+
+from content_reviewer_agent.agents.error_detection import ErrorDetectionAgent
+from content_reviewer_agent.api.responses import FastJSONResponse
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.ai_schema import AIReviewIssue, AIReviewResponse
+from content_reviewer_agent.models.content import (
+    Content,
+    IssueSeverity,
+    IssueType,
+    ReviewIssue,
+)
+from content_reviewer_agent.models.review_result import (
+    ReviewResult,
+    ReviewStatus,
+    ReviewType,
+)
+
+
+def legacy_convert(
+    agent: ErrorDetectionAgent, ai_issues: List[AIReviewIssue], content: Content
+) -> List[ReviewIssue]:
+    """The conversion as it was, with both type maps rebuilt for every issue."""
+    issues = []
+    for ai_issue in ai_issues:
+        issue_type_map = {
+            "spelling": IssueType.SPELLING,
+            "grammar": IssueType.GRAMMAR,
+            "syntax": IssueType.SYNTAX,
+            "comprehension": IssueType.COMPREHENSION,
+            "source": IssueType.SOURCE,
+            "outdated": IssueType.OUTDATED,
+            "deprecated": IssueType.DEPRECATED,
+        }
+        severity_map = {
+            "critical": IssueSeverity.CRITICAL,
+            "high": IssueSeverity.HIGH,
+            "medium": IssueSeverity.MEDIUM,
+            "low": IssueSeverity.LOW,
+        }
+        issues.append(
+            ReviewIssue(
+                content_id=content.content_id,
+                issue_type=issue_type_map.get(
+                    ai_issue.type.lower(), IssueType.TECHNICAL
+                ),
+                severity=severity_map.get(
+                    ai_issue.severity.lower(), IssueSeverity.MEDIUM
+                ),
+                description=ai_issue.description,
+                original_text=ai_issue.original_text,
+                suggested_fix=ai_issue.suggested_fix,
+                sources=ai_issue.sources or [],
+                confidence=ai_issue.confidence,
+                reviewed_by_agent=f"{agent.name} ({settings.google_model_name})",
+            )
+        )
+    return issues
+
+
+def legacy_render(result: ReviewResult) -> bytes:
+    """FastAPI's default path for a route with ``response_model``."""
+    validated = ReviewResult.model_validate(result.model_dump())
+    payload = jsonable_encoder(validated)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def fast_render(result: ReviewResult) -> bytes:
+    """The route's path with FastJSONResponse."""
+    return FastJSONResponse(result).body
+
+
+def best_of(repeats: int, func: Callable[[], object]) -> float:
+    """Best wall time of several runs, in seconds."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(count: int, repeats: int) -> None:
+    """Time both paths for one batch size and print per-issue costs."""
+    agent = ErrorDetectionAgent()
+    content = Content(title="Benchmark", text="x")
+    response = AIReviewResponse(
+        issues=[
+            AIReviewIssue(
+                type=("spelling", "grammar", "outdated")[i % 3],
+                severity=("low", "medium", "high")[i % 3],
+                description=f"Issue number {i} in the benchmark batch",
+                original_text=f"word{i}",
+                suggested_fix=f"fixed{i}",
+                confidence=0.9,
+                sources=["https://example.com/reference"],
+            )
+            for i in range(count)
+        ]
+    )
+
+    def result_of(issues: List[ReviewIssue]) -> ReviewResult:
+        return ReviewResult(
+            content_id=content.content_id,
+            review_type=ReviewType.FULL_REVIEW,
+            status=ReviewStatus.COMPLETED,
+            issues=issues,
+        )
+
+    legacy_result = result_of(legacy_convert(agent, response.issues, content))
+    fast_result = result_of(
+        agent.convert_ai_issues_to_review_issues(response.issues, content)
+    )
+    assert json.loads(fast_render(fast_result))["issues"][0]["issue_type"] == (
+        json.loads(legacy_render(legacy_result))["issues"][0]["issue_type"]
+    )
+
+    rows = [
+        (
+            "convert",
+            best_of(repeats, lambda: legacy_convert(agent, response.issues, content)),
+            best_of(
+                repeats,
+                lambda: agent.convert_ai_issues_to_review_issues(
+                    response.issues, content
+                ),
+            ),
+        ),
+        (
+            "serialise",
+            best_of(repeats, lambda: legacy_render(legacy_result)),
+            best_of(repeats, lambda: fast_render(fast_result)),
+        ),
+    ]
+    print(f"\n{count} issues (per-issue microseconds, best of {repeats})")
+    print(f"{'stage':<10} {'legacy':>10} {'fast':>10} {'speed-up':>9}")
+    for stage, legacy, fast in rows:
+        print(
+            f"{stage:<10} {legacy / count * 1e6:>10.2f} {fast / count * 1e6:>10.2f} "
+            f"{legacy / fast:>8.1f}x"
+        )
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    for count in args.issues:
+        run(count, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
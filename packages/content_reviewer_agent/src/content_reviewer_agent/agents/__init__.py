@@ -1,17 +1,39 @@
-"""Agent initialization and exports."""
+"""Agent initialization and exports.
 
-from content_reviewer_agent.agents.base import BaseReviewAgent
-from content_reviewer_agent.agents.base_ai import BaseAIAgent
-from content_reviewer_agent.agents.comprehension import ComprehensionAgent
-from content_reviewer_agent.agents.content_update import ContentUpdateAgent
-from content_reviewer_agent.agents.error_detection import ErrorDetectionAgent
-from content_reviewer_agent.agents.source_verification import SourceVerificationAgent
+Agents are imported on first access, so that importing a submodule such as
+``agents.transport`` does not load every agent and its dependencies.
+"""
 
-__all__ = [
-    "BaseReviewAgent",
-    "BaseAIAgent",
-    "ErrorDetectionAgent",
-    "ComprehensionAgent",
-    "SourceVerificationAgent",
-    "ContentUpdateAgent",
-]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from content_reviewer_agent.agents.base import BaseReviewAgent
+    from content_reviewer_agent.agents.base_ai import BaseAIAgent
+    from content_reviewer_agent.agents.comprehension import ComprehensionAgent
+    from content_reviewer_agent.agents.content_update import ContentUpdateAgent
+    from content_reviewer_agent.agents.error_detection import ErrorDetectionAgent
+    from content_reviewer_agent.agents.source_verification import (
+        SourceVerificationAgent,
+    )
+
+_EXPORTS = {
+    "BaseReviewAgent": "base",
+    "BaseAIAgent": "base_ai",
+    "ErrorDetectionAgent": "error_detection",
+    "ComprehensionAgent": "comprehension",
+    "SourceVerificationAgent": "source_verification",
+    "ContentUpdateAgent": "content_update",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported agent class on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_EXPORTS[name]}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
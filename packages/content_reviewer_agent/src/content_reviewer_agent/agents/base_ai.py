@@ -1,39 +1,170 @@
 """Base agent interface for AI-powered content reviewers."""
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 
-from google import genai
-from google.genai import types
+from pydantic import ValidationError
 
+from content_reviewer_agent.agents.cache import (
+    ReviewCache,
+    get_review_cache,
+    review_cache_key,
+)
+from content_reviewer_agent.agents.cascade import INVALID_OUTPUT, LOW_CONFIDENCE
+from content_reviewer_agent.agents.clients import get_genai_client
+from content_reviewer_agent.agents.telemetry import current_telemetry
+from content_reviewer_agent.agents.transport import ModelTransport, get_transport
+from content_reviewer_agent.analysis.chunking import (
+    TextChunk,
+    chunk_text,
+    estimate_tokens,
+    merge_chunk_issues,
+    sentence_spans,
+)
+from content_reviewer_agent.analysis.code import (
+    COMMENT,
+    DOCSTRING,
+    IDENTIFIER,
+    analyse_code,
+    detect_language,
+)
+from content_reviewer_agent.analysis.compaction import compact_text
+from content_reviewer_agent.analysis.text_index import TextIndex, TextIndexCache
 from content_reviewer_agent.config import settings
 from content_reviewer_agent.models.ai_schema import AIReviewResponse
 from content_reviewer_agent.models.content import (
     Content,
+    ContentType,
     IssueSeverity,
     IssueType,
     ReviewIssue,
 )
 
+if TYPE_CHECKING:
+    from google import genai
+
+logger = logging.getLogger(__name__)
+
+# Model vocabulary mapped to our issue types and severities
+_ISSUE_TYPES = {
+    "spelling": IssueType.SPELLING,
+    "grammar": IssueType.GRAMMAR,
+    "syntax": IssueType.SYNTAX,
+    "comprehension": IssueType.COMPREHENSION,
+    "source": IssueType.SOURCE,
+    "outdated": IssueType.OUTDATED,
+    "deprecated": IssueType.DEPRECATED,
+}
+_SEVERITIES = {
+    "critical": IssueSeverity.CRITICAL,
+    "high": IssueSeverity.HIGH,
+    "medium": IssueSeverity.MEDIUM,
+    "low": IssueSeverity.LOW,
+}
+
+_text_indexes: Optional[TextIndexCache] = None
+
+
+def get_text_index(text: str) -> TextIndex:
+    """Get the shared index of a text.
+
+    The review service indexes each content once per review, and every agent
+    resolves its issues against that same index.
+
+    Args:
+        text: Full text of a content
+
+    Returns:
+        Index of the text
+    """
+    global _text_indexes
+    if _text_indexes is None:
+        _text_indexes = TextIndexCache(settings.text_index_cache_size)
+    return _text_indexes.get(text)
+
+
+def _quoted_sentences(text: str, issues: List[ReviewIssue]) -> str:
+    """Pick the sentences of a text that the issues quote.
+
+    Args:
+        text: Text the issues were found in
+        issues: Issues whose passages are wanted
+
+    Returns:
+        The quoted sentences in text order, joined by newlines, or the whole
+        text if an issue's quote cannot be found in it
+    """
+    index = TextIndex(text)
+    sentences = sentence_spans(text)
+    picked: Set[int] = set()
+    for issue in issues:
+        spans = index.find_all(issue.original_text)
+        if not spans:
+            return text
+        for span in spans:
+            picked.update(
+                i
+                for i, (start, end) in enumerate(sentences)
+                if start < span.end and span.start < end
+            )
+    return "\n".join(
+        text[start:end] for i, (start, end) in enumerate(sentences) if i in picked
+    )
+
 
 class BaseAIAgent(ABC):
     """Base class for all AI-powered review agents."""
 
-    def __init__(self, name: str, description: str, system_prompt: str):
+    #: Bump when the prompts change so cached responses are not reused
+    PROMPT_VERSION = "1"
+
+    #: Content metadata key holding extra facts to append to the prompt
+    PROMPT_CONTEXT_KEY = "prompt_context"
+
+    #: Replace fenced code blocks with a summary when compacting prompts
+    ELIDE_CODE_BLOCKS = False
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        system_prompt: str,
+        transport: Optional[ModelTransport] = None,
+        cache: Optional[ReviewCache] = None,
+        client: Optional["genai.Client"] = None,
+    ):
         """Initialize the AI agent.
 
         Args:
             name: Name of the agent
             description: Description of what the agent does
             system_prompt: System prompt for the AI model
+            transport: Transport for model calls (defaults to the shared one)
+            cache: Review response cache (defaults to the shared one)
+            client: Google AI client. Defaults to the shared, pooled one,
+                fetched on the first model call.
         """
         self.name = name
         self.description = description
         self.system_prompt = system_prompt
+        self.transport = transport or get_transport()
+        self.cache = cache or get_review_cache()
+
+        self._client = client
 
-        # Initialize the Google AI client (can be None for testing)
-        api_key = settings.google_api_key or "test-key"  # Use test key if None
-        self.client = genai.Client(api_key=api_key)
+    @property
+    def client(self) -> "genai.Client":
+        """Google AI client, sharing one keep-alive pool across all agents.
+
+        Unless one was given, it is fetched from the registry on every use:
+        building an agent does not import the ``google.genai`` SDK, and a
+        registry that was closed hands out a client on its new pool.
+        """
+        if self._client is not None:
+            return self._client
+        return get_genai_client()
 
     @abstractmethod
     def get_review_prompt(self, content: Content) -> str:
@@ -47,108 +178,382 @@ class BaseAIAgent(ABC):
         """
         pass
 
-    async def review(self, content: Content) -> List[ReviewIssue]:
+    async def review(
+        self, content: Content, use_cache: bool = True
+    ) -> List[ReviewIssue]:
         """Review content using AI and return list of issues.
 
+        Documents over ``settings.chunk_max_tokens`` are split into
+        overlapping windows that are reviewed concurrently.
+
         Args:
             content: Content to review
+            use_cache: Look up and store the response in the review cache
 
         Returns:
             List of issues found
         """
-        try:
-            # Generate the full prompt
-            user_prompt = self.get_review_prompt(content)
-            full_prompt = f"{self.system_prompt}\n\n{user_prompt}"
-
-            # Call the AI model with structured output
-            response = self.client.models.generate_content(
-                model=settings.google_model_name,
-                contents=full_prompt,
-                config=types.GenerateContentConfig(
-                    temperature=settings.temperature,
-                    max_output_tokens=settings.max_output_tokens,
-                    response_mime_type="application/json",
-                    response_schema=AIReviewResponse,
-                ),
+        chunks = chunk_text(
+            content.text, settings.chunk_max_tokens, settings.chunk_overlap_tokens
+        )
+        return await self.review_segments(content, chunks, use_cache=use_cache)
+
+    async def review_segments(
+        self, content: Content, segments: List[TextChunk], use_cache: bool = True
+    ) -> List[ReviewIssue]:
+        """Review selected windows of a content and map issues back to it.
+
+        Args:
+            content: Full content being reviewed
+            segments: Windows of ``content.text`` to send to the model
+            use_cache: Look up and store the responses in the review cache
+
+        Returns:
+            Issues with offsets relative to the full content
+        """
+        if len(segments) == 1 and segments[0].text == content.text:
+            issues = [await self._review_single(content, use_cache)]
+        else:
+            issues = await asyncio.gather(
+                *(
+                    self._review_single(
+                        content.model_copy(update={"text": segment.text}), use_cache
+                    )
+                    for segment in segments
+                )
             )
 
-            # Parse the response using Pydantic
-            if response.text:
-                print("AI model response received")
-                review_response = AIReviewResponse.model_validate_json(response.text)
-                issues = self.convert_ai_issues_to_review_issues(
-                    review_response.issues, content
+        index = get_text_index(content.text)
+        located: List[ReviewIssue] = []
+        for segment, segment_issues in zip(segments, issues):
+            for issue in segment_issues:
+                index.locate_issue(issue, segment.start, segment.end)
+                located.append(issue)
+        if len(segments) == 1:
+            return located
+        return merge_chunk_issues(located)
+
+    async def review_excerpts(
+        self,
+        content: Content,
+        excerpts: List[List[TextChunk]],
+        use_cache: bool = True,
+    ) -> List[ReviewIssue]:
+        """Send selected passages to the model, one prompt per group.
+
+        Passages of a group are joined by newlines into a single prompt and
+        the issues found are located back in the passage they quote.
+
+        Args:
+            content: Full content being reviewed
+            excerpts: Groups of passages of ``content.text`` to review
+            use_cache: Look up and store the responses in the review cache
+
+        Returns:
+            Issues with offsets relative to the full content
+        """
+        excerpts = [group for group in excerpts if group]
+        responses = await asyncio.gather(
+            *(
+                self._review_single(
+                    content.model_copy(
+                        update={"text": "\n".join(chunk.text for chunk in group)}
+                    ),
+                    use_cache,
                 )
-                return issues
-            else:
-                print("Empty response from AI model")
-                return []
-        finally:
-            print("Review completed by agent:", self.name)
-        # except Exception as e:
-        #     print(f"Error in {self.name}: {e}")
-        #     return []
+                for group in excerpts
+            )
+        )
+        index = get_text_index(content.text)
+        located: List[ReviewIssue] = []
+        for group, issues in zip(excerpts, responses):
+            for issue in issues:
+                # Prefer an occurrence inside one of the passages sent
+                if not any(
+                    index.locate_issue(issue, chunk.start, chunk.end, strict=True)
+                    for chunk in group
+                ):
+                    index.locate_issue(issue, group[0].start, group[-1].end)
+                located.append(issue)
+        return located
 
-    def convert_ai_issues_to_review_issues(
-        self, ai_issues: List, content: Content
+    def code_excerpts(
+        self,
+        content: Content,
+        segments: List[TextChunk],
+        kinds: Tuple[str, ...] = (COMMENT, DOCSTRING, IDENTIFIER),
+    ) -> List[List[TextChunk]]:
+        """Pick the prose out of each window of a source file.
+
+        The source is parsed locally (see ``analyse_code``) and only its
+        comments, docstrings and declared names are kept, grouped by the
+        window they start in. The tokens of code left out go to the
+        review's telemetry.
+
+        Args:
+            content: Full code content being reviewed
+            segments: Windows of ``content.text`` to review
+            kinds: Kinds of prose span to keep
+
+        Returns:
+            Passages of each window, for ``review_excerpts``
+        """
+        analysis = analyse_code(content.text, detect_language(content))
+        excerpts: List[List[TextChunk]] = [[] for _ in segments]
+        for span in analysis.prose:
+            if span.kind not in kinds:
+                continue
+            for group, segment in zip(excerpts, segments):
+                if segment.start <= span.start < segment.end:
+                    group.append(
+                        TextChunk(
+                            span.start, span.end, content.text[span.start : span.end]
+                        )
+                    )
+                    break
+        telemetry = current_telemetry()
+        if telemetry is not None:
+            skipped = sum(estimate_tokens(segment.text) for segment in segments) - sum(
+                estimate_tokens(chunk.text) for group in excerpts for chunk in group
+            )
+            telemetry.prompts_for(self.name).code_tokens_skipped += max(0, skipped)
+        return excerpts
+
+    async def _review_single(
+        self, content: Content, use_cache: bool = True
     ) -> List[ReviewIssue]:
-        """Convert AI response issues to ReviewIssue objects.
+        """Review a content that fits in a single prompt.
+
+        The text is compacted first (see ``compact_content``). With
+        ``settings.cascade_enabled`` the prompt goes to the fast model
+        first. When it reports issues below
+        ``settings.cascade_confidence_threshold``, only the sentences quoted
+        by those issues go on to the main model, and its issues are merged
+        with the fast model's confident ones. A response that fails
+        validation sends the whole text to the main model instead.
 
         Args:
-            ai_issues: List of AIReviewIssue objects from AI
-            content: Original content being reviewed
+            content: Content to review
+            use_cache: Look up and store the response in the review cache
 
         Returns:
-            List of ReviewIssue objects
+            List of issues found
         """
-        issues = []
+        try:
+            content = self.compact_content(content)
+            prompt = self._build_prompt(content)
+            strong_model = settings.google_model_name
+            if not settings.cascade_enabled:
+                issues = await self._call_model(
+                    content, prompt, strong_model, use_cache
+                )
+                return issues or []
 
-        for ai_issue in ai_issues:
+            reason = None
+            confident: List[ReviewIssue] = []
+            escalated = content
             try:
-                # Map AI response to our issue types
-                issue_type_map = {
-                    "spelling": IssueType.SPELLING,
-                    "grammar": IssueType.GRAMMAR,
-                    "syntax": IssueType.SYNTAX,
-                    "comprehension": IssueType.COMPREHENSION,
-                    "source": IssueType.SOURCE,
-                    "outdated": IssueType.OUTDATED,
-                    "deprecated": IssueType.DEPRECATED,
-                }
-
-                severity_map = {
-                    "critical": IssueSeverity.CRITICAL,
-                    "high": IssueSeverity.HIGH,
-                    "medium": IssueSeverity.MEDIUM,
-                    "low": IssueSeverity.LOW,
-                }
-
-                issue_type = issue_type_map.get(
-                    ai_issue.type.lower(), IssueType.TECHNICAL
+                issues = await self._call_model(
+                    content, prompt, settings.cascade_fast_model, use_cache
                 )
-                severity = severity_map.get(
-                    ai_issue.severity.lower(), IssueSeverity.MEDIUM
+            except ValidationError as e:
+                logger.warning(
+                    "Invalid response from %s: %s", settings.cascade_fast_model, e
                 )
+                issues = None
+            if issues is None:
+                reason = INVALID_OUTPUT
+            else:
+                threshold = settings.cascade_confidence_threshold
+                confident = [i for i in issues if i.confidence >= threshold]
+                doubtful = [i for i in issues if i.confidence < threshold]
+                if doubtful:
+                    reason = LOW_CONFIDENCE
+                    escalated = content.model_copy(
+                        update={"text": _quoted_sentences(content.text, doubtful)}
+                    )
+            escalated_prompt = prompt
+            if escalated is not content:
+                escalated_prompt = self._build_prompt(escalated)
 
-                issue = self.create_issue(
-                    content=content,
-                    issue_type=issue_type,
-                    severity=severity,
-                    description=ai_issue.description,
-                    original_text=ai_issue.original_text,
-                    suggested_fix=ai_issue.suggested_fix,
-                    sources=ai_issue.sources or [],
-                    confidence=ai_issue.confidence,
+            telemetry = current_telemetry()
+            if telemetry is not None and telemetry.cascade is not None:
+                telemetry.cascade.for_agent(self.name).record(
+                    estimate_tokens(prompt), reason, estimate_tokens(escalated_prompt)
                 )
-                issues.append(issue)
+            if reason is None:
+                return confident
+            issues = await self._call_model(
+                escalated, escalated_prompt, strong_model, use_cache
+            )
+            return merge_chunk_issues(confident + (issues or []))
+        finally:
+            logger.debug("Review completed by agent: %s", self.name)
 
-            except (KeyError, ValueError, TypeError) as e:
-                print(f"Error converting AI issue: {e}")
-                continue
+    def compact_content(self, content: Content) -> Content:
+        """Compact a content's text before it is put in a prompt.
+
+        Whitespace is normalised, repeated boilerplate lines are kept once
+        and, for agents with ``ELIDE_CODE_BLOCKS``, fenced code blocks are
+        summarised. The text is then cut to fit the whole prompt within
+        ``settings.prompt_token_budget``. Prompt sizes before and after go to
+        the review's telemetry.
+
+        Args:
+            content: Content to compact
+
+        Returns:
+            A copy of the content with the compacted text
+        """
+        if not settings.prompt_compaction:
+            return content
+        overhead = estimate_tokens(
+            self._build_prompt(content.model_copy(update={"text": ""}))
+        )
+        compacted = compact_text(
+            content.text,
+            elide_code=self.ELIDE_CODE_BLOCKS,
+            keep_indentation=content.content_type == ContentType.CODE,
+            max_tokens=max(0, settings.prompt_token_budget - overhead),
+        )
+        telemetry = current_telemetry()
+        if telemetry is not None:
+            telemetry.prompts_for(self.name).record(
+                overhead + compacted.tokens_before,
+                overhead + compacted.tokens_after,
+                compacted,
+            )
+        if compacted.truncated:
+            logger.info("%s: prompt truncated to the token budget", self.name)
+        return content.model_copy(update={"text": compacted.text})
+
+    def _build_prompt(self, content: Content) -> str:
+        """Build the full prompt for a content, with any extra context.
+
+        Args:
+            content: Content to review
+
+        Returns:
+            System prompt followed by the review prompt
+        """
+        user_prompt = self.get_review_prompt(content)
+        context = content.metadata.get(self.PROMPT_CONTEXT_KEY, "")
+        if context:
+            user_prompt = f"{user_prompt}\n\n{context}"
+        return f"{self.system_prompt}\n\n{user_prompt}"
+
+    async def _call_model(
+        self, content: Content, prompt: str, model: str, use_cache: bool = True
+    ) -> Optional[List[ReviewIssue]]:
+        """Send a prompt to one model and parse its issues.
+
+        Args:
+            content: Content being reviewed
+            prompt: Full prompt for the content
+            model: Model to call
+            use_cache: Look up and store the response in the review cache
+
+        Returns:
+            Issues found, or None if the model returned an empty response
+
+        Raises:
+            ValidationError: If the response does not match AIReviewResponse
+        """
+        cache_key = None
+        if self.cache is not None:
+            if use_cache:
+                cache_key = review_cache_key(
+                    content,
+                    self.name,
+                    model,
+                    self.PROMPT_VERSION,
+                    content.metadata.get(self.PROMPT_CONTEXT_KEY, ""),
+                )
+                cached = await self.cache.get(cache_key)
+                if cached is not None:
+                    return self._credit_model(
+                        self.parse_response(cached, content), model
+                    )
+            else:
+                self.cache.record_bypass()
+
+        # Imported here, like the client, to keep the SDK off the import path
+        from google.genai import types
+
+        # Call the AI model with structured output off the event loop
+        response = await self.transport.generate_content(
+            self.client,
+            model=model,
+            contents=prompt,
+            config=types.GenerateContentConfig(
+                temperature=settings.temperature,
+                max_output_tokens=settings.max_output_tokens,
+                response_mime_type="application/json",
+                response_schema=AIReviewResponse,
+            ),
+        )
 
+        # Parse the response using Pydantic
+        if not response.text:
+            logger.warning("Empty response from %s", model)
+            return None
+        logger.debug("Response received from %s", model)
+        issues = self.parse_response(response.text, content)
+        if self.cache is not None and cache_key is not None:
+            await self.cache.set(cache_key, response.text)
+        return self._credit_model(issues, model)
+
+    def _credit_model(self, issues: List[ReviewIssue], model: str) -> List[ReviewIssue]:
+        """Name the model that found the issues in their reviewer."""
+        if model != settings.google_model_name:
+            for issue in issues:
+                issue.reviewed_by_agent = f"{self.name} ({model})"
         return issues
 
+    def parse_response(self, response_text: str, content: Content) -> List[ReviewIssue]:
+        """Parse a raw JSON model response into ReviewIssue objects.
+
+        Args:
+            response_text: JSON text matching AIReviewResponse
+            content: Content being reviewed
+
+        Returns:
+            List of issues found
+        """
+        review_response = AIReviewResponse.model_validate_json(response_text)
+        return self.convert_ai_issues_to_review_issues(review_response.issues, content)
+
+    def convert_ai_issues_to_review_issues(
+        self, ai_issues: List, content: Content
+    ) -> List[ReviewIssue]:
+        """Convert AI response issues to ReviewIssue objects.
+
+        The AI issues were already validated against AIReviewResponse, so no
+        conversion is expected to fail and none is caught per issue.
+
+        Args:
+            ai_issues: List of AIReviewIssue objects from AI
+            content: Original content being reviewed
+
+        Returns:
+            List of ReviewIssue objects
+        """
+        return [
+            self.create_issue(
+                content=content,
+                issue_type=_ISSUE_TYPES.get(ai_issue.type.lower(), IssueType.TECHNICAL),
+                severity=_SEVERITIES.get(
+                    ai_issue.severity.lower(), IssueSeverity.MEDIUM
+                ),
+                description=ai_issue.description,
+                original_text=ai_issue.original_text,
+                suggested_fix=ai_issue.suggested_fix,
+                sources=ai_issue.sources,
+                confidence=ai_issue.confidence,
+            )
+            for ai_issue in ai_issues
+        ]
+
     def create_issue(
         self,
         content: Content,
@@ -163,6 +568,9 @@ class BaseAIAgent(ABC):
     ) -> ReviewIssue:
         """Helper method to create a ReviewIssue.
 
+        The confidence is clamped to its valid range, so a model reporting
+        1.2 does not lose the issue.
+
         Args:
             content: Content being reviewed
             issue_type: Type of issue
@@ -177,9 +585,6 @@ class BaseAIAgent(ABC):
         Returns:
             ReviewIssue object
         """
-        # Generate agent name with model info
-        agent_name = f"{self.name} ({settings.google_model_name})"
-
         return ReviewIssue(
             content_id=content.content_id,
             issue_type=issue_type,
@@ -189,10 +594,28 @@ class BaseAIAgent(ABC):
             suggested_fix=suggested_fix,
             location=location,
             sources=sources or [],
-            confidence=confidence,
-            reviewed_by_agent=agent_name,
+            confidence=min(1.0, max(0.0, confidence)),
+            # Agent name with model info
+            reviewed_by_agent=f"{self.name} ({settings.google_model_name})",
         )
 
+    @staticmethod
+    def place_issue(
+        content: Content, issue: ReviewIssue, start: int, end: int
+    ) -> ReviewIssue:
+        """Set an issue's span, line and paragraph in the full content.
+
+        Args:
+            content: Full content being reviewed
+            issue: Issue to update in place
+            start: Start offset in ``content.text``
+            end: End offset in ``content.text``
+
+        Returns:
+            The issue
+        """
+        return get_text_index(content.text).place_issue(issue, start, end)
+
     def __repr__(self) -> str:
         """String representation of the agent."""
         return f"{self.__class__.__name__}(name='{self.name}')"
@@ -0,0 +1,320 @@
+"""Content-addressed cache for AI review responses."""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from content_reviewer_agent import storage
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.content import Content
+
+
+def content_fingerprint(content: Content) -> str:
+    """Hash the parts of a content that affect its review.
+
+    The content_id, metadata and timestamps are left out, so the same lesson
+    submitted twice gets the same fingerprint.
+
+    Args:
+        content: Content to fingerprint
+
+    Returns:
+        Hex digest of the content
+    """
+    payload = json.dumps(
+        [
+            content.title,
+            content.text,
+            content.content_type.value,
+            content.discipline,
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def review_cache_key(
+    content: Content,
+    agent_name: str,
+    model_name: str,
+    prompt_version: str,
+    context: str = "",
+) -> str:
+    """Build the cache key for one agent reviewing one content.
+
+    Args:
+        content: Content being reviewed
+        agent_name: Name of the reviewing agent
+        model_name: Model used for the review
+        prompt_version: Version of the agent prompt
+        context: Extra facts added to the prompt, if any
+
+    Returns:
+        Cache key
+    """
+    parts = [content_fingerprint(content), agent_name, model_name, prompt_version]
+    if context:
+        parts.append(context)
+    payload = json.dumps(parts)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheBackend(ABC):
+    """Storage tier for cached review responses."""
+
+    #: Whether calls block on I/O and should run in a worker thread
+    blocking: bool = False
+
+    def __init__(self, name: str):
+        """Initialize the backend.
+
+        Args:
+            name: Name of the tier, used in statistics
+        """
+        self.name = name
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached value, or None if missing or expired."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """Store a value."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all cached values."""
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored entries."""
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU tier with a size bound and TTL."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        """Initialize the memory tier.
+
+        Args:
+            max_entries: Maximum number of entries kept
+            ttl_seconds: Time to live of an entry
+        """
+        super().__init__("memory")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of stored entries."""
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Persistent on-disk tier backed by SQLite."""
+
+    blocking = True
+
+    def __init__(self, path: str, ttl_seconds: float):
+        """Initialize the SQLite tier.
+
+        Args:
+            path: Database file path
+            ttl_seconds: Time to live of an entry
+        """
+        super().__init__("sqlite")
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = storage.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS review_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached value, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM review_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value: str
+            expires_at: float
+            value, expires_at = row
+            if expires_at < time.time():
+                self._conn.execute("DELETE FROM review_cache WHERE key = ?", (key,))
+                return None
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO review_cache (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, value, time.time() + self.ttl_seconds),
+            )
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        with self._lock:
+            self._conn.execute("DELETE FROM review_cache")
+
+    def __len__(self) -> int:
+        """Number of stored entries."""
+        with self._lock:
+            count: int = self._conn.execute(
+                "SELECT COUNT(*) FROM review_cache"
+            ).fetchone()[0]
+            return count
+
+
+class ReviewCache:
+    """Tiered cache looked up from the fastest backend to the slowest.
+
+    A hit in a slower tier is promoted into the faster tiers above it.
+    """
+
+    def __init__(self, backends: List[CacheBackend]):
+        """Initialize the cache.
+
+        Args:
+            backends: Cache tiers, fastest first
+        """
+        self.backends = backends
+        self.hits: Dict[str, int] = {backend.name: 0 for backend in backends}
+        self.misses = 0
+        self.bypassed = 0
+
+    async def _call(self, backend: CacheBackend, method: str, *args):
+        """Call a backend method, in a worker thread if it blocks."""
+        func = getattr(backend, method)
+        if backend.blocking:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    async def get(self, key: str) -> Optional[str]:
+        """Look up a key in every tier.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        for index, backend in enumerate(self.backends):
+            value: Optional[str] = await self._call(backend, "get", key)
+            if value is not None:
+                self.hits[backend.name] += 1
+                for faster in self.backends[:index]:
+                    await self._call(faster, "set", key, value)
+                return value
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a value in every tier.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        for backend in self.backends:
+            await self._call(backend, "set", key, value)
+
+    def record_bypass(self) -> None:
+        """Count a lookup skipped at the caller's request."""
+        self.bypassed += 1
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        for backend in self.backends:
+            backend.clear()
+        self.hits = {backend.name: 0 for backend in self.backends}
+        self.misses = 0
+        self.bypassed = 0
+
+    def stats(self) -> dict:
+        """Get hit and miss counters.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        total_hits = sum(self.hits.values())
+        lookups = total_hits + self.misses
+        return {
+            "hits": total_hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "hit_rate": total_hits / lookups if lookups else 0.0,
+            "tiers": {
+                backend.name: {"hits": self.hits[backend.name], "size": len(backend)}
+                for backend in self.backends
+            },
+        }
+
+
+_review_cache: Optional[ReviewCache] = None
+
+
+def get_review_cache() -> Optional[ReviewCache]:
+    """Get the process-wide review cache.
+
+    Returns:
+        The cache, or None if caching is disabled in settings
+    """
+    global _review_cache
+    if not settings.review_cache_enabled:
+        return None
+    if _review_cache is None:
+        backends: List[CacheBackend] = [
+            MemoryCacheBackend(
+                max_entries=settings.review_cache_max_entries,
+                ttl_seconds=settings.review_cache_ttl_seconds,
+            )
+        ]
+        path = storage.resolve_sqlite_path(settings.database_url)
+        if path:
+            backends.append(
+                SQLiteCacheBackend(path, ttl_seconds=settings.review_cache_ttl_seconds)
+            )
+        _review_cache = ReviewCache(backends)
+    return _review_cache
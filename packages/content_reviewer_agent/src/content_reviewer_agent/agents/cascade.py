@@ -0,0 +1,117 @@
+"""Routing statistics of the fast-then-strong model cascade."""
+
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+
+#: Reasons a prompt is escalated to the strong model
+LOW_CONFIDENCE = "low_confidence"
+INVALID_OUTPUT = "invalid_output"
+
+
+@dataclass
+class CascadeStats:
+    """Routing decisions of one agent during one review.
+
+    Token counts are prompt estimates. Every prompt goes to the fast model
+    and only the escalated passages of a prompt also go to the strong model.
+    """
+
+    prompts: int = 0
+    escalated: int = 0
+    low_confidence: int = 0
+    invalid_output: int = 0
+    fast_tokens: int = 0
+    strong_tokens: int = 0
+
+    def record(
+        self,
+        tokens: int,
+        reason: Optional[str] = None,
+        escalated_tokens: Optional[int] = None,
+    ) -> None:
+        """Record one prompt and whether it was escalated.
+
+        Args:
+            tokens: Estimated prompt tokens
+            reason: Why the prompt was escalated, or None if it was not
+            escalated_tokens: Estimated tokens sent to the strong model;
+                defaults to the whole prompt
+        """
+        self.prompts += 1
+        self.fast_tokens += tokens
+        if reason is None:
+            return
+        self.escalated += 1
+        self.strong_tokens += tokens if escalated_tokens is None else escalated_tokens
+        if reason == LOW_CONFIDENCE:
+            self.low_confidence += 1
+        elif reason == INVALID_OUTPUT:
+            self.invalid_output += 1
+
+    def merge(self, other: "CascadeStats") -> None:
+        """Add another agent's decisions to these."""
+        for name, value in asdict(other).items():
+            setattr(self, name, getattr(self, name) + value)
+
+    def summary(self, fast_cost_ratio: float) -> dict:
+        """Summarise the decisions with the estimated savings.
+
+        Args:
+            fast_cost_ratio: Cost of a fast-model token relative to a
+                strong-model token
+
+        Returns:
+            Counts, tokens and the estimated cost relative to sending every
+            prompt to the strong model
+        """
+        data: Dict[str, float] = asdict(self)
+        data["strong_tokens_avoided"] = self.fast_tokens - self.strong_tokens
+        relative_cost = 1.0
+        if self.fast_tokens:
+            relative_cost = (
+                self.fast_tokens * fast_cost_ratio + self.strong_tokens
+            ) / self.fast_tokens
+        data["relative_cost"] = round(relative_cost, 3)
+        return data
+
+
+class CascadeRouting:
+    """Cascade decisions of every agent taking part in one review."""
+
+    def __init__(self):
+        """Start with no decisions."""
+        self.agents: Dict[str, CascadeStats] = {}
+
+    def for_agent(self, name: str) -> CascadeStats:
+        """Get the statistics of an agent, creating them on first use."""
+        stats = self.agents.get(name)
+        if stats is None:
+            stats = self.agents[name] = CascadeStats()
+        return stats
+
+    def summary(
+        self, fast_model: str, strong_model: str, fast_cost_ratio: float
+    ) -> dict:
+        """Summarise the review's routing for ``ReviewResult.metadata``.
+
+        Args:
+            fast_model: Model every prompt went to first
+            strong_model: Model escalated prompts went to
+            fast_cost_ratio: Cost of a fast-model token relative to a
+                strong-model token
+
+        Returns:
+            Totals and per-agent decisions
+        """
+        total = CascadeStats()
+        for stats in self.agents.values():
+            total.merge(stats)
+        return {
+            "fast_model": fast_model,
+            "strong_model": strong_model,
+            **total.summary(fast_cost_ratio),
+            "agents": {
+                name: stats.summary(fast_cost_ratio)
+                for name, stats in self.agents.items()
+            },
+        }
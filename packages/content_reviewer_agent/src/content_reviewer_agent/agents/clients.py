@@ -0,0 +1,185 @@
+"""Process-wide ``genai`` clients over one pooled HTTP connection pool."""
+
+import importlib.util
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Optional
+
+import httpx
+
+from content_reviewer_agent.config import settings
+
+if TYPE_CHECKING:
+    from google import genai
+
+#: Host of the Gemini API, used to open connections ahead of the first call
+GENAI_BASE_URL = "https://generativelanguage.googleapis.com/"
+
+logger = logging.getLogger(__name__)
+
+
+def http2_available() -> bool:
+    """Check whether httpx can negotiate HTTP/2 (needs the ``h2`` package)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class ClientRegistry:
+    """Shares one ``genai.Client`` per API key and one HTTP pool among them.
+
+    Model calls run in the transport's worker threads through the SDK's
+    synchronous client, so every client is given the same ``httpx.Client``.
+    Its keep-alive pool holds connections open between reviews, and HTTP/2
+    is used when available so concurrent calls share a connection.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive: Optional[int] = None,
+        keepalive_seconds: Optional[float] = None,
+        http2: Optional[bool] = None,
+    ):
+        """Initialize the registry.
+
+        Args:
+            max_connections: Connections open at once. Defaults to
+                ``settings.genai_max_connections``.
+            max_keepalive: Idle connections kept open. Defaults to
+                ``settings.genai_max_keepalive``.
+            keepalive_seconds: How long idle connections are kept. Defaults
+                to ``settings.genai_keepalive_seconds``.
+            http2: Use HTTP/2. Defaults to ``settings.genai_http2`` when the
+                ``h2`` package is installed.
+        """
+        self.max_connections = max_connections or settings.genai_max_connections
+        self.max_keepalive = max_keepalive or settings.genai_max_keepalive
+        self.keepalive_seconds = keepalive_seconds or settings.genai_keepalive_seconds
+        if http2 is None:
+            http2 = settings.genai_http2
+        self.http2 = http2 and http2_available()
+        self._http: Optional[httpx.Client] = None
+        self._clients: Dict[str, "genai.Client"] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def http(self) -> httpx.Client:
+        """Pooled HTTP client shared by every ``genai`` client."""
+        with self._lock:
+            if self._http is None:
+                self._http = httpx.Client(
+                    http2=self.http2,
+                    timeout=settings.timeout_seconds,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_keepalive,
+                        keepalive_expiry=self.keepalive_seconds,
+                    ),
+                )
+            return self._http
+
+    def get(self, api_key: Optional[str] = None) -> "genai.Client":
+        """Get the shared client for an API key.
+
+        Args:
+            api_key: API key; defaults to ``settings.google_api_key``
+
+        Returns:
+            The client, created on first use
+        """
+        api_key = api_key or settings.google_api_key or "test-key"
+        client = self._clients.get(api_key)
+        if client is not None:
+            return client
+        # The SDK takes a large share of the service's import time, so it is
+        # only loaded once a model client is actually needed
+        from google import genai
+        from google.genai import types
+
+        http = self.http
+        with self._lock:
+            client = self._clients.get(api_key)
+            if client is None:
+                client = genai.Client(
+                    api_key=api_key,
+                    http_options=types.HttpOptions(httpx_client=http),
+                )
+                self._clients[api_key] = client
+        return client
+
+    def warm_up(self, connections: Optional[int] = None) -> int:
+        """Open connections to the API host before the first model call.
+
+        Each connection makes a cheap request so its TLS handshake is done
+        and it waits in the keep-alive pool. With HTTP/2 one connection
+        carries every call, so only one is opened.
+
+        Args:
+            connections: Connections to open. Defaults to
+                ``settings.genai_warm_connections``.
+
+        Returns:
+            Number of connections opened
+        """
+        if connections is None:
+            connections = settings.genai_warm_connections
+        connections = 1 if self.http2 else min(connections, self.max_keepalive)
+        if connections <= 0:
+            return 0
+        http = self.http
+
+        def touch(_: int) -> bool:
+            try:
+                http.head(GENAI_BASE_URL)
+                return True
+            except httpx.HTTPError as e:
+                logger.warning("Could not pre-warm a connection: %s", e)
+                return False
+
+        with ThreadPoolExecutor(max_workers=connections) as pool:
+            return sum(pool.map(touch, range(connections)))
+
+    def stats(self) -> dict:
+        """Get the configuration and size of the registry."""
+        return {
+            "clients": len(self._clients),
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "max_keepalive": self.max_keepalive,
+        }
+
+    def close(self) -> None:
+        """Close the connection pool and forget every client."""
+        with self._lock:
+            self._clients.clear()
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+
+
+_registry: Optional[ClientRegistry] = None
+
+
+def get_client_registry() -> ClientRegistry:
+    """Get the process-wide ``genai`` client registry."""
+    global _registry
+    if _registry is None:
+        _registry = ClientRegistry()
+    return _registry
+
+
+def peek_client_registry() -> Optional[ClientRegistry]:
+    """Get the process-wide client registry if it has been created."""
+    return _registry
+
+
+def get_genai_client(api_key: Optional[str] = None) -> "genai.Client":
+    """Get the shared ``genai`` client for an API key.
+
+    Args:
+        api_key: API key; defaults to ``settings.google_api_key``
+
+    Returns:
+        The shared client
+    """
+    return get_client_registry().get(api_key)
@@ -1,12 +1,26 @@
 """Comprehension agent using Google AI for readability analysis."""
 
+from typing import List
+
 from content_reviewer_agent.agents.base_ai import BaseAIAgent
-from content_reviewer_agent.models.content import Content
+from content_reviewer_agent.analysis.chunking import TextChunk, merge_chunk_issues
+from content_reviewer_agent.analysis.readability import analyse_readability
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.content import (
+    Content,
+    ContentType,
+    IssueSeverity,
+    IssueType,
+    ReviewIssue,
+)
 
 
 class ComprehensionAgent(BaseAIAgent):
     """Agent that analyzes content comprehension using AI."""
 
+    #: Code listings say nothing about the readability of the prose
+    ELIDE_CODE_BLOCKS = True
+
     SYSTEM_PROMPT = """You are an expert in educational content design and readability. Your task is to analyze content for comprehension issues and suggest improvements.
 
 Focus on:
@@ -27,6 +41,106 @@ For each issue, provide the type as "comprehension", severity level, description
             system_prompt=self.SYSTEM_PROMPT,
         )
 
+    async def review_segments(
+        self, content: Content, segments: List[TextChunk], use_cache: bool = True
+    ) -> List[ReviewIssue]:
+        """Measure readability locally and send only complex passages to the model.
+
+        Long sentences and dense paragraphs are reported directly from the
+        metrics. Sentences below the reading ease threshold, in the passive
+        voice or heavy with jargon are sent to the model, grouped by window.
+        Of code, only the comments, docstrings and declared names are sent.
+
+        Args:
+            content: Full content being reviewed
+            segments: Windows of ``content.text`` to review
+            use_cache: Look up and store the responses in the review cache
+
+        Returns:
+            Issues with offsets relative to the full content
+        """
+        if content.content_type == ContentType.CODE and settings.local_code_analysis:
+            prose = self.code_excerpts(content, segments)
+            return merge_chunk_issues(
+                await self.review_excerpts(content, prose, use_cache)
+            )
+        if (
+            not settings.local_readability_filter
+            or content.content_type == ContentType.CODE
+        ):
+            return await super().review_segments(content, segments, use_cache)
+
+        report = analyse_readability(content.text)
+        issues: List[ReviewIssue] = []
+
+        def in_segments(start: int) -> bool:
+            return any(segment.start <= start < segment.end for segment in segments)
+
+        for index in range(len(report.paragraph_words)):
+            start, end = (int(x) for x in report.paragraph_spans[index])
+            words = int(report.paragraph_words[index])
+            if words > settings.dense_paragraph_words and in_segments(start):
+                issues.append(
+                    self._metric_issue(
+                        content,
+                        start,
+                        end,
+                        f"Dense paragraph: {words} words in "
+                        f"{int(report.paragraph_sentences[index])} sentences "
+                        f"(reading ease {report.paragraph_score[index]:.0f})",
+                        "Split the paragraph or add structure such as a list",
+                    )
+                )
+
+        for index in range(len(report.sentence_words)):
+            start, end = (int(x) for x in report.sentence_spans[index])
+            words = int(report.sentence_words[index])
+            if words > settings.long_sentence_words and in_segments(start):
+                issues.append(
+                    self._metric_issue(
+                        content,
+                        start,
+                        end,
+                        f"Long sentence: {words} words "
+                        f"(reading ease {report.sentence_score[index]:.0f})",
+                        "Break the sentence into shorter ones",
+                    )
+                )
+
+        complex_sentences = [
+            (int(start), int(end))
+            for start, end in report.sentence_spans[
+                report.complex_sentences(
+                    settings.readability_min_score,
+                    settings.jargon_density_threshold,
+                )
+            ]
+        ]
+        excerpts: List[List[TextChunk]] = [[] for _ in segments]
+        for start, end in complex_sentences:
+            for group, segment in zip(excerpts, segments):
+                if segment.start <= start < segment.end:
+                    group.append(TextChunk(start, end, content.text[start:end]))
+                    break
+        issues.extend(await self.review_excerpts(content, excerpts, use_cache))
+        return merge_chunk_issues(issues)
+
+    def _metric_issue(
+        self, content: Content, start: int, end: int, description: str, fix: str
+    ) -> ReviewIssue:
+        """Create an issue for a passage flagged by the readability metrics."""
+        issue = self.create_issue(
+            content=content,
+            issue_type=IssueType.COMPREHENSION,
+            severity=IssueSeverity.LOW,
+            description=description,
+            original_text=content.text[start:end],
+            suggested_fix=fix,
+            confidence=0.9,
+        )
+        issue.reviewed_by_agent = f"{self.name} (readability metrics)"
+        return self.place_issue(content, issue, start, end)
+
     def get_review_prompt(self, content: Content) -> str:
         """Generate the review prompt for comprehension analysis.
 
@@ -1,7 +1,79 @@
 """Content update agent using Google AI for detecting outdated information."""
 
+import re
+from dataclasses import replace
+from datetime import date
+from typing import Dict, List, Tuple
+
 from content_reviewer_agent.agents.base_ai import BaseAIAgent
-from content_reviewer_agent.models.content import Content
+from content_reviewer_agent.analysis.chunking import (
+    TextChunk,
+    merge_chunk_issues,
+    sentence_spans,
+)
+from content_reviewer_agent.analysis.code import (
+    IDENTIFIER,
+    CodeAnalysis,
+    analyse_code,
+    detect_language,
+)
+from content_reviewer_agent.analysis.deprecations import (
+    DEFAULT_CATALOGUE_PATH,
+    CatalogueLoader,
+    CatalogueMatch,
+    DeprecationCatalogue,
+)
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.content import (
+    Content,
+    ContentType,
+    IssueSeverity,
+    IssueType,
+    ReviewIssue,
+)
+
+#: Words and numbers suggesting a statement may go out of date
+_TIME_SENSITIVE = re.compile(
+    r"\b(?:(?:19|20)\d{2}|v?\d+\.\d+|latest|newest|current(?:ly)?|recent(?:ly)?"
+    r"|modern|today|nowadays|state[- ]of[- ]the[- ]art|deprecated|legacy"
+    r"|atual(?:mente)?|recente(?:mente)?|hoje|modern[oa]|últim[oa]|legado"
+    r"|obsolet[oa])\b",
+    re.IGNORECASE,
+)
+
+_loaders: Dict[str, CatalogueLoader] = {}
+
+
+def get_deprecation_catalogue() -> DeprecationCatalogue:
+    """Get the current catalogue, reloading it if its file changed."""
+    path = settings.deprecation_catalogue_path or str(DEFAULT_CATALOGUE_PATH)
+    loader = _loaders.get(path)
+    if loader is None:
+        loader = _loaders[path] = CatalogueLoader(path)
+    return loader.get()
+
+
+def _scan_segments(
+    catalogue: DeprecationCatalogue, segments: List[TextChunk]
+) -> List[CatalogueMatch]:
+    """Match the catalogue in the windows of a content.
+
+    Args:
+        catalogue: Deprecation catalogue
+        segments: Windows of the content, possibly overlapping
+
+    Returns:
+        Matches with document offsets, each once, in order of appearance
+    """
+    matches: Dict[Tuple[str, int], CatalogueMatch] = {}
+    for segment in segments:
+        for match in catalogue.scan(segment.text):
+            start = segment.to_absolute(match.start)
+            matches.setdefault(
+                (match.entry.id, start),
+                replace(match, start=start, end=segment.to_absolute(match.end)),
+            )
+    return sorted(matches.values(), key=lambda match: match.start)
 
 
 class ContentUpdateAgent(BaseAIAgent):
@@ -18,7 +90,9 @@ Focus on:
 6. Old URLs or broken links
 7. Information that contradicts current standards
 
-For each issue, provide the type as "outdated" or "deprecated", severity level, description of what is outdated/deprecated, original text, suggested fix with current alternative, and confidence score. Current year is 2025."""
+For each issue, provide the type as "outdated" or "deprecated", severity level, description of what is outdated/deprecated, original text, suggested fix with current alternative, and confidence score."""
+
+    PROMPT_VERSION = "2"
 
     def __init__(self):
         """Initialize the content update agent."""
@@ -28,6 +102,174 @@ For each issue, provide the type as "outdated" or "deprecated", severity level,
             system_prompt=self.SYSTEM_PROMPT,
         )
 
+    async def review_segments(
+        self, content: Content, segments: List[TextChunk], use_cache: bool = True
+    ) -> List[ReviewIssue]:
+        """Scan against the deprecation catalogue, then ask the model about the rest.
+
+        Catalogue hits in the windows are reported directly. Only sentences with
+        context-dependent hits or time-sensitive wording (years, versions,
+        "latest", "atualmente"...) outside a reported hit go to the model.
+        In code, the catalogue is matched against the comments, the
+        docstrings and the names used, resolved through the imports (see
+        ``_scan_code``), and only comments and docstrings go to the model.
+
+        Args:
+            content: Full content being reviewed
+            segments: Windows of ``content.text`` to review
+            use_cache: Look up and store the responses in the review cache
+
+        Returns:
+            Issues with offsets relative to the full content
+        """
+        if not settings.local_update_filter:
+            return await super().review_segments(content, segments, use_cache)
+
+        catalogue = get_deprecation_catalogue()
+        if content.content_type == ContentType.CODE and settings.local_code_analysis:
+            analysis = analyse_code(content.text, detect_language(content))
+            matches, scopes = self._scan_code(content, segments, analysis, catalogue)
+        else:
+            matches = _scan_segments(catalogue, segments)
+            scopes = sentence_spans(content.text)
+        decided = [m for m in matches if not m.entry.context_dependent]
+        issues = [self._catalogue_issue(content, m, catalogue) for m in decided]
+
+        suspects = [(m.start, m.end) for m in matches if m.entry.context_dependent] + [
+            found.span()
+            for found in _TIME_SENSITIVE.finditer(content.text)
+            if not any(m.start <= found.start() < m.end for m in decided)
+        ]
+        excerpts: List[List[TextChunk]] = [[] for _ in segments]
+        for start, end in scopes:
+            if not any(start <= s < end for s, _ in suspects):
+                continue
+            for group, segment in zip(excerpts, segments):
+                if segment.start <= start < segment.end:
+                    group.append(TextChunk(start, end, content.text[start:end]))
+                    break
+
+        notes = [
+            f"- {m.text}: {m.description}; consider {m.entry.replacement}. "
+            "Report it only if the text recommends it for current use."
+            for m in matches
+            if m.entry.context_dependent
+        ]
+        if notes:
+            content = content.model_copy(
+                update={
+                    "metadata": {
+                        **content.metadata,
+                        self.PROMPT_CONTEXT_KEY: "Catalogue notes:\n"
+                        + "\n".join(dict.fromkeys(notes)),
+                    }
+                }
+            )
+        issues.extend(await self.review_excerpts(content, excerpts, use_cache))
+        return merge_chunk_issues(issues)
+
+    @staticmethod
+    def _scan_code(
+        content: Content,
+        segments: List[TextChunk],
+        analysis: CodeAnalysis,
+        catalogue: DeprecationCatalogue,
+    ) -> Tuple[List[CatalogueMatch], List[Tuple[int, int]]]:
+        """Match the catalogue against a parsed source file.
+
+        Comments and docstrings are scanned as text. Each name used in the
+        code is scanned by its qualified name, so ``from asyncio import
+        coroutine`` matches "asyncio.coroutine", and calls are scanned with
+        "()" appended. A match on a name is placed on the name as written.
+        Sources whose imports cannot be resolved are scanned as text. Only
+        what starts in one of the windows is scanned.
+
+        Args:
+            content: Code content being reviewed
+            segments: Windows of ``content.text`` to review
+            analysis: Local parse of ``content.text``
+            catalogue: Deprecation catalogue
+
+        Returns:
+            Matches in order of appearance, and the spans the model may be
+            asked about: comments, docstrings and the lines of
+            context-dependent matches
+        """
+
+        def in_segments(start: int) -> bool:
+            return any(segment.start <= start < segment.end for segment in segments)
+
+        prose = [
+            span
+            for span in analysis.prose
+            if span.kind != IDENTIFIER and in_segments(span.start)
+        ]
+        if analysis.names is None:
+            matches = _scan_segments(catalogue, segments)
+        else:
+            matches = [
+                replace(
+                    match, start=match.start + span.start, end=match.end + span.start
+                )
+                for span in prose
+                for match in catalogue.scan(content.text[span.start : span.end])
+            ]
+            seen = set()
+            for name in analysis.names:
+                if not in_segments(name.start):
+                    continue
+                for match in catalogue.scan(name.qualified):
+                    if (match.entry.id, name.start) in seen:
+                        continue
+                    seen.add((match.entry.id, name.start))
+                    matches.append(
+                        replace(
+                            match,
+                            start=name.start,
+                            end=name.end,
+                            text=content.text[name.start : name.end],
+                        )
+                    )
+            matches.sort(key=lambda match: match.start)
+
+        scopes = [(span.start, span.end) for span in prose]
+        for match in matches:
+            if match.entry.context_dependent and not any(
+                start <= match.start < end for start, end in scopes
+            ):
+                start = content.text.rfind("\n", 0, match.start) + 1
+                end = content.text.find("\n", match.end)
+                scopes.append((start, len(content.text) if end < 0 else end))
+        return matches, sorted(scopes)
+
+    def _catalogue_issue(
+        self,
+        content: Content,
+        match: CatalogueMatch,
+        catalogue: DeprecationCatalogue,
+    ) -> ReviewIssue:
+        """Create an issue for a catalogue match."""
+        issue_type = (
+            IssueType.DEPRECATED
+            if match.entry.type == "deprecated"
+            else IssueType.OUTDATED
+        )
+        try:
+            severity = IssueSeverity(match.entry.severity)
+        except ValueError:
+            severity = IssueSeverity.MEDIUM
+        issue = self.create_issue(
+            content=content,
+            issue_type=issue_type,
+            severity=severity,
+            description=match.description,
+            original_text=match.text,
+            suggested_fix=match.entry.replacement,
+            confidence=0.95,
+        )
+        issue.reviewed_by_agent = f"{self.name} (catalogue {catalogue.version})"
+        return self.place_issue(content, issue, match.start, match.end)
+
     def get_review_prompt(self, content: Content) -> str:
         """Generate the review prompt for content update check.
 
@@ -37,7 +279,8 @@ For each issue, provide the type as "outdated" or "deprecated", severity level,
         Returns:
             Prompt string for the AI model
         """
-        return f"""Please analyze the following content for outdated or deprecated information:
+        year = date.today().year
+        return f"""Please analyze the following content for outdated or deprecated information. Current year is {year}.
 
 Title: {content.title}
 Content Type: {content.content_type.value}
@@ -45,4 +288,4 @@ Content Type: {content.content_type.value}
 Text:
 {content.text}
 
-Identify any references to outdated technologies, deprecated APIs, old versions, or information that should be updated for 2025."""
+Identify any references to outdated technologies, deprecated APIs, old versions, or information that should be updated for {year}."""
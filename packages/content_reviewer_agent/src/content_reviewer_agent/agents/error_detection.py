@@ -1,7 +1,35 @@
 """Error detection agent using Google AI for spelling, grammar, and syntax checking."""
 
+from typing import List, Optional
+
 from content_reviewer_agent.agents.base_ai import BaseAIAgent
-from content_reviewer_agent.models.content import Content
+from content_reviewer_agent.analysis.chunking import TextChunk, merge_chunk_issues
+from content_reviewer_agent.analysis.code import (
+    PYTHON,
+    analyse_code,
+    detect_language,
+)
+from content_reviewer_agent.analysis.spelling import LocalErrorChecker
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.content import (
+    Content,
+    ContentType,
+    IssueSeverity,
+    IssueType,
+    ReviewIssue,
+)
+
+_local_checker: Optional[LocalErrorChecker] = None
+
+
+def get_local_checker() -> LocalErrorChecker:
+    """Get the process-wide local checker, built on first use."""
+    global _local_checker
+    if _local_checker is None:
+        _local_checker = LocalErrorChecker.from_word_list(
+            settings.local_dictionary_path
+        )
+    return _local_checker
 
 
 class ErrorDetectionAgent(BaseAIAgent):
@@ -27,6 +55,109 @@ Be thorough but focus on genuine errors that affect readability and correctness.
             system_prompt=self.SYSTEM_PROMPT,
         )
 
+    async def review_segments(
+        self, content: Content, segments: List[TextChunk], use_cache: bool = True
+    ) -> List[ReviewIssue]:
+        """Check windows locally and send only undecided sentences to the model.
+
+        Known misspellings and grammar rule hits become issues directly. Each
+        window's undecided sentences are joined into one excerpt for the
+        model. Code is parsed instead (see ``_review_code``).
+
+        Args:
+            content: Full content being reviewed
+            segments: Windows of ``content.text`` to review
+            use_cache: Look up and store the responses in the review cache
+
+        Returns:
+            Issues with offsets relative to the full content
+        """
+        if content.content_type == ContentType.CODE and settings.local_code_analysis:
+            return await self._review_code(content, segments, use_cache)
+        if not settings.local_error_filter or content.content_type == ContentType.CODE:
+            return await super().review_segments(content, segments, use_cache)
+
+        checker = get_local_checker()
+        issues: List[ReviewIssue] = []
+        undecided: List[List[TextChunk]] = []
+        for segment in segments:
+            result = checker.check(segment.text)
+            for hit in result.hits:
+                spelling = hit.issue_type == "spelling"
+                issue = self.create_issue(
+                    content=content,
+                    issue_type=IssueType.SPELLING if spelling else IssueType.GRAMMAR,
+                    severity=IssueSeverity.LOW if spelling else IssueSeverity.MEDIUM,
+                    description=hit.description,
+                    original_text=hit.text,
+                    suggested_fix=hit.suggestion,
+                    confidence=hit.confidence,
+                )
+                issue.reviewed_by_agent = f"{self.name} (local rules)"
+                self.place_issue(
+                    content,
+                    issue,
+                    segment.to_absolute(hit.start),
+                    segment.to_absolute(hit.end),
+                )
+                issues.append(issue)
+            undecided.append(
+                [
+                    TextChunk(
+                        segment.to_absolute(start),
+                        segment.to_absolute(end),
+                        segment.text[start:end],
+                    )
+                    for start, end in result.undecided
+                ]
+            )
+
+        issues.extend(await self.review_excerpts(content, undecided, use_cache))
+        return merge_chunk_issues(issues)
+
+    async def _review_code(
+        self, content: Content, segments: List[TextChunk], use_cache: bool
+    ) -> List[ReviewIssue]:
+        """Report syntax errors from the parser and review only the prose.
+
+        Bracket problems found by the tokenizer in languages other than
+        Python are reported as possible errors, at low severity.
+
+        Args:
+            content: Full code content being reviewed
+            segments: Windows of ``content.text`` to review
+            use_cache: Look up and store the responses in the review cache
+
+        Returns:
+            Issues with offsets relative to the full content
+        """
+        analysis = analyse_code(content.text, detect_language(content))
+        issues: List[ReviewIssue] = []
+        for problem in analysis.syntax_errors:
+            if not any(s.start <= problem.start < s.end for s in segments):
+                continue
+            # Only Python is really parsed; elsewhere an unbalanced bracket
+            # from the tokenizer may be syntax it does not know
+            parsed = analysis.language == PYTHON
+            issue = self.create_issue(
+                content=content,
+                issue_type=IssueType.SYNTAX,
+                severity=IssueSeverity.HIGH if parsed else IssueSeverity.LOW,
+                description=(
+                    f"Syntax error: {problem.message}"
+                    if parsed
+                    else f"Possible syntax error: {problem.message}"
+                ),
+                original_text=content.text[problem.start : problem.end],
+                confidence=1.0 if parsed else 0.5,
+            )
+            issue.reviewed_by_agent = f"{self.name} (parser)"
+            issues.append(self.place_issue(content, issue, problem.start, problem.end))
+
+        excerpts = self.code_excerpts(content, segments)
+        issues.extend(await self.review_excerpts(content, excerpts, use_cache))
+        return merge_chunk_issues(issues)
+
     def get_review_prompt(self, content: Content) -> str:
         """Generate the review prompt for error detection.
 
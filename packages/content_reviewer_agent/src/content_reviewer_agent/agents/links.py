@@ -0,0 +1,329 @@
+"""Concurrent HTTP link checking with per-host limits and a status cache."""
+
+import asyncio
+import ipaddress
+import socket
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+import httpx
+
+from content_reviewer_agent.config import settings
+
+#: Statuses for which a HEAD answer is not trusted and a GET is tried instead
+HEAD_FALLBACK_STATUSES = {400, 403, 404, 405, 501}
+
+#: Statuses of servers refusing the checker rather than missing the page
+UNVERIFIABLE_STATUSES = {401, 403, 429}
+
+# Redirects followed, each one checked like the original URL
+MAX_REDIRECTS = 5
+
+
+class UnsafeURLError(Exception):
+    """Raised for a URL the checker must not request, such as a private address."""
+
+
+@dataclass(frozen=True)
+class LinkStatus:
+    """Result of checking one link."""
+
+    url: str
+    ok: bool
+    status_code: Optional[int] = None
+    final_url: Optional[str] = None
+    error: Optional[str] = None
+    unverified: bool = False
+
+    @property
+    def broken(self) -> bool:
+        """Whether the link was checked and found not to work."""
+        return not self.ok and not self.unverified
+
+    def describe(self) -> str:
+        """Describe the status in a few words."""
+        if self.error:
+            if self.unverified:
+                return f"not checked ({self.error})"
+            return f"unreachable ({self.error})"
+        description = f"HTTP {self.status_code}"
+        if self.unverified:
+            description += ", refused to the link checker"
+        if self.final_url and self.final_url != self.url:
+            description += f", redirects to {self.final_url}"
+        return description
+
+
+def _is_public(address: str) -> bool:
+    """Check whether an IP address is publicly routable."""
+    ip = ipaddress.ip_address(address.split("%")[0])
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+class LinkChecker:
+    """Checks links through a pooled async HTTP client.
+
+    A HEAD request is tried first and GET is used when the server rejects
+    HEAD. Requests to the same host are limited to ``per_host`` at a time,
+    and statuses are cached for ``ttl_seconds``. The client and the host
+    semaphores are bound to the event loop that uses them.
+
+    Links come from user content, so the checker only connects to public
+    addresses: each host, the original and every redirect's, is resolved
+    and the request is sent to the address that was checked. Hosts listed
+    in ``allowed_hosts`` are requested as they are.
+    """
+
+    def __init__(
+        self,
+        per_host: Optional[int] = None,
+        timeout: Optional[float] = None,
+        ttl_seconds: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_entries: int = 4096,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        allowed_hosts: Optional[Iterable[str]] = None,
+    ):
+        """Initialize the checker.
+
+        Args:
+            per_host: Concurrent requests per host.
+                Defaults to ``settings.link_check_per_host``.
+            timeout: Request timeout in seconds
+            ttl_seconds: Lifetime of cached statuses
+            max_connections: Connection pool size
+            max_entries: Maximum cached statuses
+            transport: Custom httpx transport, mainly for tests
+            allowed_hosts: Hosts requested even at private addresses.
+                Defaults to ``settings.link_check_allowed_hosts``.
+        """
+        self.per_host = per_host or settings.link_check_per_host
+        self.timeout = timeout or settings.link_check_timeout_seconds
+        self.ttl_seconds = (
+            settings.link_check_ttl_seconds if ttl_seconds is None else ttl_seconds
+        )
+        self.max_connections = max_connections or settings.link_check_max_connections
+        self.max_entries = max_entries
+        self.transport = transport
+        self.allowed_hosts = {
+            host.lower()
+            for host in (
+                settings.link_check_allowed_hosts
+                if allowed_hosts is None
+                else allowed_hosts
+            )
+        }
+        self._cache: "OrderedDict[str, Tuple[float, LinkStatus]]" = OrderedDict()
+        self._clients: "weakref.WeakKeyDictionary[Any, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._hosts: "weakref.WeakKeyDictionary[Any, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.requests_made = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = httpx.AsyncClient(
+                timeout=self.timeout,
+                # Redirects are followed by _fetch, which checks each hop
+                follow_redirects=False,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                headers={"User-Agent": f"{settings.api_title}/{settings.api_version}"},
+                transport=self.transport,
+            )
+        return client
+
+    def _get_host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Get the concurrency limit of a URL's host for the running loop."""
+        hosts = self._hosts.setdefault(asyncio.get_running_loop(), {})
+        host = urlsplit(url).netloc.lower()
+        semaphore = hosts.get(host)
+        if semaphore is None:
+            semaphore = hosts[host] = asyncio.Semaphore(self.per_host)
+        return semaphore
+
+    def _cached(self, url: str) -> Optional[LinkStatus]:
+        """Get a fresh cached status."""
+        entry = self._cache.get(url)
+        if entry is None:
+            return None
+        expires_at, status = entry
+        if expires_at < time.monotonic():
+            del self._cache[url]
+            return None
+        self._cache.move_to_end(url)
+        return status
+
+    def _store(self, status: LinkStatus) -> None:
+        """Cache a status, evicting the least recently used entries."""
+        self._cache[status.url] = (time.monotonic() + self.ttl_seconds, status)
+        self._cache.move_to_end(status.url)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    async def check(self, url: str) -> LinkStatus:
+        """Check a single link.
+
+        Args:
+            url: Absolute http(s) URL
+
+        Returns:
+            The link status
+        """
+        cached = self._cached(url)
+        if cached is not None:
+            return cached
+
+        client = self._get_client()
+        async with self._get_host_semaphore(url):
+            try:
+                response, final_url = await self._fetch(client, "HEAD", url)
+                if response.status_code in HEAD_FALLBACK_STATUSES:
+                    response, final_url = await self._fetch(client, "GET", url)
+                status = LinkStatus(
+                    url=url,
+                    ok=response.status_code < 400,
+                    status_code=response.status_code,
+                    final_url=final_url,
+                    unverified=response.status_code in UNVERIFIABLE_STATUSES,
+                )
+            except UnsafeURLError as exc:
+                status = LinkStatus(url=url, ok=False, error=str(exc), unverified=True)
+            except httpx.HTTPError as exc:
+                status = LinkStatus(url=url, ok=False, error=type(exc).__name__)
+        self._store(status)
+        return status
+
+    async def _pinned_request(
+        self, client: httpx.AsyncClient, method: str, url: str
+    ) -> httpx.Request:
+        """Build a request sent to a public address of the URL's host.
+
+        The host is resolved once and the request goes to the address that
+        was checked, with the original Host header and TLS server name, so
+        a second DNS answer cannot point it elsewhere.
+
+        Args:
+            client: Client sending the request
+            method: HTTP method
+            url: Absolute http(s) URL
+
+        Returns:
+            Request to send
+
+        Raises:
+            UnsafeURLError: If the URL is not http(s) or its host resolves to
+                a loopback, private, link-local or reserved address
+            httpx.ConnectError: If the host cannot be resolved
+        """
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        if parts.scheme not in ("http", "https") or not host:
+            raise UnsafeURLError("not an http(s) URL")
+        if host in self.allowed_hosts:
+            return client.build_request(method, url)
+        try:
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+        except ValueError:
+            raise UnsafeURLError("invalid port")
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                host, port, type=socket.SOCK_STREAM
+            )
+        except OSError as exc:
+            raise httpx.ConnectError(f"Cannot resolve {host}: {exc}")
+        addresses = [str(info[4][0]) for info in infos]
+        if not addresses or not all(_is_public(a) for a in addresses):
+            raise UnsafeURLError("private or reserved address")
+        address = addresses[0].split("%")[0]
+        netloc = f"[{address}]" if ":" in address else address
+        if parts.port:
+            netloc += f":{parts.port}"
+        host_header = host if not parts.port else f"{host}:{parts.port}"
+        return client.build_request(
+            method,
+            urlunsplit((parts.scheme, netloc, parts.path or "/", parts.query, "")),
+            headers={"Host": host_header},
+            extensions={"sni_hostname": host},
+        )
+
+    async def _fetch(
+        self, client: httpx.AsyncClient, method: str, url: str
+    ) -> Tuple[httpx.Response, str]:
+        """Request a URL, following redirects one checked hop at a time.
+
+        Responses are streamed and closed unread, so no body is downloaded.
+
+        Args:
+            client: Client sending the requests
+            method: HTTP method
+            url: Absolute http(s) URL
+
+        Returns:
+            Final response and the URL it came from
+
+        Raises:
+            UnsafeURLError: If a hop may not be requested
+            httpx.HTTPError: If a request fails or redirects loop
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            request = await self._pinned_request(client, method, url)
+            self.requests_made += 1
+            response = await client.send(request, stream=True)
+            await response.aclose()
+            if not response.is_redirect:
+                return response, url
+            url = urljoin(url, response.headers["location"])
+        raise httpx.TooManyRedirects("Too many redirects", request=request)
+
+    async def check_all(self, urls: Iterable[str]) -> Dict[str, LinkStatus]:
+        """Check links concurrently, each distinct URL once.
+
+        Args:
+            urls: URLs to check
+
+        Returns:
+            Status of each distinct URL
+        """
+        unique = list(dict.fromkeys(urls))
+        statuses = await asyncio.gather(*(self.check(url) for url in unique))
+        return dict(zip(unique, statuses))
+
+    def clear(self) -> None:
+        """Drop all cached statuses."""
+        self._cache.clear()
+
+    async def aclose(self) -> None:
+        """Close the client of the running event loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+_link_checker: Optional[LinkChecker] = None
+
+
+def get_link_checker() -> LinkChecker:
+    """Get the process-wide link checker."""
+    global _link_checker
+    if _link_checker is None:
+        _link_checker = LinkChecker()
+    return _link_checker
+
+
+def peek_link_checker() -> Optional[LinkChecker]:
+    """Get the process-wide link checker if it has been created."""
+    return _link_checker
@@ -0,0 +1,156 @@
+"""Process-wide request and token rate limiting per model."""
+
+import asyncio
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+from content_reviewer_agent.config import settings
+
+
+class TokenBucket:
+    """Bucket refilled continuously up to one minute's quota."""
+
+    def __init__(self, per_minute: int):
+        """Initialize a full bucket.
+
+        Args:
+            per_minute: Quota per minute, also the burst capacity
+        """
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.available = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self) -> None:
+        """Add the quota accrued since the last refill."""
+        now = time.monotonic()
+        self.available = min(
+            self.capacity, self.available + (now - self.updated) * self.rate
+        )
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` is available."""
+        self.refill()
+        missing = min(amount, self.capacity) - self.available
+        return max(0.0, missing / self.rate)
+
+    def take(self, amount: float) -> None:
+        """Consume quota; may go negative to account for under-estimates."""
+        self.refill()
+        self.available -= amount
+
+    def utilisation(self) -> float:
+        """Fraction of the bucket currently used."""
+        self.refill()
+        return max(0.0, min(1.0, 1 - self.available / self.capacity))
+
+
+class ModelRateLimiter:
+    """Shared RPM and TPM limiter for one model.
+
+    Callers queue in arrival order: the caller at the head of the queue
+    waits for both buckets to hold enough quota while the rest wait behind
+    it, so large requests are not starved by a stream of small ones.
+    """
+
+    def __init__(self, name: str, rpm: int, tpm: int):
+        """Initialize the limiter.
+
+        Args:
+            name: Model name
+            rpm: Requests per minute
+            tpm: Tokens per minute
+        """
+        self.name = name
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.waiting = 0
+        self.total_wait_seconds = 0.0
+        # Locks are bound to the loop they first wait on
+        self._locks: "weakref.WeakKeyDictionary[Any, asyncio.Lock]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Get the FIFO queue lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        return lock
+
+    async def acquire(self, tokens: int) -> float:
+        """Wait for quota for one request of ``tokens`` estimated tokens.
+
+        Args:
+            tokens: Estimated tokens of the request
+
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.monotonic()
+        self.waiting += 1
+        try:
+            async with self._get_lock():
+                while True:
+                    delay = max(
+                        self.requests.wait_time(1), self.tokens.wait_time(tokens)
+                    )
+                    if delay <= 0:
+                        break
+                    await asyncio.sleep(delay)
+                self.requests.take(1)
+                self.tokens.take(tokens)
+        finally:
+            self.waiting -= 1
+        waited = time.monotonic() - start
+        self.total_wait_seconds += waited
+        return waited
+
+    def record_usage(self, estimated: int, actual: Optional[int]) -> None:
+        """Correct the token bucket once the real usage is known.
+
+        Args:
+            estimated: Tokens reserved in acquire
+            actual: Tokens reported by the model, if any
+        """
+        if actual is not None:
+            self.tokens.take(actual - estimated)
+
+    def stats(self) -> dict:
+        """Get current utilisation of both quotas."""
+        return {
+            "rpm_limit": int(self.requests.capacity),
+            "tpm_limit": int(self.tokens.capacity),
+            "rpm_utilisation": round(self.requests.utilisation(), 3),
+            "tpm_utilisation": round(self.tokens.utilisation(), 3),
+            "waiting": self.waiting,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+        }
+
+
+_limiters: Dict[str, ModelRateLimiter] = {}
+
+
+def get_rate_limiter(model_name: str) -> ModelRateLimiter:
+    """Get the process-wide rate limiter of a model.
+
+    Args:
+        model_name: Model name
+
+    Returns:
+        The shared limiter
+    """
+    limiter = _limiters.get(model_name)
+    if limiter is None:
+        limiter = _limiters[model_name] = ModelRateLimiter(
+            model_name, settings.rate_limit_rpm, settings.rate_limit_tpm
+        )
+    return limiter
+
+
+def rate_limiter_stats() -> Dict[str, dict]:
+    """Get the utilisation of every model's limiter."""
+    return {name: limiter.stats() for name, limiter in _limiters.items()}
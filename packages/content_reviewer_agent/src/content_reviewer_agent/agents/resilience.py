@@ -0,0 +1,285 @@
+"""Retry with backoff and circuit breaking for model calls."""
+
+import asyncio
+import random
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+import httpx
+
+from content_reviewer_agent.config import settings
+
+T = TypeVar("T")
+
+#: HTTP status codes worth retrying: timeouts, quota and transient server errors
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+_DURATION = re.compile(r"^\s*([\d.]+)s\s*$")
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the upstream is unhealthy."""
+
+    def __init__(self, name: str, retry_in: float):
+        """Initialize the error.
+
+        Args:
+            name: Name of the circuit
+            retry_in: Seconds until the circuit lets a probe call through
+        """
+        self.name = name
+        self.retry_in = retry_in
+        super().__init__(f"Circuit for {name} is open; retry in {retry_in:.1f}s")
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Check whether a failed model call is worth retrying.
+
+    Args:
+        exc: Exception raised by the call
+
+    Returns:
+        True for quota, timeout, transient server and transport errors
+    """
+    if isinstance(exc, (httpx.TransportError, ConnectionError, TimeoutError)):
+        return True
+    code = getattr(exc, "code", None)
+    return isinstance(code, int) and code in RETRYABLE_STATUS_CODES
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Read the server's requested wait from a failed call.
+
+    Looks at the ``Retry-After`` header, then at a ``google.rpc.RetryInfo``
+    entry in the error body.
+
+    Args:
+        exc: Exception raised by the call
+
+    Returns:
+        Seconds to wait, or None if the server gave no hint
+    """
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    value = headers.get("retry-after") if headers is not None else None
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    details = getattr(exc, "details", None)
+    if isinstance(details, dict):
+        for detail in details.get("error", {}).get("details", []) or []:
+            match = _DURATION.match(str(detail.get("retryDelay", "")))
+            if match:
+                return float(match.group(1))
+    return None
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter."""
+
+    def __init__(
+        self,
+        max_retries: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+    ):
+        """Initialize the policy.
+
+        Args:
+            max_retries: Retries after the first attempt.
+                Defaults to ``settings.max_retries``.
+            base_delay: Delay ceiling of the first retry in seconds
+            max_delay: Upper bound of any single delay in seconds
+        """
+        self.max_retries = settings.max_retries if max_retries is None else max_retries
+        self.base_delay = (
+            settings.retry_base_delay_seconds if base_delay is None else base_delay
+        )
+        self.max_delay = (
+            settings.retry_max_delay_seconds if max_delay is None else max_delay
+        )
+
+    def delay(self, attempt: int, exc: BaseException) -> float:
+        """Compute the wait before a retry.
+
+        A server-provided Retry-After wins over the computed backoff, capped
+        at ``max_delay``.
+
+        Args:
+            attempt: Zero-based index of the retry
+            exc: Exception that caused the retry
+
+        Returns:
+            Seconds to wait
+        """
+        hinted = retry_after_seconds(exc)
+        if hinted is not None:
+            return min(hinted, self.max_delay)
+        ceiling = min(self.max_delay, self.base_delay * (2**attempt))
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """Fails fast after repeated upstream failures.
+
+    After ``failure_threshold`` consecutive calls fail with retryable errors,
+    retries included, the circuit opens and rejects calls for
+    ``reset_timeout`` seconds. It then lets a single probe through: success
+    closes the circuit, failure re-opens it, and a probe abandoned without
+    an outcome lets the next call probe instead.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+    ):
+        """Initialize the breaker.
+
+        Args:
+            name: Name of the protected upstream, e.g. the model name
+            failure_threshold: Consecutive failures that open the circuit.
+                Defaults to ``settings.circuit_failure_threshold``.
+            reset_timeout: Seconds the circuit stays open.
+                Defaults to ``settings.circuit_reset_seconds``.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold or settings.circuit_failure_threshold
+        self.reset_timeout = (
+            settings.circuit_reset_seconds if reset_timeout is None else reset_timeout
+        )
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+    def before_call(self) -> bool:
+        """Admit or reject a call.
+
+        Returns:
+            True if the call is the half-open probe; the caller must then
+            record its outcome or ``release_probe``
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if self.state == self.CLOSED:
+            return False
+        elapsed = time.monotonic() - self.opened_at
+        if self.state == self.OPEN and elapsed >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        raise CircuitOpenError(self.name, max(0.0, self.reset_timeout - elapsed))
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit when over the threshold."""
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def release_probe(self) -> None:
+        """Let another call probe, when the probe ended without an outcome."""
+        self._probe_in_flight = False
+
+    def stats(self) -> dict:
+        """Get the breaker state."""
+        return {"state": self.state, "consecutive_failures": self.failures}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Get the process-wide circuit breaker of an upstream.
+
+    Args:
+        name: Upstream name, usually the model name
+
+    Returns:
+        The shared breaker
+    """
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = _breakers[name] = CircuitBreaker(name)
+    return breaker
+
+
+def circuit_breaker_stats() -> Dict[str, dict]:
+    """Get the state of every circuit breaker."""
+    return {name: breaker.stats() for name, breaker in _breakers.items()}
+
+
+async def call_with_retry(
+    func: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    breaker: Optional[CircuitBreaker] = None,
+    sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+) -> T:
+    """Call ``func``, retrying retryable failures under a circuit breaker.
+
+    The breaker counts one failure per call, once its retries are used up.
+
+    Args:
+        func: Zero-argument coroutine function making the call
+        policy: Retry policy
+        breaker: Circuit breaker of the upstream, if any
+        sleep: Coroutine used to wait between attempts
+
+    Returns:
+        Result of the first successful call
+
+    Raises:
+        CircuitOpenError: If the circuit is open
+        Exception: The last error once retries are exhausted, or any
+            non-retryable error immediately
+    """
+    attempt = 0
+    probe = False
+    try:
+        while True:
+            if breaker is not None and not probe:
+                probe = breaker.before_call()
+            try:
+                result = await func()
+            except Exception as exc:
+                # Not the upstream's fault, so the breaker records nothing
+                if not is_retryable(exc):
+                    raise
+                # A probe is not retried: one failure re-opens the circuit
+                if attempt >= policy.max_retries or probe:
+                    if breaker is not None:
+                        breaker.record_failure()
+                    raise
+                await sleep(policy.delay(attempt, exc))
+                attempt += 1
+                continue
+            if breaker is not None:
+                breaker.record_success()
+            return result
+    finally:
+        # Cancelled or timed out: free the probe slot without an outcome
+        if probe and breaker is not None:
+            breaker.release_probe()
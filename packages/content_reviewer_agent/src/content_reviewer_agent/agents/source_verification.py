@@ -1,12 +1,31 @@
 """Source verification agent using Google AI."""
 
+from typing import Dict, List, Tuple
+
 from content_reviewer_agent.agents.base_ai import BaseAIAgent
-from content_reviewer_agent.models.content import Content
+from content_reviewer_agent.agents.links import LinkStatus, get_link_checker
+from content_reviewer_agent.analysis.chunking import TextChunk, merge_chunk_issues
+from content_reviewer_agent.analysis.code import COMMENT, DOCSTRING
+from content_reviewer_agent.analysis.references import (
+    Reference,
+    extract_references,
+)
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.content import (
+    Content,
+    ContentType,
+    IssueSeverity,
+    IssueType,
+    ReviewIssue,
+)
 
 
 class SourceVerificationAgent(BaseAIAgent):
     """Agent that verifies sources and references using AI."""
 
+    #: Code listings hold no claims or citations to verify
+    ELIDE_CODE_BLOCKS = True
+
     SYSTEM_PROMPT = """You are an expert fact-checker and academic research assistant. Your task is to analyze educational content for source verification issues.
 
 Focus on:
@@ -27,6 +46,100 @@ For each issue, provide the type as "source", severity level, description, origi
             system_prompt=self.SYSTEM_PROMPT,
         )
 
+    async def review_segments(
+        self, content: Content, segments: List[TextChunk], use_cache: bool = True
+    ) -> List[ReviewIssue]:
+        """Verify links and DOIs, then review with the verified facts.
+
+        Only references starting in one of the windows are checked, so an
+        incremental re-review leaves unchanged regions alone. Broken links
+        are reported directly. The status of every checked link
+        and the citations found are added to the prompt so the model does
+        not have to guess about them. Of code, only the comments and
+        docstrings are sent, since that is where references are cited.
+
+        Args:
+            content: Full content being reviewed
+            segments: Windows of ``content.text`` to review
+            use_cache: Look up and store the responses in the review cache
+
+        Returns:
+            Issues with offsets relative to the full content
+        """
+        references = [
+            ref
+            for ref in extract_references(content.text)
+            if any(segment.start <= ref.start < segment.end for segment in segments)
+        ]
+        if not settings.link_check_enabled or not references:
+            return await self._review_text(content, segments, use_cache)
+
+        links: List[Tuple[Reference, str]] = [
+            (ref, ref.target) for ref in references if ref.target is not None
+        ][: settings.link_check_max_links]
+        statuses = await get_link_checker().check_all(url for _, url in links)
+
+        issues = [
+            self._broken_link_issue(content, ref, url, statuses[url])
+            for ref, url in links
+            if statuses[url].broken
+        ]
+        context = self._verified_facts(references, links, statuses)
+        reviewed = content.model_copy(
+            update={"metadata": {**content.metadata, self.PROMPT_CONTEXT_KEY: context}}
+        )
+        issues.extend(await self._review_text(reviewed, segments, use_cache))
+        return merge_chunk_issues(issues)
+
+    async def _review_text(
+        self, content: Content, segments: List[TextChunk], use_cache: bool
+    ) -> List[ReviewIssue]:
+        """Send the windows to the model, or only the prose of code."""
+        if content.content_type == ContentType.CODE and settings.local_code_analysis:
+            excerpts = self.code_excerpts(content, segments, (COMMENT, DOCSTRING))
+            return await self.review_excerpts(content, excerpts, use_cache)
+        return await super().review_segments(content, segments, use_cache)
+
+    def _broken_link_issue(
+        self, content: Content, reference: Reference, url: str, status: LinkStatus
+    ) -> ReviewIssue:
+        """Create an issue for a link that failed verification."""
+        kind = "DOI" if reference.kind == "doi" else "Link"
+        issue = self.create_issue(
+            content=content,
+            issue_type=IssueType.SOURCE,
+            severity=IssueSeverity.HIGH,
+            description=f"Broken reference: {kind} is {status.describe()}",
+            original_text=reference.text,
+            suggested_fix="Replace or remove the broken reference",
+            sources=[url],
+            confidence=0.95,
+        )
+        issue.reviewed_by_agent = f"{self.name} (link check)"
+        return self.place_issue(content, issue, reference.start, reference.end)
+
+    @staticmethod
+    def _verified_facts(
+        references: List[Reference],
+        links: List[Tuple[Reference, str]],
+        statuses: Dict[str, LinkStatus],
+    ) -> str:
+        """Summarise the verified references for the prompt."""
+        lines = ["Verified references (already checked; do not report broken links):"]
+        for ref, url in links:
+            status = statuses[url]
+            verdict = (
+                "reachable"
+                if status.ok
+                else "unverified" if status.unverified else "BROKEN"
+            )
+            lines.append(f"- {ref.text}: {verdict}, {status.describe()}")
+        citations = [ref for ref in references if ref.kind == "citation"]
+        if citations:
+            lines.append("Citations found in the text:")
+            lines.extend(f"- {ref.text}" for ref in citations)
+        return "\n".join(lines)
+
     def get_review_prompt(self, content: Content) -> str:
         """Generate the review prompt for source verification.
 
@@ -0,0 +1,109 @@
+"""Per-review statistics reported by agents while they run."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, Optional
+
+from content_reviewer_agent.agents.cascade import CascadeRouting
+from content_reviewer_agent.analysis.compaction import CompactedText
+
+
+@dataclass
+class PromptStats:
+    """Prompt sizes of one agent during one review, in estimated tokens."""
+
+    prompts: int = 0
+    tokens_before: int = 0
+    tokens_after: int = 0
+    elided_blocks: int = 0
+    boilerplate_lines: int = 0
+    truncated: int = 0
+    # Tokens of source code kept out of the prompts by local code analysis
+    code_tokens_skipped: int = 0
+
+    def record(
+        self, tokens_before: int, tokens_after: int, compacted: CompactedText
+    ) -> None:
+        """Record one prompt.
+
+        Args:
+            tokens_before: Prompt tokens before compaction
+            tokens_after: Prompt tokens sent
+            compacted: Compaction of the prompt's text
+        """
+        self.prompts += 1
+        self.tokens_before += tokens_before
+        self.tokens_after += tokens_after
+        self.elided_blocks += compacted.elided_blocks
+        self.boilerplate_lines += compacted.boilerplate_lines
+        self.truncated += compacted.truncated
+
+    def merge(self, other: "PromptStats") -> None:
+        """Add another agent's prompts to these."""
+        for name, value in asdict(other).items():
+            setattr(self, name, getattr(self, name) + value)
+
+
+class ReviewTelemetry:
+    """Statistics of every agent taking part in one review."""
+
+    def __init__(self, cascade: Optional[CascadeRouting] = None):
+        """Start with no statistics.
+
+        Args:
+            cascade: Records model cascade decisions, when the cascade is on
+        """
+        self.cascade = cascade
+        self.prompts: Dict[str, PromptStats] = {}
+
+    def prompts_for(self, name: str) -> PromptStats:
+        """Get the prompt statistics of an agent, creating them on first use."""
+        stats = self.prompts.get(name)
+        if stats is None:
+            stats = self.prompts[name] = PromptStats()
+        return stats
+
+    def prompt_summary(self) -> dict:
+        """Summarise prompt sizes for ``ReviewResult.metadata``.
+
+        Returns:
+            Totals, with ``truncated`` true if any prompt was cut to the
+            budget, and per-agent statistics
+        """
+        total = PromptStats()
+        for stats in self.prompts.values():
+            total.merge(stats)
+        return {
+            **asdict(total),
+            "truncated": total.truncated > 0,
+            "truncated_prompts": total.truncated,
+            "agents": {name: asdict(stats) for name, stats in self.prompts.items()},
+        }
+
+
+_telemetry: ContextVar[Optional[ReviewTelemetry]] = ContextVar(
+    "review_telemetry", default=None
+)
+
+
+def current_telemetry() -> Optional[ReviewTelemetry]:
+    """Get the telemetry of the review running in the current task, if any."""
+    return _telemetry.get()
+
+
+@contextmanager
+def track_telemetry(telemetry: Optional[ReviewTelemetry]) -> Iterator[None]:
+    """Record statistics of tasks started in this block into a telemetry.
+
+    Tasks copy the current context when created, so agent calls started
+    inside the block report to ``telemetry`` even once it has been left.
+
+    Args:
+        telemetry: Telemetry of the review, or None to record nothing
+    """
+    token = _telemetry.set(telemetry)
+    try:
+        yield
+    finally:
+        _telemetry.reset(token)
@@ -0,0 +1,135 @@
+"""Non-blocking transport for Google AI model calls."""
+
+import asyncio
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Optional
+
+from content_reviewer_agent.agents.rate_limit import get_rate_limiter
+from content_reviewer_agent.agents.resilience import (
+    RetryPolicy,
+    call_with_retry,
+    get_circuit_breaker,
+)
+from content_reviewer_agent.analysis.chunking import estimate_tokens
+from content_reviewer_agent.config import settings
+
+
+class ModelTransport:
+    """Runs synchronous ``genai`` calls off the event loop.
+
+    Calls are dispatched to a bounded thread pool. An asyncio semaphore in
+    front of the pool applies back-pressure, so callers wait on the event loop
+    instead of piling work into an unbounded executor queue.
+
+    Every attempt first waits for the model's shared RPM/TPM quota. Failed
+    calls are retried with backoff under a per-model circuit breaker. The
+    semaphore is released while waiting to retry.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            max_concurrency: Maximum number of in-flight model calls.
+                Defaults to ``settings.max_concurrent_model_calls``.
+            retry_policy: Retry policy for failed calls
+        """
+        self.max_concurrency = max_concurrency or settings.max_concurrent_model_calls
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Semaphores are bound to the loop they first wait on
+        self._semaphores: "weakref.WeakKeyDictionary[Any, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.in_flight = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool used for model calls, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="genai"
+            )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the back-pressure semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def generate_content(self, client: Any, **kwargs: Any) -> Any:
+        """Call ``client.models.generate_content`` without blocking the loop.
+
+        Args:
+            client: ``genai.Client`` instance
+            **kwargs: Arguments forwarded to ``generate_content``
+
+        Returns:
+            The model response
+
+        Raises:
+            CircuitOpenError: If the model's circuit is open
+        """
+        breaker = None
+        if settings.circuit_breaker_enabled:
+            breaker = get_circuit_breaker(kwargs.get("model", ""))
+        return await call_with_retry(
+            partial(self._call, client, kwargs), self.retry_policy, breaker
+        )
+
+    async def _call(self, client: Any, kwargs: dict) -> Any:
+        """Make a single model call in the thread pool."""
+        limiter = None
+        if settings.rate_limit_enabled:
+            limiter = get_rate_limiter(kwargs.get("model", ""))
+            estimated = estimate_tokens(str(kwargs.get("contents", "")))
+            await limiter.acquire(estimated)
+
+        async with self._get_semaphore():
+            self.in_flight += 1
+            try:
+                loop = asyncio.get_running_loop()
+                response = await loop.run_in_executor(
+                    self.executor, partial(client.models.generate_content, **kwargs)
+                )
+            finally:
+                self.in_flight -= 1
+
+        if limiter is not None:
+            usage = getattr(response, "usage_metadata", None)
+            actual = getattr(usage, "total_token_count", None)
+            if isinstance(actual, int):
+                limiter.record_usage(estimated, actual)
+        return response
+
+    def shutdown(self) -> None:
+        """Release the thread pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_transport: Optional[ModelTransport] = None
+
+
+def get_transport() -> ModelTransport:
+    """Get the process-wide model transport shared by all agents."""
+    global _transport
+    if _transport is None:
+        _transport = ModelTransport()
+    return _transport
+
+
+def peek_transport() -> Optional[ModelTransport]:
+    """Get the process-wide model transport if it has been created."""
+    return _transport
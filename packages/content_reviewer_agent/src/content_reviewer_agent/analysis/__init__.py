@@ -0,0 +1,41 @@
+"""Local text analysis used by the review agents.
+
+Exports are imported on first access, so that importing a light module such
+as ``analysis.chunking`` does not load numpy for ``analysis.readability``.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from content_reviewer_agent.analysis.chunking import (
+        TextChunk,
+        chunk_text,
+        estimate_tokens,
+    )
+    from content_reviewer_agent.analysis.readability import (
+        ReadabilityReport,
+        analyse_readability,
+    )
+    from content_reviewer_agent.analysis.spelling import LocalErrorChecker
+
+_EXPORTS = {
+    "LocalErrorChecker": "spelling",
+    "ReadabilityReport": "readability",
+    "TextChunk": "chunking",
+    "analyse_readability": "readability",
+    "chunk_text": "chunking",
+    "estimate_tokens": "chunking",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_EXPORTS[name]}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,82 @@
+"""Aho-Corasick automaton for matching many literal patterns at once."""
+
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+
+class AhoCorasick:
+    """Finds every occurrence of a set of patterns in one pass over a text.
+
+    Matching is case-insensitive and runs in time linear in the length of
+    the text plus the number of matches, however many patterns there are.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]]):
+        """Build the automaton.
+
+        Args:
+            patterns: ``(pattern, value)`` pairs; the value is returned with
+                each match of the pattern
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, Any]]] = [[]]
+        for pattern, value in patterns:
+            self._add(pattern.lower(), value)
+        self._link()
+
+    def _add(self, pattern: str, value: Any) -> None:
+        """Insert a pattern into the trie."""
+        if not pattern:
+            return
+        node = 0
+        for char in pattern:
+            child = self._goto[node].get(char)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][char] = child
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = child
+        self._output[node].append((len(pattern), value))
+
+    def _link(self) -> None:
+        """Compute failure links breadth-first and merge their outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = (
+                    self._output[child] + self._output[self._fail[child]]
+                )
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """Find all pattern occurrences, overlapping ones included.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            ``(start, end, value)`` for each occurrence, ordered by end
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for index, char in enumerate(text):
+            # Lower per character so offsets match the original text
+            char = char.lower()
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length, value in output[node]:
+                yield index + 1 - length, index + 1, value
+
+    def __len__(self) -> int:
+        """Number of states in the automaton."""
+        return len(self._goto)
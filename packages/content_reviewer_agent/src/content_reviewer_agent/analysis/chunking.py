@@ -0,0 +1,160 @@
+"""Paragraph-aligned chunking of long documents."""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from content_reviewer_agent.models.content import ReviewIssue
+
+#: Rough characters-per-token ratio for Gemini tokenizers on prose
+CHARS_PER_TOKEN = 4
+
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+@dataclass(frozen=True)
+class TextChunk:
+    """A window of a document with its absolute position."""
+
+    start: int
+    end: int
+    text: str
+
+    def to_absolute(self, offset: int) -> int:
+        """Convert an offset inside the chunk to a document offset."""
+        return self.start + offset
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of model tokens in a text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _split_spans(
+    text: str, start: int, end: int, pattern: re.Pattern
+) -> List[Tuple[int, int]]:
+    """Split ``text[start:end]`` on a separator pattern, dropping blank spans."""
+    spans = []
+    cursor = start
+    for match in pattern.finditer(text, start, end):
+        if text[cursor : match.start()].strip():
+            spans.append((cursor, match.start()))
+        cursor = match.end()
+    if text[cursor:end].strip():
+        spans.append((cursor, end))
+    return spans
+
+
+def sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """Split text into sentence spans that never cross a paragraph break.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        ``(start, end)`` offsets of each sentence
+    """
+    return [
+        span
+        for start, end in _split_spans(text, 0, len(text), _PARAGRAPH_BREAK)
+        for span in _split_spans(text, start, end, _SENTENCE_END)
+    ]
+
+
+def _units(text: str, max_chars: int) -> List[Tuple[int, int]]:
+    """Split text into paragraph spans no longer than ``max_chars``.
+
+    Oversized paragraphs fall back to sentence boundaries, and oversized
+    sentences to hard cuts.
+    """
+    units = []
+    for start, end in _split_spans(text, 0, len(text), _PARAGRAPH_BREAK):
+        if end - start <= max_chars:
+            units.append((start, end))
+            continue
+        for s_start, s_end in _split_spans(text, start, end, _SENTENCE_END):
+            while s_end - s_start > max_chars:
+                units.append((s_start, s_start + max_chars))
+                s_start += max_chars
+            units.append((s_start, s_end))
+    return units
+
+
+def chunk_text(text: str, max_tokens: int, overlap_tokens: int = 0) -> List[TextChunk]:
+    """Split text into overlapping, paragraph-aligned windows.
+
+    Each window holds as many whole paragraphs as fit in ``max_tokens`` and
+    repeats trailing paragraphs of the previous window, up to
+    ``overlap_tokens``, so issues spanning a boundary are seen in full.
+
+    Args:
+        text: Document text
+        max_tokens: Token budget of a window
+        overlap_tokens: Token budget of the overlap between windows
+
+    Returns:
+        Windows in document order; a single window if the text fits
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return [TextChunk(0, len(text), text)]
+
+    overlap_chars = overlap_tokens * CHARS_PER_TOKEN
+    units = _units(text, max_chars)
+    chunks = []
+    i = 0
+    while i < len(units):
+        j = i + 1
+        while j < len(units) and units[j][1] - units[i][0] <= max_chars:
+            j += 1
+        start, end = units[i][0], units[j - 1][1]
+        chunks.append(TextChunk(start, end, text[start:end]))
+        if j >= len(units):
+            break
+        # Step back over trailing units that fit the overlap, always advancing
+        k = j
+        while k - 1 > i and units[j - 1][1] - units[k - 1][0] <= overlap_chars:
+            k -= 1
+        i = k
+    return chunks
+
+
+def merge_chunk_issues(issues: List[ReviewIssue]) -> List[ReviewIssue]:
+    """Drop duplicates reported by neighbouring windows in their overlap.
+
+    Issues are the same when they share a type and either the same located
+    span or, when unlocated, the same quoted text. The most confident copy is
+    kept, in its original position in the list.
+
+    Args:
+        issues: Issues from all windows, in window order
+
+    Returns:
+        Deduplicated issues
+    """
+    best: Dict[tuple, int] = {}
+    kept: List[ReviewIssue] = []
+    for issue in issues:
+        key: tuple
+        if issue.start_offset is not None:
+            key = (issue.issue_type, issue.start_offset, issue.end_offset)
+        elif issue.original_text:
+            key = (issue.issue_type, " ".join(issue.original_text.split()).lower())
+        else:
+            kept.append(issue)
+            continue
+        index = best.get(key)
+        if index is None:
+            best[key] = len(kept)
+            kept.append(issue)
+        elif issue.confidence > kept[index].confidence:
+            kept[index] = issue
+    return kept
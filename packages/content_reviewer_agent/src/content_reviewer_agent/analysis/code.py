@@ -0,0 +1,560 @@
+"""Local parsing of source code for the review agents.
+
+Python is parsed with ``ast`` and ``tokenize``: syntax errors are reported
+with their position, and the comments, docstrings and names the author
+chose are picked out as the only prose worth a model's attention. Names
+used in the code are resolved through the imports, so ``np.float(`` is seen
+as ``numpy.float()`` and can be matched against the deprecation catalogue.
+
+Other languages go through a small tokenizer that knows their comment and
+string syntax; it finds comments, declared names and unbalanced brackets.
+"""
+
+import ast
+import io
+import os
+import re
+import tokenize
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
+
+from content_reviewer_agent.models.content import Content
+
+PYTHON = "python"
+
+COMMENT = "comment"
+DOCSTRING = "docstring"
+IDENTIFIER = "identifier"
+
+#: Languages by file extension
+LANGUAGES: Dict[str, str] = {
+    ".py": PYTHON,
+    ".pyw": PYTHON,
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".java": "java",
+    ".kt": "kotlin",
+    ".c": "c",
+    ".h": "c",
+    ".cpp": "cpp",
+    ".cs": "csharp",
+    ".go": "go",
+    ".rs": "rust",
+    ".swift": "swift",
+    ".php": "php",
+    ".rb": "ruby",
+    ".sh": "shell",
+    ".r": "r",
+    ".sql": "sql",
+}
+
+
+@dataclass(frozen=True)
+class _Syntax:
+    """Comment and string syntax of a family of languages."""
+
+    line_comments: Tuple[str, ...]
+    block_comment: Optional[Tuple[str, str]]
+    quotes: Tuple[str, ...]
+    check_brackets: bool
+    #: ``/.../`` after an operator or keyword is a regular expression
+    regex_literals: bool = False
+
+
+_C_LIKE = _Syntax(("//",), ("/*", "*/"), ('"', "'", "`"), True)
+_JS = _Syntax(("//",), ("/*", "*/"), ('"', "'", "`"), True, True)
+_HASH = _Syntax(("#",), None, ('"', "'"), False)
+_SYNTAX: Dict[str, _Syntax] = {
+    PYTHON: _Syntax(("#",), None, ('"""', "'''", '"', "'"), False),
+    "javascript": _JS,
+    "typescript": _JS,
+    "php": _Syntax(("//", "#"), ("/*", "*/"), ('"', "'"), True),
+    "ruby": _HASH,
+    "shell": _HASH,
+    "r": _HASH,
+    "sql": _Syntax(("--",), ("/*", "*/"), ("'", '"'), True),
+}
+
+_BRACKETS = {")": "(", "]": "[", "}": "{"}
+
+# Names declared by a keyword in the C-like and scripting languages
+_DECLARATION = re.compile(
+    r"\b(?:function|class|interface|struct|enum|trait|type|def|fn|func|let|const"
+    r"|var|val)\s+([A-Za-z_]\w*)"
+)
+# Comments that are directives to tools rather than prose
+_DIRECTIVE = re.compile(
+    r"^(?:#|//)\s*(?:!|-\*-|noqa|type:|pragma|fmt:|pylint:|isort:|mypy:"
+    r"|eslint|prettier|@ts-|nolint)"
+)
+# A "/" after one of these, or at the start, opens a regular expression
+_REGEX_PRECEDERS = frozenset("(,=:[!&|?{};+-*%<>~^")
+_REGEX_KEYWORDS = frozenset(
+    {"return", "typeof", "case", "do", "else", "in", "of", "void", "yield"}
+    | {"await", "delete", "throw", "new", "instanceof"}
+)
+# Names too generic to say anything about the author's wording
+_IGNORED_NAMES = frozenset({"self", "cls", "args", "kwargs", "main"})
+_MIN_NAME_LENGTH = 3
+
+
+@dataclass(frozen=True)
+class ProseSpan:
+    """A comment, docstring or declared name in a source file."""
+
+    start: int
+    end: int
+    kind: str
+
+
+@dataclass(frozen=True)
+class ResolvedName:
+    """A module or name used in the code, qualified through the imports."""
+
+    name: str
+    start: int
+    end: int
+    call: bool = False
+
+    @property
+    def qualified(self) -> str:
+        """Qualified name, followed by "()" when it is called."""
+        return f"{self.name}()" if self.call else self.name
+
+
+@dataclass(frozen=True)
+class SyntaxProblem:
+    """A syntax error found by the parser."""
+
+    start: int
+    end: int
+    line: int
+    message: str
+
+
+@dataclass(frozen=True)
+class CodeAnalysis:
+    """What the local parsers found in a source file.
+
+    ``names`` is None when the language's imports cannot be resolved.
+    """
+
+    language: Optional[str]
+    prose: Tuple[ProseSpan, ...]
+    names: Optional[Tuple[ResolvedName, ...]]
+    syntax_errors: Tuple[SyntaxProblem, ...]
+
+
+def detect_language(content: Content) -> Optional[str]:
+    """Guess the language of a code content.
+
+    Uses ``metadata["language"]`` when set, otherwise the extension of
+    ``metadata["path"]`` or of the title.
+
+    Args:
+        content: Code content
+
+    Returns:
+        Language name, or None if unknown
+    """
+    language = content.metadata.get("language")
+    if language:
+        return str(language).lower()
+    for name in (content.metadata.get("path"), content.title):
+        if name:
+            language = LANGUAGES.get(os.path.splitext(str(name))[1].lower())
+            if language:
+                return language
+    return None
+
+
+class _Lines:
+    """Converts line and column positions to offsets in a text."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.starts = [0]
+        self.starts.extend(m.end() for m in re.finditer(r"\n", text))
+
+    def offset(self, line: int, column: int) -> int:
+        """Offset of a 1-based line and a character column."""
+        if line > len(self.starts):
+            return len(self.text)
+        return min(self.starts[line - 1] + column, len(self.text))
+
+    def byte_offset(self, line: int, column: int) -> int:
+        """Offset of a 1-based line and a UTF-8 byte column, as ``ast`` gives."""
+        start = self.starts[line - 1]
+        head = self.text[start : start + column].encode("utf-8")[:column]
+        return start + len(head.decode("utf-8", errors="ignore"))
+
+    def line_of(self, offset: int) -> int:
+        """1-based line of an offset."""
+        return bisect_right(self.starts, offset)
+
+    def line_end(self, offset: int) -> int:
+        """Offset of the end of the line holding an offset."""
+        end = self.text.find("\n", offset)
+        return len(self.text) if end < 0 else end
+
+
+def _python_comments(text: str, lines: _Lines) -> List[ProseSpan]:
+    """Comments of a Python source, up to the first tokenizer error."""
+    spans = []
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(text).readline):
+            if token.type == tokenize.COMMENT and not _DIRECTIVE.match(token.string):
+                start = lines.offset(*token.start)
+                spans.append(ProseSpan(start, start + len(token.string), COMMENT))
+    except (tokenize.TokenError, SyntaxError):
+        pass
+    return spans
+
+
+class _PythonVisitor(ast.NodeVisitor):
+    """Collects docstrings, declared names and resolved names of a module."""
+
+    def __init__(self, lines: _Lines):
+        self.lines = lines
+        self.prose: List[ProseSpan] = []
+        self.names: List[ResolvedName] = []
+        self.aliases: Dict[str, str] = {}
+        self._declared: set = set()
+        self._calls: set = set()
+        self._chained: set = set()
+
+    def _span(
+        self, node: Union[ast.expr, ast.stmt, ast.arg, ast.alias]
+    ) -> Tuple[int, int]:
+        end_line = node.lineno if node.end_lineno is None else node.end_lineno
+        end_column = (
+            node.col_offset if node.end_col_offset is None else node.end_col_offset
+        )
+        return (
+            self.lines.byte_offset(node.lineno, node.col_offset),
+            self.lines.byte_offset(end_line, end_column),
+        )
+
+    def _docstring(self, node: ast.AST) -> None:
+        body = getattr(node, "body", None)
+        if (
+            body
+            and isinstance(body[0], ast.Expr)
+            and isinstance(body[0].value, ast.Constant)
+            and isinstance(body[0].value.value, str)
+        ):
+            self.prose.append(ProseSpan(*self._span(body[0].value), DOCSTRING))
+
+    def _declare(self, name: str, start: int) -> None:
+        if (
+            len(name) < _MIN_NAME_LENGTH
+            or name in _IGNORED_NAMES
+            or name.startswith("__")
+            or name in self._declared
+        ):
+            return
+        self._declared.add(name)
+        self.prose.append(ProseSpan(start, start + len(name), IDENTIFIER))
+
+    def visit_Module(self, node: ast.Module) -> None:
+        self._docstring(node)
+        self.generic_visit(node)
+
+    def _visit_definition(
+        self, node: Union[ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef]
+    ) -> None:
+        self._docstring(node)
+        start = self.lines.byte_offset(node.lineno, node.col_offset)
+        found = re.compile(rf"\b{re.escape(node.name)}\b").search(
+            self.lines.text, start
+        )
+        if found:
+            self._declare(node.name, found.start())
+        self.generic_visit(node)
+
+    visit_ClassDef = _visit_definition
+    visit_FunctionDef = _visit_definition
+    visit_AsyncFunctionDef = _visit_definition
+
+    def visit_arg(self, node: ast.arg) -> None:
+        self._declare(node.arg, self._span(node)[0])
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            bound = alias.asname or alias.name.split(".")[0]
+            self.aliases[bound] = alias.name if alias.asname else bound
+            self.names.append(ResolvedName(alias.name, *self._span(alias)))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.level or not node.module:
+            return
+        for alias in node.names:
+            if alias.name == "*":
+                self.names.append(ResolvedName(node.module, *self._span(node)))
+                continue
+            qualified = f"{node.module}.{alias.name}"
+            self.aliases[alias.asname or alias.name] = qualified
+            self.names.append(ResolvedName(qualified, *self._span(alias)))
+
+    def visit_Call(self, node: ast.Call) -> None:
+        self._calls.add(id(node.func))
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        self._chained.add(id(node.value))
+        if id(node) not in self._chained:
+            parts = [node.attr]
+            value = node.value
+            while isinstance(value, ast.Attribute):
+                parts.append(value.attr)
+                value = value.value
+            if isinstance(value, ast.Name) and value.id in self.aliases:
+                parts.append(self.aliases[value.id])
+                self.names.append(
+                    ResolvedName(
+                        ".".join(reversed(parts)),
+                        *self._span(node),
+                        call=id(node) in self._calls,
+                    )
+                )
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if isinstance(node.ctx, ast.Store):
+            self._declare(node.id, self._span(node)[0])
+        elif id(node) not in self._chained and node.id in self.aliases:
+            self.names.append(
+                ResolvedName(
+                    self.aliases[node.id],
+                    *self._span(node),
+                    call=id(node) in self._calls,
+                )
+            )
+
+
+def _analyse_python(text: str, tree: ast.Module) -> CodeAnalysis:
+    """Analyse a Python source that parsed."""
+    lines = _Lines(text)
+    visitor = _PythonVisitor(lines)
+    visitor.visit(tree)
+    prose = visitor.prose + _python_comments(text, lines)
+    return CodeAnalysis(
+        language=PYTHON,
+        prose=tuple(sorted(prose, key=lambda span: span.start)),
+        names=tuple(sorted(visitor.names, key=lambda name: name.start)),
+        syntax_errors=(),
+    )
+
+
+def _syntax_problem(text: str, error: SyntaxError) -> SyntaxProblem:
+    """Locate a Python syntax error in the text."""
+    lines = _Lines(text)
+    line = min(max(error.lineno or 1, 1), len(lines.starts))
+    start = lines.offset(line, max((error.offset or 1) - 1, 0))
+    end = lines.line_end(start)
+    if error.end_lineno and error.end_offset:
+        end = max(end, lines.offset(error.end_lineno, error.end_offset - 1))
+    if end <= start:
+        end = min(start + 1, len(text))
+    return SyntaxProblem(start, end, line, error.msg)
+
+
+def _regex_end(text: str, position: int) -> Optional[int]:
+    """Find the end of a regular expression literal opening at ``position``.
+
+    Returns:
+        Offset after the literal and its flags, or None if the ``/`` is a
+        division
+    """
+    before = position - 1
+    while before >= 0 and text[before] in " \t\r\n":
+        before -= 1
+    if before >= 0 and text[before] not in _REGEX_PRECEDERS:
+        word_start = before
+        while word_start >= 0 and (
+            text[word_start].isalnum() or text[word_start] in "_$"
+        ):
+            word_start -= 1
+        if text[word_start + 1 : before + 1] not in _REGEX_KEYWORDS:
+            return None
+    end = position + 1
+    in_class = False
+    while end < len(text):
+        char = text[end]
+        if char == "\\":
+            end += 2
+            continue
+        if char == "\n":
+            return None
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "/":
+            end += 1
+            while end < len(text) and text[end].isalpha():
+                end += 1
+            return end
+        end += 1
+    return None
+
+
+def _scan(text: str, syntax: _Syntax) -> Tuple[List[ProseSpan], List[SyntaxProblem]]:
+    """Find comments and bracket errors with a tokenizer for a comment syntax.
+
+    Strings, and regular expression literals where the language has them,
+    are skipped so that comment markers and brackets inside them are
+    ignored. A string at the start of a line in Python is taken for a
+    docstring.
+
+    Args:
+        text: Source code
+        syntax: Comment and string syntax of the language
+
+    Returns:
+        Comments, and the first unbalanced bracket if any
+    """
+    spans: List[ProseSpan] = []
+    stack: List[Tuple[str, int]] = []
+    problems: List[SyntaxProblem] = []
+    markers = sorted(
+        syntax.line_comments
+        + syntax.quotes
+        + ((syntax.block_comment[0],) if syntax.block_comment else ()),
+        key=len,
+        reverse=True,
+    )
+    position = 0
+    size = len(text)
+    while position < size:
+        char = text[position]
+        marker = next((m for m in markers if text.startswith(m, position)), None)
+        if marker is None:
+            if char == "/" and syntax.regex_literals:
+                end = _regex_end(text, position)
+                if end is not None:
+                    position = end
+                    continue
+            if syntax.check_brackets and not problems:
+                if char in "([{":
+                    stack.append((char, position))
+                elif char in _BRACKETS:
+                    if stack and stack[-1][0] == _BRACKETS[char]:
+                        stack.pop()
+                    else:
+                        problems.append(
+                            SyntaxProblem(
+                                position, position + 1, 0, f"Unmatched '{char}'"
+                            )
+                        )
+            position += 1
+        elif marker in syntax.line_comments:
+            end = text.find("\n", position)
+            end = size if end < 0 else end
+            if not _DIRECTIVE.match(text[position:end]):
+                spans.append(ProseSpan(position, end, COMMENT))
+            position = end
+        elif syntax.block_comment and marker == syntax.block_comment[0]:
+            end = text.find(syntax.block_comment[1], position + len(marker))
+            end = size if end < 0 else end + len(syntax.block_comment[1])
+            spans.append(ProseSpan(position, end, COMMENT))
+            position = end
+        else:
+            end = position + len(marker)
+            while end < size:
+                if text[end] == "\\":
+                    end += 2
+                elif text.startswith(marker, end):
+                    end += len(marker)
+                    break
+                elif text[end] == "\n" and len(marker) == 1 and marker != "`":
+                    break
+                else:
+                    end += 1
+            end = min(end, size)
+            line_start = text.rfind("\n", 0, position) + 1
+            if len(marker) == 3 and not text[line_start:position].strip():
+                spans.append(ProseSpan(position, end, DOCSTRING))
+            position = end
+    if stack and not problems:
+        char, position = stack[-1]
+        problems.append(SyntaxProblem(position, position + 1, 0, f"Unclosed '{char}'"))
+    return spans, problems
+
+
+def _analyse_tokens(
+    text: str, language: Optional[str], problems: List[SyntaxProblem]
+) -> CodeAnalysis:
+    """Analyse a source the ``ast`` module cannot parse.
+
+    Args:
+        text: Source code
+        language: Language of the source, if known
+        problems: Syntax errors already found by a parser; when empty and
+            the language uses brackets, unbalanced brackets are reported
+
+    Returns:
+        Comments and declared names, without resolved names
+    """
+    syntax = _SYNTAX.get(language or "", _C_LIKE)
+    spans, bracket_problems = _scan(text, syntax)
+    if not problems and language is not None:
+        problems = bracket_problems
+    lines = _Lines(text)
+    problems = [
+        SyntaxProblem(p.start, p.end, p.line or lines.line_of(p.start), p.message)
+        for p in problems
+    ]
+
+    covered = [(span.start, span.end) for span in spans]
+    seen = set()
+    for found in _DECLARATION.finditer(text):
+        name = found.group(1)
+        start = found.start(1)
+        if (
+            len(name) >= _MIN_NAME_LENGTH
+            and name not in _IGNORED_NAMES
+            and name not in seen
+            and not any(s <= start < e for s, e in covered)
+        ):
+            seen.add(name)
+            spans.append(ProseSpan(start, start + len(name), IDENTIFIER))
+    return CodeAnalysis(
+        language=language,
+        prose=tuple(sorted(spans, key=lambda span: span.start)),
+        names=None,
+        syntax_errors=tuple(problems),
+    )
+
+
+@lru_cache(maxsize=16)
+def analyse_code(text: str, language: Optional[str] = None) -> CodeAnalysis:
+    """Parse a source file locally.
+
+    Python is parsed with ``ast``; a source whose language is unknown is
+    treated as Python when it parses. Other sources, and Python that does
+    not parse, go through the tokenizer. Results are cached, so every agent
+    reviewing the same source shares one parse.
+
+    Args:
+        text: Source code
+        language: Language of the source (see ``detect_language``)
+
+    Returns:
+        Prose spans, resolved names and syntax errors of the source
+    """
+    if language in (PYTHON, None):
+        try:
+            tree = ast.parse(text)
+        except (SyntaxError, ValueError) as e:
+            if language is None:
+                return _analyse_tokens(text, None, [])
+            problems = [_syntax_problem(text, e)] if isinstance(e, SyntaxError) else []
+            return _analyse_tokens(text, PYTHON, problems)
+        return _analyse_python(text, tree)
+    return _analyse_tokens(text, language, [])
@@ -0,0 +1,188 @@
+"""Prompt compaction: whitespace, boilerplate, code elision and token budget."""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from content_reviewer_agent.analysis.chunking import CHARS_PER_TOKEN, estimate_tokens
+
+#: A line repeated this often outside code is treated as a running header
+BOILERPLATE_MIN_REPEATS = 3
+
+#: Shorter lines are never treated as boilerplate (bullets, table rows, ...)
+BOILERPLATE_MIN_CHARS = 12
+
+_FENCE = re.compile(
+    r"^(?P<fence>```|~~~)[ \t]*(?P<lang>[\w+#.-]*)[^\n]*\n"
+    r"(?P<body>.*?)^(?P=fence)[ \t]*$",
+    re.MULTILINE | re.DOTALL,
+)
+_DEFINITION = re.compile(
+    r"^[ \t]*(?:async\s+def|def|class|function|func|fn|interface)\s+(\w+)",
+    re.MULTILINE,
+)
+_INLINE_SPACE = re.compile(r"[ \t\f\v\u00a0]+")
+_TRAILING_SPACE = re.compile(r"[ \t\f\v\u00a0]+$", re.MULTILINE)
+_BLANK_LINES = re.compile(r"\n{3,}")
+_BREAKS = (re.compile(r"\n\s*\n"), re.compile(r"(?<=[.!?])\s"), re.compile(r"\s"))
+
+
+@dataclass(frozen=True)
+class CompactedText:
+    """A text prepared for a prompt, with what compaction did to it."""
+
+    text: str
+    tokens_before: int
+    tokens_after: int
+    elided_blocks: int = 0
+    boilerplate_lines: int = 0
+    truncated: bool = False
+
+
+def _summarise_code(lang: str, body: str) -> str:
+    """Describe an elided code block in one line."""
+    lines = body.count("\n") + (not body.endswith("\n") and bool(body))
+    label = f"{lang} code" if lang else "code"
+    names = list(dict.fromkeys(_DEFINITION.findall(body)))
+    defines = f" defining {', '.join(names[:5])}" if names else ""
+    return f"[{label} block omitted: {lines} lines{defines}]"
+
+
+def _split_code(text: str) -> List[Tuple[bool, str, str]]:
+    """Split text into ``(is_code, text, lang)`` pieces along code fences."""
+    pieces: List[Tuple[bool, str, str]] = []
+    cursor = 0
+    for match in _FENCE.finditer(text):
+        if match.start() > cursor:
+            pieces.append((False, text[cursor : match.start()], ""))
+        pieces.append((True, match.group(0), match.group("lang")))
+        cursor = match.end()
+    if cursor < len(text):
+        pieces.append((False, text[cursor:], ""))
+    return pieces
+
+
+def _drop_boilerplate(pieces: List[Tuple[bool, str, str]]) -> int:
+    """Keep only the first copy of lines repeated throughout the prose.
+
+    Args:
+        pieces: Output of ``_split_code``, updated in place
+
+    Returns:
+        Number of lines dropped
+    """
+    counts = Counter(
+        line.strip()
+        for is_code, piece, _ in pieces
+        if not is_code
+        for line in piece.split("\n")
+    )
+    repeated = {
+        line
+        for line, count in counts.items()
+        if count >= BOILERPLATE_MIN_REPEATS and len(line) >= BOILERPLATE_MIN_CHARS
+    }
+    if not repeated:
+        return 0
+    seen = set()
+    dropped = 0
+    for position, (is_code, piece, lang) in enumerate(pieces):
+        if is_code:
+            continue
+        kept = []
+        for line in piece.split("\n"):
+            key = line.strip()
+            if key in repeated:
+                if key in seen:
+                    dropped += 1
+                    continue
+                seen.add(key)
+            kept.append(line)
+        pieces[position] = (False, "\n".join(kept), lang)
+    return dropped
+
+
+def truncate_to_budget(text: str, max_tokens: int) -> Tuple[str, bool]:
+    """Cut a text to an estimated token budget at a natural break.
+
+    The cut falls on the last paragraph break, else sentence end, else
+    whitespace in the second half of the allowance, and a marker says how
+    much was left out.
+
+    Args:
+        text: Text to cut
+        max_tokens: Estimated tokens allowed
+
+    Returns:
+        The text and whether it was cut
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text, False
+    limit = max(0, max_tokens) * CHARS_PER_TOKEN
+    cut = limit
+    for pattern in _BREAKS:
+        breaks = [m.start() for m in pattern.finditer(text, limit // 2, limit)]
+        if breaks:
+            cut = breaks[-1]
+            break
+    omitted = estimate_tokens(text[cut:])
+    return f"{text[:cut].rstrip()}\n[... truncated: ~{omitted} tokens omitted]", True
+
+
+def compact_text(
+    text: str,
+    elide_code: bool = False,
+    keep_indentation: bool = False,
+    max_tokens: Optional[int] = None,
+) -> CompactedText:
+    """Compact a text before it is put in a prompt.
+
+    Whitespace runs in prose collapse to one space and blank line runs to
+    one blank line; code keeps its indentation. Lines repeated throughout
+    the prose, such as running slide or page headers, are kept once. Fenced
+    code blocks can be replaced by a one-line summary.
+
+    Args:
+        text: Text to compact
+        elide_code: Replace fenced code blocks with a summary
+        keep_indentation: Treat the whole text as code
+        max_tokens: Estimated tokens allowed after compaction, if any
+
+    Returns:
+        The compacted text and what was done to it
+    """
+    tokens_before = estimate_tokens(text)
+    if keep_indentation:
+        pieces = [(True, text, "")]
+    else:
+        pieces = _split_code(text)
+    boilerplate = _drop_boilerplate(pieces)
+
+    parts = []
+    elided = 0
+    for is_code, piece, lang in pieces:
+        if not is_code:
+            parts.append(_INLINE_SPACE.sub(" ", piece))
+        elif elide_code and not keep_indentation:
+            fence = _FENCE.match(piece)
+            body = fence.group("body") if fence else piece
+            parts.append(_summarise_code(lang, body))
+            elided += 1
+        else:
+            parts.append(piece)
+    compacted = "".join(parts)
+    compacted = _TRAILING_SPACE.sub("", compacted)
+    compacted = _BLANK_LINES.sub("\n\n", compacted).strip()
+
+    truncated = False
+    if max_tokens is not None:
+        compacted, truncated = truncate_to_budget(compacted, max_tokens)
+    return CompactedText(
+        text=compacted,
+        tokens_before=tokens_before,
+        tokens_after=estimate_tokens(compacted),
+        elided_blocks=elided,
+        boilerplate_lines=boilerplate,
+        truncated=truncated,
+    )
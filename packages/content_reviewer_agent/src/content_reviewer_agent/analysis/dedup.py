@@ -0,0 +1,256 @@
+"""Cross-agent duplicate issue detection with shingles and MinHash LSH."""
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from content_reviewer_agent.models.content import IssueSeverity, ReviewIssue
+
+#: Characters per shingle
+SHINGLE_SIZE = 3
+
+#: MinHash signature length; split into ``LSH_BANDS`` bands of equal rows
+NUM_PERMUTATIONS = 32
+LSH_BANDS = 8
+
+#: Earlier bucket members each issue is compared with
+MAX_BUCKET_COMPARISONS = 32
+
+# a < 2**31 and b < 2**32 keep (a * x + b) for 32-bit x within uint64
+_MERSENNE = np.uint64((1 << 61) - 1)
+_rng = np.random.default_rng(20250101)
+_PERM_A = _rng.integers(1, 1 << 31, NUM_PERMUTATIONS, dtype=np.uint64)
+_PERM_B = _rng.integers(0, 1 << 32, NUM_PERMUTATIONS, dtype=np.uint64)
+
+_NOT_WORD = re.compile(r"[^\w]+")
+
+_SEVERITY_RANK = {
+    IssueSeverity.CRITICAL: 4,
+    IssueSeverity.HIGH: 3,
+    IssueSeverity.MEDIUM: 2,
+    IssueSeverity.LOW: 1,
+    IssueSeverity.INFO: 0,
+}
+
+
+def normalise_text(text: Optional[str]) -> str:
+    """Lowercase a text and collapse punctuation and whitespace."""
+    return _NOT_WORD.sub(" ", (text or "").lower()).strip()
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    """Hash the overlapping character n-grams of a normalised text.
+
+    Args:
+        text: Normalised text
+        size: Characters per shingle
+
+    Returns:
+        Set of 32-bit shingle hashes; texts shorter than ``size`` give one
+    """
+    if len(text) <= size:
+        return {zlib.crc32(text.encode("utf-8"))} if text else set()
+    return {
+        zlib.crc32(text[i : i + size].encode("utf-8"))
+        for i in range(len(text) - size + 1)
+    }
+
+
+def minhash(hashes: Set[int]) -> np.ndarray:
+    """Compute the MinHash signature of a set of shingle hashes."""
+    values = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+    # Universal hashing (a * x + b) mod p for every permutation at once
+    permuted = (_PERM_A[:, None] * values[None, :] + _PERM_B[:, None]) % _MERSENNE
+    signature: np.ndarray = permuted.min(axis=1)
+    return signature
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    """Exact Jaccard similarity of two shingle sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class _DisjointSet:
+    """Union-find over issue indices with path halving."""
+
+    def __init__(self, size: int):
+        """Start with every index in its own set."""
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        """Get the root of an index's set."""
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> None:
+        """Join the sets of two indices."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # Keep the earliest issue as the root to preserve list order
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+def _located(issue: ReviewIssue) -> bool:
+    """Check whether an issue has a character span."""
+    return issue.start_offset is not None and issue.end_offset is not None
+
+
+def _span(issue: ReviewIssue) -> Tuple[int, int]:
+    """Get the character span of an issue that ``_located`` accepted."""
+    assert issue.start_offset is not None and issue.end_offset is not None
+    return issue.start_offset, issue.end_offset
+
+
+def _span_overlap(a: ReviewIssue, b: ReviewIssue) -> float:
+    """Intersection over union of two located issues' spans."""
+    (a_start, a_end), (b_start, b_end) = _span(a), _span(b)
+    intersection = min(a_end, b_end) - max(a_start, b_start)
+    if intersection <= 0:
+        return 0.0
+    union = max(a_end, b_end) - min(a_start, b_start)
+    return intersection / union
+
+
+def _merge_cluster(members: Sequence[ReviewIssue]) -> ReviewIssue:
+    """Merge duplicates into the most confident one, crediting every agent."""
+    best = max(members, key=lambda issue: issue.confidence)
+    agents: List[str] = []
+    for issue in members:
+        for agent in issue.contributing_agents or [issue.reviewed_by_agent or ""]:
+            if agent and agent not in agents:
+                agents.append(agent)
+    update: Dict[str, object] = {
+        "contributing_agents": agents,
+        "severity": max(
+            (issue.severity for issue in members), key=_SEVERITY_RANK.__getitem__
+        ),
+        "sources": list(dict.fromkeys(s for issue in members for s in issue.sources)),
+    }
+    if not _located(best):
+        located = next((issue for issue in members if _located(issue)), None)
+        if located is not None:
+            update.update(
+                start_offset=located.start_offset,
+                end_offset=located.end_offset,
+                line=located.line,
+                paragraph=located.paragraph,
+                page=located.page,
+                location=located.location,
+            )
+    return best.model_copy(update=update)
+
+
+def _lsh_candidates(sets: List[Set[int]]) -> List[List[int]]:
+    """Group indices whose MinHash signatures share at least one band."""
+    rows = NUM_PERMUTATIONS // LSH_BANDS
+    buckets: Dict[tuple, List[int]] = defaultdict(list)
+    for i, hashes in enumerate(sets):
+        if not hashes:
+            continue
+        signature = minhash(hashes)
+        for band in range(LSH_BANDS):
+            rows_hash = signature[band * rows : (band + 1) * rows].tobytes()
+            buckets[band, rows_hash].append(i)
+    return [members for members in buckets.values() if len(members) > 1]
+
+
+def merge_duplicate_issues(
+    issues: List[ReviewIssue],
+    similarity: float = 0.8,
+    span_overlap: float = 0.8,
+) -> List[ReviewIssue]:
+    """Cluster issues that several agents reported for the same text.
+
+    Two located issues are duplicates when their spans overlap by at least
+    ``span_overlap`` (intersection over union); this is found with a sweep
+    over spans sorted by start. An unlocated issue joins issues whose quoted
+    text is identical after normalisation or has a shingle Jaccard
+    similarity of at least ``similarity``. Candidates for the similarity
+    check come from MinHash locality-sensitive hashing, so the cost grows
+    with the number of issues rather than the number of pairs. A cluster
+    never holds located issues at different places in the text.
+
+    Each cluster becomes its most confident issue, with the highest severity
+    and all contributing agents.
+
+    Args:
+        issues: Issues from all agents
+        similarity: Minimum text similarity of unlocated duplicates
+        span_overlap: Minimum span overlap of located duplicates
+
+    Returns:
+        One issue per cluster, in order of each cluster's first issue
+    """
+    clusters = _DisjointSet(len(issues))
+    # A located member of each cluster, keyed by the cluster root
+    anchors: Dict[int, ReviewIssue] = {}
+
+    def join(i: int, j: int) -> None:
+        root_i, root_j = clusters.find(i), clusters.find(j)
+        if root_i == root_j:
+            return
+        anchor_i, anchor_j = anchors.get(root_i), anchors.get(root_j)
+        if (
+            anchor_i is not None
+            and anchor_j is not None
+            and _span_overlap(anchor_i, anchor_j) < span_overlap
+        ):
+            return
+        clusters.union(root_i, root_j)
+        anchor = anchor_i or anchor_j
+        if anchor is not None:
+            anchors[clusters.find(root_i)] = anchor
+
+    spans = {i: _span(issue) for i, issue in enumerate(issues) if _located(issue)}
+    located = sorted(spans, key=lambda i: (spans[i][0], -spans[i][1]))
+    for i in located:
+        anchors[i] = issues[i]
+
+    # Located issues: sweep spans in start order against the still-open ones
+    active: List[int] = []
+    for i in located:
+        start = spans[i][0]
+        active = [j for j in active if spans[j][1] > start]
+        for j in active:
+            if _span_overlap(issues[i], issues[j]) >= span_overlap:
+                join(i, j)
+        active.append(i)
+
+    # Unlocated issues: identical quotes first, then similar ones via LSH
+    texts: Dict[str, List[int]] = defaultdict(list)
+    for i, issue in enumerate(issues):
+        text = normalise_text(issue.original_text)
+        if text:
+            texts[text].append(i)
+    group_texts = [
+        text
+        for text, members in texts.items()
+        if any(not _located(issues[i]) for i in members)
+    ]
+    groups = [texts[text] for text in group_texts]
+    for members in groups:
+        for i in members:
+            if not _located(issues[i]):
+                for j in members:
+                    join(i, j)
+
+    sets = [shingles(text) for text in group_texts]
+    for bucket in _lsh_candidates(sets):
+        for position, a in enumerate(bucket):
+            # Bound the work in buckets of near-identical boilerplate
+            for b in bucket[max(0, position - MAX_BUCKET_COMPARISONS) : position]:
+                if jaccard(sets[a], sets[b]) >= similarity:
+                    join(groups[a][0], groups[b][0])
+
+    grouped: Dict[int, List[ReviewIssue]] = defaultdict(list)
+    for i, issue in enumerate(issues):
+        grouped[clusters.find(i)].append(issue)
+    return [_merge_cluster(grouped[root]) for root in sorted(grouped)]
@@ -0,0 +1,205 @@
+"""Versioned catalogue of deprecated technologies matched in linear time."""
+
+import json
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from content_reviewer_agent.analysis.automaton import AhoCorasick
+
+#: Catalogue shipped with the package
+DEFAULT_CATALOGUE_PATH = Path(__file__).resolve().parents[1] / "data/deprecations.json"
+
+_VERSION = re.compile(r"[ \t]?v?(\d+(?:\.\d+)*)")
+
+logger = logging.getLogger(__name__)
+
+
+def parse_version(version: str) -> Tuple[int, ...]:
+    """Parse a dotted version into a comparable tuple."""
+    return tuple(int(part) for part in version.split("."))
+
+
+@dataclass(frozen=True)
+class CatalogueEntry:
+    """A deprecated technology, API or range of versions.
+
+    When ``below_version`` is set, a pattern only matches when followed by a
+    version lower than it, compared at the precision written in the text.
+    """
+
+    id: str
+    name: str
+    patterns: Tuple[str, ...]
+    type: str
+    severity: str
+    description: str
+    replacement: Optional[str] = None
+    below_version: Optional[str] = None
+    context_dependent: bool = False
+
+    def affects(self, version: Optional[str]) -> bool:
+        """Check whether a version mentioned in the text is affected."""
+        if self.below_version is None:
+            return True
+        if version is None:
+            return False
+        found = parse_version(version)
+        return found < parse_version(self.below_version)[: len(found)]
+
+
+@dataclass(frozen=True)
+class CatalogueMatch:
+    """An occurrence of a catalogue entry in a text."""
+
+    entry: CatalogueEntry
+    start: int
+    end: int
+    text: str
+    version: Optional[str] = None
+
+    @property
+    def description(self) -> str:
+        """Entry description with the matched version filled in."""
+        return self.entry.description.replace("{version}", self.version or "")
+
+
+def _is_word_char(char: str) -> bool:
+    """Check whether a character continues a word."""
+    return char.isalnum() or char == "_"
+
+
+@dataclass
+class DeprecationCatalogue:
+    """Catalogue entries compiled into a single Aho-Corasick automaton."""
+
+    version: str
+    entries: List[CatalogueEntry]
+    _automaton: AhoCorasick = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Compile the patterns of every entry."""
+        self._automaton = AhoCorasick(
+            (pattern, entry) for entry in self.entries for pattern in entry.patterns
+        )
+
+    @classmethod
+    def from_file(cls, path: Union[str, os.PathLike]) -> "DeprecationCatalogue":
+        """Load a catalogue from a JSON file.
+
+        Args:
+            path: Path of the catalogue
+
+        Returns:
+            Compiled catalogue
+
+        Raises:
+            ValueError: If the file is not a valid catalogue
+        """
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        try:
+            entries = [
+                CatalogueEntry(**{**item, "patterns": tuple(item["patterns"])})
+                for item in data["entries"]
+            ]
+        except (KeyError, TypeError) as exc:
+            raise ValueError(f"Invalid deprecation catalogue {path}: {exc}") from exc
+        return cls(version=str(data.get("version", "")), entries=entries)
+
+    def scan(self, text: str) -> List[CatalogueMatch]:
+        """Find catalogue entries mentioned in a text.
+
+        Matches must sit on word boundaries. Overlapping matches of the same
+        entry are reduced to the longest one.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Matches in order of appearance
+        """
+        matches: List[CatalogueMatch] = []
+        for start, end, entry in self._automaton.iter_matches(text):
+            if (
+                start > 0
+                and _is_word_char(text[start])
+                and _is_word_char(text[start - 1])
+            ):
+                continue
+            version = None
+            if entry.below_version is not None:
+                found = _VERSION.match(text, end)
+                if found is None:
+                    continue
+                version, end = found.group(1), found.end()
+            if (
+                end < len(text)
+                and _is_word_char(text[end - 1])
+                and _is_word_char(text[end])
+            ):
+                continue
+            if not entry.affects(version):
+                continue
+            matches.append(CatalogueMatch(entry, start, end, text[start:end], version))
+
+        matches.sort(key=lambda match: (match.start, -match.end))
+        kept: List[CatalogueMatch] = []
+        for match in matches:
+            if kept and kept[-1].entry is match.entry and match.start < kept[-1].end:
+                continue
+            kept.append(match)
+        return kept
+
+
+class CatalogueLoader:
+    """Reloads a catalogue file when its modification time changes."""
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        """Initialize the loader.
+
+        Args:
+            path: Path of the catalogue file
+        """
+        self.path = Path(path)
+        self._catalogue: Optional[DeprecationCatalogue] = None
+        self._mtime: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> DeprecationCatalogue:
+        """Get the current catalogue, reloading it if the file changed.
+
+        A file that fails to load keeps the previous catalogue in service.
+
+        Returns:
+            The catalogue
+
+        Raises:
+            OSError, ValueError: If the very first load fails
+        """
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except OSError:
+            if self._catalogue is None:
+                raise
+            return self._catalogue
+        if mtime == self._mtime and self._catalogue is not None:
+            return self._catalogue
+        with self._lock:
+            if mtime != self._mtime or self._catalogue is None:
+                try:
+                    self._catalogue = DeprecationCatalogue.from_file(self.path)
+                except (OSError, ValueError) as exc:
+                    if self._catalogue is None:
+                        raise
+                    logger.warning(
+                        "Keeping deprecation catalogue %s: %s",
+                        self._catalogue.version,
+                        exc,
+                    )
+                self._mtime = mtime
+        return self._catalogue
@@ -0,0 +1,133 @@
+"""Paragraph and sentence level diff between content versions."""
+
+import re
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import List, Optional, Tuple
+
+from content_reviewer_agent.analysis.chunking import TextChunk
+
+_PARAGRAPH = re.compile(r"[^\n]+(?:\n[ \t]*\S[^\n]*)*")
+_SENTENCE = re.compile(r"[^.!?\n]+(?:[.!?]+|$)", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class UnchangedBlock:
+    """A run of text identical in both versions."""
+
+    old_start: int
+    new_start: int
+    length: int
+
+
+@dataclass
+class TextDiff:
+    """Differences between an old and a new version of a text."""
+
+    changed: List[TextChunk] = field(default_factory=list)
+    unchanged: List[UnchangedBlock] = field(default_factory=list)
+
+    def map_span(self, start: int, end: int) -> Optional[Tuple[int, int]]:
+        """Map a span of the old text onto the new text.
+
+        Args:
+            start: Start offset in the old text
+            end: End offset in the old text
+
+        Returns:
+            Shifted span, or None if it does not lie in unchanged text
+        """
+        for block in self.unchanged:
+            if block.old_start <= start and end <= block.old_start + block.length:
+                shift = block.new_start - block.old_start
+                return start + shift, end + shift
+        return None
+
+    def find_unchanged(self, new_text: str, snippet: str) -> Optional[Tuple[int, int]]:
+        """Find a snippet inside the unchanged parts of the new text.
+
+        Args:
+            new_text: New version of the text
+            snippet: Text to look for
+
+        Returns:
+            Span in the new text, or None if not found in unchanged text
+        """
+        for block in self.unchanged:
+            end = block.new_start + block.length
+            index = new_text.find(snippet, block.new_start, end)
+            if index >= 0:
+                return index, index + len(snippet)
+        return None
+
+
+def _spans(text: str, start: int, end: int, pattern: re.Pattern) -> List[Tuple]:
+    """Find non-blank spans of a unit pattern within ``text[start:end]``."""
+    return [
+        (m.start(), m.end())
+        for m in pattern.finditer(text, start, end)
+        if m.group().strip()
+    ]
+
+
+def _diff_units(
+    old: str,
+    new: str,
+    old_units: List[Tuple[int, int]],
+    new_units: List[Tuple[int, int]],
+    diff: TextDiff,
+    refine: bool,
+) -> None:
+    """Diff two unit sequences, recording results into ``diff``."""
+    matcher = SequenceMatcher(
+        None,
+        [old[s:e] for s, e in old_units],
+        [new[s:e] for s, e in new_units],
+        autojunk=False,
+    )
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            for (o_start, o_end), (n_start, _) in zip(
+                old_units[i1:i2], new_units[j1:j2]
+            ):
+                diff.unchanged.append(UnchangedBlock(o_start, n_start, o_end - o_start))
+        elif tag == "replace" and refine:
+            # Narrow edited paragraphs down to the sentences that changed
+            _diff_units(
+                old,
+                new,
+                _spans(old, old_units[i1][0], old_units[i2 - 1][1], _SENTENCE),
+                _spans(new, new_units[j1][0], new_units[j2 - 1][1], _SENTENCE),
+                diff,
+                refine=False,
+            )
+        elif j2 > j1:
+            start, end = new_units[j1][0], new_units[j2 - 1][1]
+            diff.changed.append(TextChunk(start, end, new[start:end]))
+
+
+def diff_text(old: str, new: str) -> TextDiff:
+    """Compute the regions of ``new`` that differ from ``old``.
+
+    Paragraphs are matched first; edited paragraphs are then compared
+    sentence by sentence so a one-word fix only yields its sentence.
+
+    Args:
+        old: Previous version of the text
+        new: New version of the text
+
+    Returns:
+        Changed regions of the new text and unchanged blocks shared by both
+    """
+    diff = TextDiff()
+    _diff_units(
+        old,
+        new,
+        _spans(old, 0, len(old), _PARAGRAPH),
+        _spans(new, 0, len(new), _PARAGRAPH),
+        diff,
+        refine=True,
+    )
+    diff.changed.sort(key=lambda chunk: chunk.start)
+    diff.unchanged.sort(key=lambda block: block.new_start)
+    return diff
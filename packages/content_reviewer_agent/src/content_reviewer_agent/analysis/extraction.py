@@ -0,0 +1,273 @@
+"""Page-by-page text extraction from PDF, PowerPoint and HTML documents.
+
+Every function reads the document from disk and only holds the pages it is
+asked for, so the worker processes that run them stay small whatever the
+size of the file. PDF needs the optional ``pypdf`` package; PowerPoint decks
+are read as the zip of XML parts they are, and HTML with the standard
+library's parser.
+"""
+
+import codecs
+import posixpath
+import re
+import zipfile
+from bisect import bisect_right
+from html.parser import HTMLParser
+from typing import Dict, Iterable, List, Sequence
+from xml.etree import ElementTree
+
+from content_reviewer_agent.models.content import ContentType, ReviewIssue
+
+PDF = "pdf"
+PPTX = "pptx"
+HTML = "html"
+
+_DRAWING_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_PRESENTATION_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_RELATIONSHIP_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PACKAGE_RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_SLIDE_NAME = re.compile(r"^ppt/slides/slide(\d+)\.xml$")
+
+_BLANK_LINES = re.compile(r"\n\s*\n\s*")
+_SPACES = re.compile(r"[ \t\r\f\v]+")
+
+# Elements whose text is never shown, and elements that start a new line
+_HIDDEN_TAGS = frozenset({"script", "style", "noscript", "template", "head"})
+_BLOCK_TAGS = frozenset(
+    "address article aside blockquote br dd div dl dt figcaption figure footer "
+    "h1 h2 h3 h4 h5 h6 header hr li main nav ol p pre section table td th tr "
+    "ul".split()
+)
+
+_READ_CHUNK_BYTES = 64 * 1024
+
+
+class ExtractionError(ValueError):
+    """Raised when a document cannot be read as its declared format."""
+
+
+def _clean(text: str) -> str:
+    """Collapse runs of spaces and blank lines in extracted text."""
+    text = _SPACES.sub(" ", text)
+    return _BLANK_LINES.sub("\n\n", text).strip()
+
+
+def detect_format(path: str, content_type: ContentType) -> str:
+    """Decide how to parse a document.
+
+    Slides may be uploaded as PDF or PowerPoint, so the file's signature
+    wins over the declared content type.
+
+    Args:
+        path: Document file path
+        content_type: Declared content type
+
+    Returns:
+        ``PDF``, ``PPTX`` or ``HTML``
+
+    Raises:
+        ExtractionError: If the content type cannot be extracted
+    """
+    with open(path, "rb") as f:
+        signature = f.read(5)
+    if signature.startswith(b"%PDF"):
+        return PDF
+    if signature.startswith(b"PK") and content_type == ContentType.SLIDE:
+        return PPTX
+    if content_type == ContentType.HTML:
+        return HTML
+    raise ExtractionError(f"Cannot extract text from a {content_type.value} file")
+
+
+def _pdf_reader(path: str):
+    """Open a PDF lazily, page objects being parsed on access."""
+    try:
+        from pypdf import PdfReader
+        from pypdf.errors import PyPdfError
+    except ImportError:
+        raise ExtractionError(
+            "PDF extraction needs the pypdf package: "
+            "pip install 'content-reviewer-agent[documents]'"
+        )
+    try:
+        return PdfReader(path)
+    except PyPdfError as e:
+        raise ExtractionError(f"Invalid PDF: {e}")
+
+
+def _slide_parts(archive: zipfile.ZipFile) -> List[str]:
+    """List a deck's slide parts in presentation order.
+
+    The order is that of the presentation's slide list, falling back to the
+    slide file numbers when the list cannot be read.
+    """
+    numbers = {
+        n: int(match.group(1))
+        for n in archive.namelist()
+        if (match := _SLIDE_NAME.match(n))
+    }
+    try:
+        presentation = ElementTree.fromstring(archive.read("ppt/presentation.xml"))
+        rels = ElementTree.fromstring(archive.read("ppt/_rels/presentation.xml.rels"))
+    except (KeyError, ElementTree.ParseError):
+        return sorted(numbers, key=numbers.__getitem__)
+    targets = {
+        rel.get("Id"): posixpath.normpath(posixpath.join("ppt", target))
+        for rel in rels.iter(f"{{{_PACKAGE_RELS_NS}}}Relationship")
+        if (target := rel.get("Target"))
+    }
+    ordered = [
+        targets.get(slide.get(f"{{{_RELATIONSHIP_NS}}}id"))
+        for slide in presentation.iter(f"{{{_PRESENTATION_NS}}}sldId")
+    ]
+    return [name for name in ordered if name in numbers]
+
+
+def _slide_text(archive: zipfile.ZipFile, name: str, max_chars: int) -> str:
+    """Stream the paragraphs of one slide, stopping after ``max_chars``."""
+    paragraphs: List[str] = []
+    size = 0
+    with archive.open(name) as part:
+        for _, element in ElementTree.iterparse(part, events=("end",)):
+            if element.tag == f"{{{_DRAWING_NS}}}p":
+                text = "".join(
+                    t.text or "" for t in element.iter(f"{{{_DRAWING_NS}}}t")
+                )
+                element.clear()
+                if text.strip():
+                    paragraphs.append(text)
+                    size += len(text) + 1
+                    if size >= max_chars:
+                        break
+    return "\n".join(paragraphs)
+
+
+def _open_deck(path: str) -> zipfile.ZipFile:
+    """Open a PowerPoint deck."""
+    try:
+        return zipfile.ZipFile(path)
+    except zipfile.BadZipFile as e:
+        raise ExtractionError(f"Invalid PowerPoint file: {e}")
+
+
+class _TextExtractor(HTMLParser):
+    """Collects visible text, breaking lines at block elements."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.size = 0
+        self._hidden = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _HIDDEN_TAGS:
+            self._hidden += 1
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in _HIDDEN_TAGS:
+            self._hidden = max(0, self._hidden - 1)
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self._hidden:
+            self.parts.append(data)
+            self.size += len(data)
+
+
+def _html_text(path: str, max_chars: int) -> str:
+    """Stream an HTML file through the parser, stopping after ``max_chars``."""
+    parser = _TextExtractor()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    with open(path, "rb") as f:
+        while parser.size < max_chars:
+            chunk = f.read(_READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            parser.feed(decoder.decode(chunk))
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    return _clean("".join(parser.parts))[:max_chars]
+
+
+def count_pages(path: str, content_type: ContentType) -> int:
+    """Count the pages, or slides, of a document.
+
+    Args:
+        path: Document file path
+        content_type: Declared content type
+
+    Returns:
+        Number of pages; HTML documents are a single page
+
+    Raises:
+        ExtractionError: If the document cannot be read
+    """
+    kind = detect_format(path, content_type)
+    if kind == PDF:
+        return len(_pdf_reader(path).pages)
+    if kind == PPTX:
+        with _open_deck(path) as archive:
+            return len(_slide_parts(archive))
+    return 1
+
+
+def extract_pages(
+    path: str, content_type: ContentType, first: int, last: int, max_chars: int
+) -> List[str]:
+    """Extract the text of a range of pages.
+
+    Runs in a worker process, so it only takes and returns picklable values.
+
+    Args:
+        path: Document file path
+        content_type: Declared content type
+        first: Index of the first page, from 0
+        last: Index after the last page
+        max_chars: Stop reading a page after this many characters
+
+    Returns:
+        Cleaned text of each page in the range, possibly empty
+
+    Raises:
+        ExtractionError: If the document cannot be read
+    """
+    kind = detect_format(path, content_type)
+    if kind == PDF:
+        reader = _pdf_reader(path)
+        return [
+            _clean(reader.pages[i].extract_text() or "")[:max_chars]
+            for i in range(first, last)
+        ]
+    if kind == PPTX:
+        with _open_deck(path) as archive:
+            parts = _slide_parts(archive)[first:last]
+            return [_clean(_slide_text(archive, p, max_chars)) for p in parts]
+    return [_html_text(path, max_chars)] if first == 0 else []
+
+
+def assign_pages(
+    issues: Iterable[ReviewIssue], pages: Sequence[Dict[str, int]], label: str
+) -> None:
+    """Set the page of located issues from an extracted document's page map.
+
+    Args:
+        issues: Issues to update in place
+        pages: ``{"page": number, "start": offset}`` per page, by offset
+        label: Word naming a page in locations, such as "page" or "slide"
+    """
+    if not pages:
+        return
+    starts = [p["start"] for p in pages]
+    for issue in issues:
+        if issue.start_offset is None:
+            continue
+        index = max(0, bisect_right(starts, issue.start_offset) - 1)
+        issue.page = pages[index]["page"]
+        prefix = f"{label} {issue.page}"
+        if not issue.location:
+            issue.location = prefix
+        elif not issue.location.startswith(prefix):
+            issue.location = f"{prefix}, {issue.location}"
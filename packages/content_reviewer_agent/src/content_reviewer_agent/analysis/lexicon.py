@@ -0,0 +1,119 @@
+"""Word lists for the local spelling and grammar checker (EN and PT-BR)."""
+
+MISSPELLINGS_EN = {
+    "accomodate": "accommodate",
+    "acheive": "achieve",
+    "adress": "address",
+    "alot": "a lot",
+    "arguement": "argument",
+    "begining": "beginning",
+    "beleive": "believe",
+    "calender": "calendar",
+    "comming": "coming",
+    "commited": "committed",
+    "concensus": "consensus",
+    "definately": "definitely",
+    "dependancy": "dependency",
+    "enviroment": "environment",
+    "existance": "existence",
+    "explaination": "explanation",
+    "fucntion": "function",
+    "goverment": "government",
+    "grammer": "grammar",
+    "happend": "happened",
+    "independant": "independent",
+    "lenght": "length",
+    "neccessary": "necessary",
+    "occassion": "occasion",
+    "occured": "occurred",
+    "occurence": "occurrence",
+    "paramter": "parameter",
+    "persistant": "persistent",
+    "posession": "possession",
+    "prefered": "preferred",
+    "publically": "publicly",
+    "recieve": "receive",
+    "recieved": "received",
+    "reccomend": "recommend",
+    "refered": "referred",
+    "relevent": "relevant",
+    "retreive": "retrieve",
+    "seperate": "separate",
+    "seperately": "separately",
+    "similiar": "similar",
+    "succesful": "successful",
+    "sucessful": "successful",
+    "supercede": "supersede",
+    "teh": "the",
+    "thier": "their",
+    "threshhold": "threshold",
+    "tommorow": "tomorrow",
+    "truely": "truly",
+    "untill": "until",
+    "wich": "which",
+    "wierd": "weird",
+    "writting": "writing",
+}
+
+MISSPELLINGS_PT = {
+    "analizar": "analisar",
+    "asterístico": "asterisco",
+    "atravez": "através",
+    "beneficiente": "beneficente",
+    "cabeçário": "cabeçalho",
+    "concerteza": "com certeza",
+    "derrepente": "de repente",
+    "entertido": "entretido",
+    "esteje": "esteja",
+    "excessão": "exceção",
+    "impecilho": "empecilho",
+    "iorgute": "iogurte",
+    "menas": "menos",
+    "mendingo": "mendigo",
+    "metereologia": "meteorologia",
+    "paralização": "paralisação",
+    "pesquiza": "pesquisa",
+    "poblema": "problema",
+    "porisso": "por isso",
+    "previlégio": "privilégio",
+    "seje": "seja",
+    "sombrancelha": "sobrancelha",
+}
+
+COMMON_WORDS_EN = """
+a about above after again against all also an and any are as at be because been
+before being below between both but by can could did do does doing down during
+each few for from further had has have having he her here hers him his how i if
+in into is it its itself just me more most my no nor not now of off on once only
+or other our out over own same she should so some such than that the their them
+then there these they this those through to too under until up very was we were
+what when where which while who whom why will with would you your
+able access add added allows another application applications approach based
+basic best better build built called case change class clear code common complex
+concept concepts content control create created data default define defined
+different does each easy email emails end error errors example examples feature
+features file files first following function functions get given good great help
+high however important include includes information input language languages
+learn learning list long make makes many method methods model module modules must
+need new next number object objects often one output part performance popular
+problem problems process program programming programs provides read receive
+regularly result results return run same section see set should simple since
+software source step steps student students support system systems take test
+tests text time two type types use used useful user users uses using value values
+version way well well-written work works write written year years
+""".split()
+
+COMMON_WORDS_PT = """
+a ao aos as à às com como da das de do dos e é ela elas ele eles em entre era essa
+esse esta este estas estes eu foi for isso isto já lhe mais mas me mesmo muito na
+nas nem no nos não o os ou para pela pelas pelo pelos por qual quando que quem se
+sem ser seu seus sua suas são também te tem têm um uma umas uns você vocês
+aluno alunos ambiente aplicação aplicações aprender aprendizado atividade aula
+aulas base bem caso código conceito conceitos conteúdo conteúdos curso dados
+desenvolvimento disciplina dois erro erros estudo exemplo exemplos exercício forma
+função funções importante informação linguagem linguagens lista material método
+métodos modelo módulo novo novos objeto objetos parte pode podem problema
+problemas processo programa programação projeto projetos qualidade resultado
+resultados sistema sistemas texto tipo tipos trabalho uso usar usado usuário
+usuários valor valores versão vez
+""".split()
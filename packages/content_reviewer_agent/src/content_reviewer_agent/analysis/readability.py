@@ -0,0 +1,251 @@
+"""Vectorised readability metrics for EN and PT-BR text."""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+_PARAGRAPH = re.compile(r"\S[^\n]*(?:\n(?![ \t]*\n)[^\n]*)*")
+_SENTENCE = re.compile(r"[^\s.!?][^.!?]*[.!?]*")
+_WORD = re.compile(r"[A-Za-zÀ-ÖØ-öø-ÿ]+(?:['’-][A-Za-zÀ-ÖØ-öø-ÿ]+)*")
+
+_PASSIVE = {
+    "en": re.compile(
+        r"\b(?:am|is|are|was|were|be|been|being)\s+(?:\w+ly\s+)?\w+(?:ed|en)\b",
+        re.IGNORECASE,
+    ),
+    "pt": re.compile(
+        r"\b(?:é|são|foi|foram|era|eram|será|serão|sido|ser|seja|sejam)\s+"
+        r"(?:\w+mente\s+)?\w+(?:ad|id)[oa]s?\b",
+        re.IGNORECASE,
+    ),
+}
+
+_MARKERS = {
+    "en": frozenset("the and is are of to that with this it for".split()),
+    "pt": frozenset("de que não uma um para com os o é são do da em no na".split()),
+}
+
+#: Flesch reading ease constants; Portuguese uses the Martins et al. adaptation
+FLESCH_BASE = {"en": 206.835, "pt": 248.835}
+FLESCH_SENTENCE_WEIGHT = 1.015
+FLESCH_SYLLABLE_WEIGHT = 84.6
+
+#: Words at least this long count as jargon
+JARGON_MIN_LENGTH = 13
+
+#: Sentences with fewer words, such as headings, are never complex
+COMPLEX_MIN_WORDS = 3
+
+_VOWELS = np.array([ord(c) for c in "aeiouyAEIOUYáéíóúâêôãõàüÁÉÍÓÚÂÊÔÃÕÀÜ"])
+_UPPER = (ord("A"), ord("Z"))
+
+
+@dataclass
+class ReadabilityReport:
+    """Per-sentence and per-paragraph readability metrics of a text.
+
+    Array attributes are indexed by sentence (``sentence_*``) or paragraph
+    (``paragraph_*``); spans are ``(start, end)`` character offsets.
+    """
+
+    language: str
+    sentence_spans: np.ndarray
+    sentence_paragraph: np.ndarray
+    sentence_words: np.ndarray
+    sentence_syllables: np.ndarray
+    sentence_passive: np.ndarray
+    sentence_jargon: np.ndarray
+    sentence_score: np.ndarray
+    paragraph_spans: np.ndarray
+    paragraph_words: np.ndarray
+    paragraph_sentences: np.ndarray
+    paragraph_score: np.ndarray
+    score: float
+
+    @property
+    def sentence_jargon_density(self) -> np.ndarray:
+        """Fraction of jargon words per sentence."""
+        density: np.ndarray = self.sentence_jargon / np.maximum(self.sentence_words, 1)
+        return density
+
+    def complex_sentences(self, min_score: float, jargon_density: float) -> np.ndarray:
+        """Find sentences that are hard to read.
+
+        Sentences under ``COMPLEX_MIN_WORDS`` words, such as headings, are
+        left out: one long word already scores as hard to read.
+
+        Args:
+            min_score: Reading ease below which a sentence is complex
+            jargon_density: Jargon fraction from which a sentence is complex
+
+        Returns:
+            Indices of complex sentences
+        """
+        mask = (
+            (self.sentence_score < min_score)
+            | (self.sentence_passive > 0)
+            | (self.sentence_jargon_density >= jargon_density)
+        )
+        return np.flatnonzero(mask & (self.sentence_words >= COMPLEX_MIN_WORDS))
+
+    def summary(self) -> dict:
+        """Get document-level totals."""
+        words = int(self.sentence_words.sum())
+        return {
+            "language": self.language,
+            "reading_ease": round(self.score, 1),
+            "sentences": len(self.sentence_words),
+            "paragraphs": len(self.paragraph_words),
+            "words": words,
+            "avg_sentence_words": round(words / max(len(self.sentence_words), 1), 1),
+            "passive_sentences": int((self.sentence_passive > 0).sum()),
+        }
+
+
+def detect_language(text: str) -> str:
+    """Guess whether a text is English or Portuguese.
+
+    Args:
+        text: Text to inspect
+
+    Returns:
+        ``"en"`` or ``"pt"``
+    """
+    counts = dict.fromkeys(_MARKERS, 0)
+    for match in _WORD.finditer(text[:20000]):
+        word = match.group().lower()
+        for language, markers in _MARKERS.items():
+            counts[language] += word in markers
+    return "pt" if counts["pt"] > counts["en"] else "en"
+
+
+def _spans(pattern: re.Pattern, text: str, start: int, end: int) -> list:
+    """List the stripped spans of a pattern's matches within a range."""
+    spans = []
+    for match in pattern.finditer(text, start, end):
+        stripped = len(match.group().rstrip())
+        if stripped:
+            spans.append((match.start(), match.start() + stripped))
+    return spans
+
+
+def _flesch(language: str, words, sentences, syllables):
+    """Flesch reading ease for scalars or arrays of counts."""
+    words = np.maximum(words, 1)
+    return (
+        FLESCH_BASE[language]
+        - FLESCH_SENTENCE_WEIGHT * words / np.maximum(sentences, 1)
+        - FLESCH_SYLLABLE_WEIGHT * syllables / words
+    )
+
+
+def analyse_readability(text: str, language: Optional[str] = None) -> ReadabilityReport:
+    """Compute readability metrics in a single pass over a text.
+
+    Regexes find the paragraph, sentence and word boundaries; everything else
+    is computed with array operations over the code points of the text.
+    Syllables are approximated by vowel groups.
+
+    Args:
+        text: Text to analyse
+        language: ``"en"`` or ``"pt"``; detected when omitted
+
+    Returns:
+        Readability report
+    """
+    language = language or detect_language(text)
+
+    paragraphs = _spans(_PARAGRAPH, text, 0, len(text))
+    sentences: List[Tuple[int, int]] = []
+    paragraph_of: List[int] = []
+    for index, (start, end) in enumerate(paragraphs):
+        found = _spans(_SENTENCE, text, start, end)
+        sentences.extend(found)
+        paragraph_of.extend([index] * len(found))
+    paragraph_spans = np.array(paragraphs, dtype=np.int64).reshape(-1, 2)
+    sentence_spans = np.array(sentences, dtype=np.int64).reshape(-1, 2)
+    sentence_paragraph = np.array(paragraph_of, dtype=np.int64)
+    n_sentences, n_paragraphs = len(sentence_spans), len(paragraph_spans)
+
+    words = np.array(
+        [match.span() for match in _WORD.finditer(text)], dtype=np.int64
+    ).reshape(-1, 2)
+    starts, ends = words[:, 0], words[:, 1]
+
+    # Code point arrays: prefix sums give per-word counts in O(1)
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    vowel = np.isin(codes, _VOWELS)
+    group_start = vowel & ~np.concatenate(([False], vowel[:-1]))
+    groups = np.concatenate(([0], np.cumsum(group_start)))
+    upper = (codes >= _UPPER[0]) & (codes <= _UPPER[1])
+    uppers = np.concatenate(([0], np.cumsum(upper)))
+
+    syllables = groups[ends] - groups[starts]
+    if language == "en":
+        silent_e = (codes[ends - 1] == ord("e")) & (syllables > 1)
+        syllables = syllables - silent_e
+    syllables = np.maximum(syllables, 1)
+
+    lengths = ends - starts
+    upper_count = uppers[ends] - uppers[starts]
+    acronym = (upper_count == lengths) & (lengths >= 2)
+    camel = (upper_count - upper[starts] > 0) & ~acronym
+    jargon = acronym | camel | (lengths >= JARGON_MIN_LENGTH)
+
+    # Assign words to the sentence whose span contains them
+    owner = np.searchsorted(sentence_spans[:, 0], starts, side="right") - 1
+    inside = owner >= 0
+    inside[inside] = starts[inside] < sentence_spans[owner[inside], 1]
+    owner = owner[inside]
+
+    sentence_words = np.bincount(owner, minlength=n_sentences)
+    sentence_syllables = np.bincount(
+        owner, weights=syllables[inside], minlength=n_sentences
+    )
+    sentence_jargon = np.bincount(
+        owner, weights=jargon[inside], minlength=n_sentences
+    ).astype(np.int64)
+
+    passive_starts = np.array(
+        [match.start() for match in _PASSIVE[language].finditer(text)],
+        dtype=np.int64,
+    )
+    passive_owner = (
+        np.searchsorted(sentence_spans[:, 0], passive_starts, side="right") - 1
+    )
+    sentence_passive = np.bincount(
+        passive_owner[passive_owner >= 0], minlength=n_sentences
+    )
+
+    paragraph_words = np.bincount(
+        sentence_paragraph, weights=sentence_words, minlength=n_paragraphs
+    ).astype(np.int64)
+    paragraph_syllables = np.bincount(
+        sentence_paragraph, weights=sentence_syllables, minlength=n_paragraphs
+    )
+    paragraph_sentences = np.bincount(sentence_paragraph, minlength=n_paragraphs)
+    score = 0.0
+    if len(owner):
+        score = float(
+            _flesch(language, len(owner), n_sentences, sentence_syllables.sum())
+        )
+
+    return ReadabilityReport(
+        language=language,
+        sentence_spans=sentence_spans,
+        sentence_paragraph=sentence_paragraph,
+        sentence_words=sentence_words,
+        sentence_syllables=sentence_syllables.astype(np.int64),
+        sentence_passive=sentence_passive,
+        sentence_jargon=sentence_jargon,
+        sentence_score=_flesch(language, sentence_words, 1, sentence_syllables),
+        paragraph_spans=paragraph_spans,
+        paragraph_words=paragraph_words,
+        paragraph_sentences=paragraph_sentences,
+        paragraph_score=_flesch(
+            language, paragraph_words, paragraph_sentences, paragraph_syllables
+        ),
+        score=score,
+    )
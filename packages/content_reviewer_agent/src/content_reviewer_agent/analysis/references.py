@@ -0,0 +1,100 @@
+"""Extraction of links, DOIs and bibliographic citations from text."""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+_URL = re.compile(r"https?://[^\s<>\"'`\]\[{}|\\^]+", re.IGNORECASE)
+_DOI = re.compile(r"\b(?:doi:\s*)?(10\.\d{4,9}/[^\s\"'<>\]]+)", re.IGNORECASE)
+_DOI_HOSTS = ("doi.org/", "dx.doi.org/")
+_TRAILING = ".,;:!?'\""
+
+_NAME = r"[A-ZÀ-Ý][\w'’-]+"
+# (Silva, 2020), (Smith and Jones, 2019), (Souza et al., 2021a)
+_AUTHOR_YEAR = re.compile(
+    rf"\(({_NAME}(?:\s+(?:et\s+al\.|and|e|&)\s*(?:{_NAME})?)*),?\s+"
+    r"((?:19|20)\d{2}[a-z]?)(?:,\s*p+\.\s*[\d-]+)?\)"
+)
+# ABNT reference entries: SILVA, J. Título. Editora, 2020.
+_ABNT = re.compile(
+    r"^[ \t]*([A-ZÀ-Ý]{2,}(?:\s[A-ZÀ-Ý]{2,})*),\s+[A-ZÀ-Ý][^\n]*?\b((?:19|20)\d{2})\b",
+    re.MULTILINE,
+)
+
+
+@dataclass(frozen=True)
+class Reference:
+    """A reference found in a text.
+
+    ``kind`` is ``"url"``, ``"doi"`` or ``"citation"``. ``target`` is the
+    URL to check for links and DOIs, and None for citations.
+    """
+
+    kind: str
+    text: str
+    start: int
+    end: int
+    target: Optional[str] = None
+    year: Optional[int] = None
+
+
+def _strip_url(url: str) -> str:
+    """Drop punctuation that ends the sentence around a URL."""
+    url = url.rstrip(_TRAILING)
+    # Keep balanced parentheses, e.g. Wikipedia titles, but not a wrapping one
+    while url.endswith(")") and url.count(")") > url.count("("):
+        url = url[:-1].rstrip(_TRAILING)
+    return url
+
+
+def extract_references(text: str) -> List[Reference]:
+    """Find links, DOIs and citations in a text.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        References in order of appearance
+    """
+    references: List[Reference] = []
+    taken: List[range] = []
+
+    for match in _URL.finditer(text):
+        url = _strip_url(match.group())
+        end = match.start() + len(url)
+        lower = url.lower()
+        host_path = lower.split("://", 1)[1]
+        kind = "doi" if host_path.startswith(_DOI_HOSTS) else "url"
+        references.append(Reference(kind, url, match.start(), end, url))
+        taken.append(range(match.start(), end))
+
+    for match in _DOI.finditer(text):
+        if any(match.start() in span for span in taken):
+            continue
+        doi = _strip_url(match.group(1))
+        end = match.start(1) + len(doi)
+        references.append(
+            Reference(
+                "doi",
+                text[match.start() : end],
+                match.start(),
+                end,
+                f"https://doi.org/{doi}",
+            )
+        )
+
+    for pattern in (_AUTHOR_YEAR, _ABNT):
+        for match in pattern.finditer(text):
+            year = int(match.group(2)[:4])
+            references.append(
+                Reference(
+                    "citation",
+                    match.group().strip(),
+                    match.start() + len(match.group()) - len(match.group().lstrip()),
+                    match.end(),
+                    year=year,
+                )
+            )
+
+    references.sort(key=lambda reference: reference.start)
+    return references
@@ -0,0 +1,261 @@
+"""Local rule-based spelling and grammar checker for EN and PT-BR."""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from content_reviewer_agent.analysis.lexicon import (
+    COMMON_WORDS_EN,
+    COMMON_WORDS_PT,
+    MISSPELLINGS_EN,
+    MISSPELLINGS_PT,
+)
+
+_WORD = re.compile(r"[A-Za-zÀ-ÖØ-öø-ÿ]+(?:['’-][A-Za-zÀ-ÖØ-öø-ÿ]+)*")
+_SENTENCE = re.compile(r"[^.!?\n]+(?:[.!?]+|$)", re.MULTILINE)
+
+#: Sentences longer than this are forwarded to the model as suspect
+MAX_DECIDABLE_WORDS = 40
+
+#: Rule hits below this confidence also forward their sentence to the model
+SUSPECT_CONFIDENCE = 0.8
+
+
+class Trie:
+    """Character trie mapping words to an optional payload."""
+
+    _END = ""
+
+    def __init__(self) -> None:
+        """Initialize an empty trie."""
+        self._root: Dict[str, Any] = {}
+
+    def insert(self, word: str, value: object = True) -> None:
+        """Add a word with its payload."""
+        node = self._root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[self._END] = value
+
+    def get(self, word: str) -> Optional[object]:
+        """Get the payload of a word, or None if absent."""
+        node = self._root
+        for char in word:
+            child = node.get(char)
+            if child is None:
+                return None
+            node = child
+        return node.get(self._END)
+
+    def __contains__(self, word: str) -> bool:
+        """Check whether a word is in the trie."""
+        return self.get(word) is not None
+
+
+@dataclass(frozen=True)
+class GrammarRule:
+    """Regex rule reporting a grammar issue."""
+
+    pattern: re.Pattern
+    description: str
+    fix: str
+    confidence: float = 0.8
+    #: Words group 2 must belong to, for rules valid in one language only
+    requires: Optional[FrozenSet[str]] = None
+    #: Words group 1 may not be, for matches that are sometimes grammatical
+    excludes: FrozenSet[str] = frozenset()
+
+    def applies(self, match: re.Match) -> bool:
+        """Check the rule's vocabulary conditions on a match."""
+        if match.group(1).lower() in self.excludes:
+            return False
+        return self.requires is None or match.group(2).lower() in self.requires
+
+    def suggest(self, match: re.Match) -> str:
+        """Build the suggested fix for a match."""
+        return match.expand(self.fix)
+
+
+GRAMMAR_RULES = [
+    GrammarRule(
+        re.compile(r"\b([^\W\d_]+)\s+\1\b", re.IGNORECASE),
+        "Repeated word",
+        r"\1",
+        0.9,
+        # "I know that that works", "she had had enough"
+        excludes=frozenset({"that", "had"}),
+    ),
+    GrammarRule(
+        re.compile(r"\b([Aa]) ([aeio][a-z]+)\b"),
+        "Use 'an' before a word starting with a vowel sound",
+        r"\1n \2",
+        # "a" is also the Portuguese article, so only English words count
+        requires=frozenset(COMMON_WORDS_EN) - frozenset(COMMON_WORDS_PT) - {"one"},
+    ),
+    GrammarRule(
+        re.compile(r"\b(could|should|would|must) of\b", re.IGNORECASE),
+        "Modal verbs take 'have', not 'of'",
+        r"\1 have",
+        0.9,
+    ),
+    GrammarRule(
+        re.compile(r"\b([Yy])our welcome\b"),
+        "Use the contraction 'you're'",
+        r"\1ou're welcome",
+    ),
+    GrammarRule(
+        re.compile(r"\b([Ff])azem (\d+|muitos|vários) (anos|meses|dias)\b"),
+        "'Fazer' indicating elapsed time is impersonal",
+        r"\1az \2 \3",
+        0.9,
+    ),
+    GrammarRule(
+        re.compile(r"\b([Hh])ouveram\b"),
+        "'Haver' meaning 'existir' is impersonal",
+        r"\1ouve",
+        0.7,
+    ),
+    GrammarRule(
+        re.compile(r"\b([Aa]o) meu ver\b"),
+        "The expression is 'a meu ver'",
+        r"a meu ver",
+        0.85,
+    ),
+]
+
+
+@dataclass(frozen=True)
+class LocalHit:
+    """An error found by the local checker."""
+
+    start: int
+    end: int
+    text: str
+    issue_type: str
+    description: str
+    suggestion: str
+    confidence: float
+
+
+@dataclass
+class CheckResult:
+    """Outcome of checking a text locally."""
+
+    hits: List[LocalHit] = field(default_factory=list)
+    #: Sentence spans the checker could not fully decide
+    undecided: List[Tuple[int, int]] = field(default_factory=list)
+
+
+def _match_case(original: str, replacement: str) -> str:
+    """Carry the capitalisation of a word over to its replacement."""
+    if original[:1].isupper():
+        return replacement[:1].upper() + replacement[1:]
+    return replacement
+
+
+class LocalErrorChecker:
+    """Dictionary and rule based checker that runs in milliseconds.
+
+    Known misspellings and grammar rules become hits directly. A sentence
+    is decided when every word is a known word or a known misspelling and
+    it is not suspiciously long; all other sentences are left for the model.
+    """
+
+    def __init__(self, extra_words: Iterable[str] = (), decide: bool = True):
+        """Build the dictionaries.
+
+        Args:
+            extra_words: Additional correct words, e.g. from a word list file
+            decide: Settle sentences made only of known words locally; when
+                False every sentence is left for the model
+        """
+        self.decide = decide
+        self.misspellings = Trie()
+        for wrong, right in {**MISSPELLINGS_EN, **MISSPELLINGS_PT}.items():
+            self.misspellings.insert(wrong, right)
+        self.known = Trie()
+        for word in (*COMMON_WORDS_EN, *COMMON_WORDS_PT, *extra_words):
+            self.known.insert(word.lower())
+
+    @classmethod
+    def from_word_list(cls, path: Optional[str]) -> "LocalErrorChecker":
+        """Build a checker extended with one word per line from a file.
+
+        The built-in lists only hold a few hundred common words, too few to
+        vouch for a sentence, so without a word list the checker reports
+        its hits but leaves every sentence for the model.
+
+        Args:
+            path: Word list path, or None for the built-in lists only
+
+        Returns:
+            Checker instance
+        """
+        if not path:
+            return cls(decide=False)
+        with open(path, encoding="utf-8") as handle:
+            return cls(line.strip() for line in handle if line.strip())
+
+    def check(self, text: str) -> CheckResult:
+        """Check a text.
+
+        Args:
+            text: Text to check
+
+        Returns:
+            Hits and the spans of sentences the model still has to review
+        """
+        result = CheckResult()
+        for sentence in _SENTENCE.finditer(text):
+            if not sentence.group().strip():
+                continue
+            decided = True
+            words = list(_WORD.finditer(text, sentence.start(), sentence.end()))
+            for index, word in enumerate(words):
+                lower = word.group().lower()
+                correction = self.misspellings.get(lower)
+                if correction is not None:
+                    result.hits.append(
+                        LocalHit(
+                            start=word.start(),
+                            end=word.end(),
+                            text=word.group(),
+                            issue_type="spelling",
+                            description=f"Spelling error: '{word.group()}'",
+                            suggestion=_match_case(word.group(), str(correction)),
+                            confidence=0.95,
+                        )
+                    )
+                elif lower not in self.known and not (
+                    index > 0 and word.group()[:1].isupper()
+                ):
+                    # Capitalised words mid-sentence are treated as names
+                    decided = False
+
+            for rule in GRAMMAR_RULES:
+                for match in rule.pattern.finditer(
+                    text, sentence.start(), sentence.end()
+                ):
+                    if not rule.applies(match):
+                        continue
+                    if rule.confidence < SUSPECT_CONFIDENCE:
+                        decided = False
+                    result.hits.append(
+                        LocalHit(
+                            start=match.start(),
+                            end=match.end(),
+                            text=match.group(),
+                            issue_type="grammar",
+                            description=rule.description,
+                            suggestion=rule.suggest(match),
+                            confidence=rule.confidence,
+                        )
+                    )
+
+            if not (self.decide and decided) or len(words) > MAX_DECIDABLE_WORDS:
+                start = sentence.start() + (
+                    len(sentence.group()) - len(sentence.group().lstrip())
+                )
+                result.undecided.append((start, sentence.end()))
+        result.hits.sort(key=lambda hit: hit.start)
+        return result
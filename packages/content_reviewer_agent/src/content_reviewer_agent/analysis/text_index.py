@@ -0,0 +1,348 @@
+"""Positional index resolving quoted passages to spans, lines and paragraphs."""
+
+import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from content_reviewer_agent.models.content import ReviewIssue
+
+#: Characters per gram of the positional index
+GRAM_SIZE = 4
+
+_WHITESPACE = re.compile(r"\s+")
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n\s*")
+
+# Typographic variants the model tends to swap when quoting
+_EQUIVALENTS = str.maketrans(
+    {
+        "‘": "'",
+        "’": "'",
+        "‚": "'",
+        "‛": "'",
+        "′": "'",
+        "`": "'",
+        "´": "'",
+        "“": '"',
+        "”": '"',
+        "„": '"',
+        "‟": '"',
+        "″": '"',
+        "«": '"',
+        "»": '"',
+        "‐": "-",
+        "‑": "-",
+        "‒": "-",
+        "–": "-",
+        "—": "-",
+        "−": "-",
+    }
+)
+
+
+def normalise_quote(text: str) -> str:
+    """Normalise a quoted passage the same way the index normalises text.
+
+    Whitespace runs become a single space, typographic quotes and dashes
+    become their ASCII forms and letters are lowercased.
+
+    Args:
+        text: Passage to normalise
+
+    Returns:
+        Normalised passage without surrounding whitespace
+    """
+    return _WHITESPACE.sub(" ", text).strip().translate(_EQUIVALENTS).lower()
+
+
+@dataclass(frozen=True)
+class TextSpan:
+    """A located passage; line and paragraph numbers start at 1."""
+
+    start: int
+    end: int
+    line: int
+    paragraph: int
+
+    @property
+    def location(self) -> str:
+        """Human-readable location of the passage."""
+        return (
+            f"line {self.line}, paragraph {self.paragraph}, "
+            f"chars {self.start}-{self.end}"
+        )
+
+
+class TextIndex:
+    """Index of one text for resolving quotes to exact positions.
+
+    The text is normalised once into a form where quoting differences do not
+    matter, keeping the original offset of every normalised character. An
+    n-gram positional index over the normalised text narrows each lookup to
+    the occurrences of the quote's rarest gram, so resolving many issues
+    against one long document does not rescan it per issue.
+    """
+
+    def __init__(self, text: str):
+        """Build the index.
+
+        Args:
+            text: Text to index
+        """
+        self.text = text
+        pieces: List[str] = []
+        offsets: List[int] = []
+        cursor = 0
+        for match in _WHITESPACE.finditer(text):
+            self._add_run(text, cursor, match.start(), pieces, offsets)
+            pieces.append(" ")
+            offsets.append(match.start())
+            cursor = match.end()
+        self._add_run(text, cursor, len(text), pieces, offsets)
+        self.normalised = "".join(pieces)
+        self._offsets = offsets
+        self._line_starts = [0] + [m.end() for m in re.finditer("\n", text)]
+        self._paragraph_starts = [0] + [
+            m.end() for m in _PARAGRAPH_BREAK.finditer(text)
+        ]
+        self._grams: Optional[Dict[str, List[int]]] = None
+
+    @staticmethod
+    def _add_run(
+        text: str, start: int, end: int, pieces: List[str], offsets: List[int]
+    ) -> None:
+        """Append the normalised form of a run without whitespace."""
+        if start >= end:
+            return
+        run = text[start:end].translate(_EQUIVALENTS).lower()
+        if len(run) != end - start:
+            # Lowercasing changed the length (e.g. "İ"); keep one char each
+            run = "".join(char.lower()[0] for char in text[start:end])
+            run = run.translate(_EQUIVALENTS)
+        pieces.append(run)
+        offsets.extend(range(start, end))
+
+    @property
+    def grams(self) -> Dict[str, List[int]]:
+        """Positions of every gram of the normalised text, built on first use."""
+        if self._grams is None:
+            grams: Dict[str, List[int]] = defaultdict(list)
+            normalised = self.normalised
+            for position in range(len(normalised) - GRAM_SIZE + 1):
+                grams[normalised[position : position + GRAM_SIZE]].append(position)
+            self._grams = dict(grams)
+        return self._grams
+
+    def _find_normalised(self, quote: str) -> List[int]:
+        """Find every start of a normalised quote in the normalised text."""
+        normalised = self.normalised
+        if len(quote) < GRAM_SIZE:
+            starts = []
+            position = normalised.find(quote)
+            while position >= 0:
+                starts.append(position)
+                position = normalised.find(quote, position + 1)
+            return starts
+
+        grams = self.grams
+        best: Optional[Tuple[int, List[int]]] = None
+        for shift in range(len(quote) - GRAM_SIZE + 1):
+            positions = grams.get(quote[shift : shift + GRAM_SIZE])
+            if positions is None:
+                return []
+            if best is None or len(positions) < len(best[1]):
+                best = (shift, positions)
+        # The quote holds at least one gram, so the loop set a best shift
+        assert best is not None
+        shift, positions = best
+        return [
+            position - shift
+            for position in positions
+            if position >= shift and normalised.startswith(quote, position - shift)
+        ]
+
+    def span(self, start: int, end: int) -> TextSpan:
+        """Describe a span of the text with its line and paragraph.
+
+        Args:
+            start: Start offset in the text
+            end: End offset in the text
+
+        Returns:
+            The span with line and paragraph numbers
+        """
+        return TextSpan(
+            start,
+            end,
+            bisect_right(self._line_starts, start),
+            bisect_right(self._paragraph_starts, start),
+        )
+
+    def find_all(self, quote: Optional[str]) -> List[TextSpan]:
+        """Find every occurrence of a quoted passage.
+
+        Args:
+            quote: Passage as quoted, possibly with different whitespace,
+                quotes, dashes or case
+
+        Returns:
+            Spans of the occurrences in the original text, in order
+        """
+        normalised = normalise_quote(quote or "")
+        if not normalised:
+            return []
+        offsets = self._offsets
+        return [
+            self.span(offsets[start], offsets[start + len(normalised) - 1] + 1)
+            for start in self._find_normalised(normalised)
+        ]
+
+    def locate(
+        self,
+        quote: Optional[str],
+        start: int = 0,
+        end: Optional[int] = None,
+        strict: bool = False,
+    ) -> Optional[TextSpan]:
+        """Resolve a quoted passage to its position in the text.
+
+        Occurrences inside ``[start, end)`` win over the others, and among
+        them a verbatim one wins over a normalised one. With no occurrence in
+        the range, the one nearest to it is used unless ``strict`` is set.
+
+        Args:
+            quote: Passage as quoted by an issue
+            start: Start of the region the issue was reported in
+            end: End of that region; defaults to the end of the text
+            strict: Only accept occurrences inside the region
+
+        Returns:
+            The span of the passage, or None if it does not occur
+        """
+        spans = self.find_all(quote)
+        if not spans:
+            return None
+        end = len(self.text) if end is None else end
+        inside = [span for span in spans if start <= span.start and span.end <= end]
+        if inside:
+            verbatim = [s for s in inside if self.text[s.start : s.end] == quote]
+            return (verbatim or inside)[0]
+        if strict:
+            return None
+        return min(
+            spans,
+            key=lambda span: (
+                start - span.end if span.end <= start else span.start - end
+            ),
+        )
+
+    def place_issue(self, issue: ReviewIssue, start: int, end: int) -> ReviewIssue:
+        """Set an issue's offsets, line, paragraph and location.
+
+        Args:
+            issue: Issue to update in place
+            start: Start offset in the text
+            end: End offset in the text
+
+        Returns:
+            The issue
+        """
+        span = self.span(start, end)
+        issue.start_offset, issue.end_offset = span.start, span.end
+        issue.line, issue.paragraph = span.line, span.paragraph
+        issue.location = span.location
+        return issue
+
+    def locate_issue(
+        self,
+        issue: ReviewIssue,
+        start: int = 0,
+        end: Optional[int] = None,
+        strict: bool = False,
+    ) -> bool:
+        """Resolve an issue's quoted text and place the issue there.
+
+        Args:
+            issue: Issue to update in place
+            start: Start of the region the issue was reported in
+            end: End of that region; defaults to the end of the text
+            strict: Only accept occurrences inside the region
+
+        Returns:
+            True if the quote was found
+        """
+        span = self.locate(issue.original_text, start, end, strict)
+        if span is None:
+            return False
+        self.place_issue(issue, span.start, span.end)
+        return True
+
+    def resolve_issues(self, issues: List[ReviewIssue]) -> int:
+        """Locate unlocated issues and refresh the positions of located ones.
+
+        Args:
+            issues: Issues reported against the indexed text
+
+        Returns:
+            Number of issues left without a position
+        """
+        unresolved = 0
+        size = len(self.text)
+        for issue in issues:
+            if (
+                issue.start_offset is not None
+                and issue.end_offset is not None
+                and issue.end_offset <= size
+            ):
+                self.place_issue(issue, issue.start_offset, issue.end_offset)
+            elif not self.locate_issue(issue):
+                unresolved += 1
+        return unresolved
+
+    def __len__(self) -> int:
+        """Length of the indexed text."""
+        return len(self.text)
+
+
+class TextIndexCache:
+    """Least-recently-used indexes keyed by the text they cover."""
+
+    def __init__(self, max_entries: int = 16):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Indexes kept before the oldest is dropped
+        """
+        self.max_entries = max_entries
+        self._indexes: "OrderedDict[str, TextIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    def get(self, text: str) -> TextIndex:
+        """Get the index of a text, building it on first use.
+
+        Args:
+            text: Text to index
+
+        Returns:
+            The shared index
+        """
+        with self._lock:
+            index = self._indexes.get(text)
+            if index is not None:
+                self._indexes.move_to_end(text)
+                return index
+        index = TextIndex(text)
+        with self._lock:
+            self.builds += 1
+            self._indexes[text] = index
+            while len(self._indexes) > self.max_entries:
+                self._indexes.popitem(last=False)
+        return index
+
+    def clear(self) -> None:
+        """Drop every index."""
+        with self._lock:
+            self._indexes.clear()
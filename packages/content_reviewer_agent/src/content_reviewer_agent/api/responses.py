@@ -0,0 +1,23 @@
+"""JSON responses serialised in one pass by pydantic-core."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered straight to bytes by pydantic-core's encoder.
+
+    Returning it from a route skips FastAPI's re-validation of the result
+    against ``response_model`` and its ``jsonable_encoder`` pass, which
+    builds an intermediate dict per issue before ``json.dumps``. The route's
+    ``response_model`` still documents the schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialise a model, or any JSON-compatible value, to bytes."""
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        return to_json(content)
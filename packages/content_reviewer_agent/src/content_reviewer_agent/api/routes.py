@@ -1,17 +1,95 @@
 """API routes for content review."""
 
-from typing import Optional
+import os
+from typing import TYPE_CHECKING, Any, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
 
-from content_reviewer_agent.models.content import Content
-from content_reviewer_agent.models.review_result import ReviewResult, ReviewType
-from content_reviewer_agent.services.review_service import ContentReviewService
+from content_reviewer_agent import storage
+from content_reviewer_agent.analysis.extraction import ExtractionError
+from content_reviewer_agent.api.responses import FastJSONResponse
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.content import Content, ContentType
+from content_reviewer_agent.models.review_result import (
+    BatchReviewRequest,
+    ReviewResult,
+    ReviewStatus,
+    ReviewType,
+)
+from content_reviewer_agent.services.ingestion import (
+    DOCUMENT_TYPES,
+    DocumentTooLarge,
+    get_ingestor,
+)
+from content_reviewer_agent.services.jobs import ReviewJobQueue
+from content_reviewer_agent.services.scanner import CorpusScanner
+
+if TYPE_CHECKING:
+    from content_reviewer_agent.services.review_service import ContentReviewService
 
 router = APIRouter(tags=["content-review"])
 
-# Initialize service
-review_service = ContentReviewService()
+NO_CACHE_QUERY = Query(False, description="Bypass the review result cache")
+
+_review_service: Optional["ContentReviewService"] = None
+_job_queue: Optional[ReviewJobQueue] = None
+_scanner: Optional[CorpusScanner] = None
+
+
+def get_review_service() -> "ContentReviewService":
+    """Get the review service, importing and creating it on first use.
+
+    Deferred so that importing the application, and so binding the server,
+    does not wait for the agents and the model SDK to load.
+    """
+    global _review_service
+    if _review_service is None:
+        from content_reviewer_agent.services.review_service import (
+            ContentReviewService,
+        )
+
+        _review_service = ContentReviewService()
+    return _review_service
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``review_service`` to the lazily created service."""
+    if name == "review_service":
+        return get_review_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_job_queue() -> ReviewJobQueue:
+    """Get the review job queue, creating it on first use."""
+    global _job_queue
+    if _job_queue is None:
+        path = storage.resolve_sqlite_path(
+            settings.database_url, default=settings.default_database_path
+        )
+        # A default is given, so a path always resolves
+        assert path is not None
+        _job_queue = ReviewJobQueue(get_review_service(), path)
+    return _job_queue
+
+
+def get_scanner() -> CorpusScanner:
+    """Get the corpus scanner, creating it on first use."""
+    global _scanner
+    if _scanner is None:
+        _scanner = CorpusScanner(get_job_queue(), get_job_queue().path)
+    return _scanner
+
+
+def peek_job_queue() -> Optional[ReviewJobQueue]:
+    """Get the review job queue if it has been created."""
+    return _job_queue
+
+
+def peek_scanner() -> Optional[CorpusScanner]:
+    """Get the corpus scanner if it has been created."""
+    return _scanner
 
 
 @router.post("/review", response_model=ReviewResult)
@@ -21,6 +99,12 @@ async def review_content(
         ReviewType.FULL_REVIEW,
         description="Type of review to perform",
     ),
+    no_cache: bool = NO_CACHE_QUERY,
+    previous: Optional[str] = Query(
+        None,
+        description="review_id or content_id of an earlier version to "
+        "re-review incrementally",
+    ),
 ):
     """Review content with specified review type.
 
@@ -28,17 +112,270 @@ async def review_content(
         content: Content to review
         review_type: Type of review (full_review, error_detection, comprehension,
                      source_verification, content_update)
+        no_cache: Bypass the review cache
+        previous: Earlier version to diff against
 
     Returns:
         ReviewResult with issues found
     """
     try:
-        result = await review_service.review_content(content, review_type)
-        return result
+        result = await get_review_service().review_content(
+            content, review_type, use_cache=not no_cache, previous=previous
+        )
+        return FastJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/review/stream")
+async def review_content_stream(
+    content: Content,
+    review_type: Optional[ReviewType] = Query(
+        ReviewType.FULL_REVIEW,
+        description="Type of review to perform",
+    ),
+    no_cache: bool = NO_CACHE_QUERY,
+):
+    """Review content, streaming server-sent events as each agent finishes.
+
+    Emits one ``agent`` event per agent with its issues and timing, then a
+    ``result`` event with the complete ReviewResult.
+
+    Args:
+        content: Content to review
+        review_type: Type of review to perform
+        no_cache: Bypass the review cache
+
+    Returns:
+        Streaming ``text/event-stream`` response
+    """
+
+    async def stream():
+        async for event, payload in get_review_service().review_content_stream(
+            content, review_type, use_cache=not no_cache
+        ):
+            yield f"event: {event}\ndata: {to_json(payload).decode()}\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/review/batch")
+async def review_batch(
+    request: BatchReviewRequest,
+    concurrency: Optional[int] = Query(
+        None, ge=1, description="Maximum number of contents reviewed at once"
+    ),
+    no_cache: bool = NO_CACHE_QUERY,
+):
+    """Review many contents, streaming results as newline-delimited JSON.
+
+    Each line is a ReviewResult, written as soon as its review completes, so
+    results arrive in completion order rather than request order.
+
+    Args:
+        request: Contents and review type
+        concurrency: Maximum number of contents reviewed at once
+        no_cache: Bypass the review cache
+
+    Returns:
+        Streaming NDJSON response
+    """
+
+    async def stream():
+        async for result in get_review_service().review_batch(
+            request.contents,
+            request.review_type,
+            use_cache=not no_cache,
+            concurrency=concurrency,
+        ):
+            yield result.model_dump_json() + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+async def _ingest_document(
+    request: Request,
+    content_type: ContentType,
+    title: str,
+    discipline: Optional[str],
+) -> Content:
+    """Spool a raw document upload to disk and extract its text.
+
+    Args:
+        request: Request whose body is the document
+        content_type: PDF, HTML or SLIDE
+        title: Title of the content
+        discipline: Academic discipline
+
+    Returns:
+        Extracted content with its page map
+
+    Raises:
+        HTTPException: 415 for other content types, 413 for uploads over
+            ``settings.ingest_max_bytes``, 422 for unreadable documents
+    """
+    if content_type not in DOCUMENT_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Only {', '.join(sorted(t.value for t in DOCUMENT_TYPES))} "
+            "documents can be uploaded",
+        )
+    ingestor = get_ingestor()
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > ingestor.max_bytes:
+        raise HTTPException(
+            status_code=413, detail=f"Document exceeds {ingestor.max_bytes} bytes"
+        )
+    try:
+        path = await ingestor.save_upload(request.stream())
+    except DocumentTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    try:
+        content = await ingestor.extract(
+            path, content_type, title, discipline=discipline
+        )
+    except ExtractionError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    finally:
+        os.remove(path)
+    if not content.text:
+        raise HTTPException(status_code=422, detail="No text found in the document")
+    return content
+
+
+@router.post("/documents/extract", response_model=Content)
+async def extract_document(
+    request: Request,
+    content_type: ContentType = Query(..., description="pdf, html or slide"),
+    title: str = Query(..., description="Title of the content"),
+    discipline: Optional[str] = Query(None, description="Academic discipline"),
+):
+    """Extract the text of a raw PDF, HTML or PowerPoint upload.
+
+    The request body is the document itself. ``metadata.pages`` maps each
+    page or slide to the offset where its text starts.
+
+    Args:
+        request: Request whose body is the document
+        content_type: Type of the document
+        title: Title of the content
+        discipline: Academic discipline
+
+    Returns:
+        Content ready to be reviewed
+    """
+    content = await _ingest_document(request, content_type, title, discipline)
+    return FastJSONResponse(content)
+
+
+@router.post("/review/document", response_model=ReviewResult)
+async def review_document(
+    request: Request,
+    content_type: ContentType = Query(..., description="pdf, html or slide"),
+    title: str = Query(..., description="Title of the content"),
+    discipline: Optional[str] = Query(None, description="Academic discipline"),
+    review_type: ReviewType = Query(
+        ReviewType.FULL_REVIEW,
+        description="Type of review to perform",
+    ),
+    no_cache: bool = NO_CACHE_QUERY,
+):
+    """Extract and review a raw PDF, HTML or PowerPoint upload.
+
+    Issues carry the page, or slide, their text was found on.
+
+    Args:
+        request: Request whose body is the document
+        content_type: Type of the document
+        title: Title of the content
+        discipline: Academic discipline
+        review_type: Type of review to perform
+        no_cache: Bypass the review cache
+
+    Returns:
+        ReviewResult with issues found
+    """
+    content = await _ingest_document(request, content_type, title, discipline)
+    result = await get_review_service().review_content(
+        content, review_type, use_cache=not no_cache
+    )
+    return FastJSONResponse(result)
+
+
+@router.post("/jobs", response_model=ReviewResult, status_code=status.HTTP_202_ACCEPTED)
+async def submit_review_job(
+    content: Content,
+    review_type: ReviewType = Query(
+        ReviewType.FULL_REVIEW,
+        description="Type of review to perform",
+    ),
+    no_cache: bool = NO_CACHE_QUERY,
+):
+    """Queue a review and return immediately.
+
+    Args:
+        content: Content to review
+        review_type: Type of review to perform
+        no_cache: Bypass the review cache
+
+    Returns:
+        Pending ReviewResult whose review_id identifies the job
+    """
+    result = await get_job_queue().submit(content, review_type, use_cache=not no_cache)
+    return FastJSONResponse(result, status_code=status.HTTP_202_ACCEPTED)
+
+
+@router.get("/jobs/{review_id}", response_model=ReviewResult)
+async def get_review_job(review_id: str):
+    """Get the status, and once finished the result, of a review job.
+
+    Args:
+        review_id: ID returned when the job was queued
+
+    Returns:
+        ReviewResult in its current state
+    """
+    result = await get_job_queue().get(review_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Review job not found")
+    return FastJSONResponse(result)
+
+
+@router.delete("/jobs/{review_id}", response_model=ReviewResult)
+async def cancel_review_job(review_id: str):
+    """Cancel a pending or running review job.
+
+    Args:
+        review_id: ID returned when the job was queued
+
+    Returns:
+        ReviewResult with cancelled status
+    """
+    result = await get_job_queue().cancel(review_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Review job not found")
+    if result.status != ReviewStatus.CANCELLED:
+        raise HTTPException(status_code=409, detail="Review job already finished")
+    return FastJSONResponse(result)
+
+
+@router.post("/scan")
+async def scan_corpus():
+    """Scan the content roots and queue reviews of new and changed files.
+
+    Returns:
+        Counts of scanned files by outcome
+    """
+    if not get_scanner().roots:
+        raise HTTPException(status_code=400, detail="No scan roots configured")
+    report = await get_scanner().scan()
+    return report.to_dict()
+
+
 @router.get("/agents")
 async def get_agents():
     """Get information about available review agents.
@@ -47,58 +384,84 @@ async def get_agents():
         Dictionary with agent information
     """
     try:
-        return await review_service.get_agent_info()
+        return await get_review_service().get_agent_info()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/review/errors", response_model=ReviewResult)
-async def review_errors(content: Content):
+async def review_errors(content: Content, no_cache: bool = NO_CACHE_QUERY):
     """Review content for errors only.
 
     Args:
         content: Content to review
+        no_cache: Bypass the review cache
 
     Returns:
         ReviewResult with error issues
     """
-    return await review_service.review_content(content, ReviewType.ERROR_DETECTION)
+    result = await get_review_service().review_content(
+        content, ReviewType.ERROR_DETECTION, use_cache=not no_cache
+    )
+    return FastJSONResponse(result)
 
 
 @router.post("/review/comprehension", response_model=ReviewResult)
-async def review_comprehension(content: Content):
+async def review_comprehension(content: Content, no_cache: bool = NO_CACHE_QUERY):
     """Review content for comprehension improvements.
 
     Args:
         content: Content to review
+        no_cache: Bypass the review cache
 
     Returns:
         ReviewResult with comprehension issues
     """
-    return await review_service.review_content(content, ReviewType.COMPREHENSION)
+    result = await get_review_service().review_content(
+        content, ReviewType.COMPREHENSION, use_cache=not no_cache
+    )
+    return FastJSONResponse(result)
 
 
 @router.post("/review/sources", response_model=ReviewResult)
-async def review_sources(content: Content):
+async def review_sources(content: Content, no_cache: bool = NO_CACHE_QUERY):
     """Review content sources and citations.
 
     Args:
         content: Content to review
+        no_cache: Bypass the review cache
 
     Returns:
         ReviewResult with source issues
     """
-    return await review_service.review_content(content, ReviewType.SOURCE_VERIFICATION)
+    result = await get_review_service().review_content(
+        content, ReviewType.SOURCE_VERIFICATION, use_cache=not no_cache
+    )
+    return FastJSONResponse(result)
 
 
 @router.post("/review/updates", response_model=ReviewResult)
-async def review_updates(content: Content):
+async def review_updates(content: Content, no_cache: bool = NO_CACHE_QUERY):
     """Review content for outdated information.
 
     Args:
         content: Content to review
+        no_cache: Bypass the review cache
 
     Returns:
         ReviewResult with outdated content issues
     """
-    return await review_service.review_content(content, ReviewType.CONTENT_UPDATE)
+    result = await get_review_service().review_content(
+        content, ReviewType.CONTENT_UPDATE, use_cache=not no_cache
+    )
+    return FastJSONResponse(result)
+
+
+@router.get("/metrics")
+async def get_metrics():
+    """Get runtime metrics such as review cache hits and misses.
+
+    Returns:
+        Dictionary with metrics
+    """
+    return get_review_service().get_metrics()
@@ -1,6 +1,6 @@
 """Configuration settings for content reviewer agent."""
 
-from typing import Optional
+from typing import List, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -26,10 +26,117 @@ class Settings(BaseSettings):
 
     # Agent Configuration
     max_retries: int = 3
+    retry_base_delay_seconds: float = 1.0
+    retry_max_delay_seconds: float = 30.0
+    circuit_breaker_enabled: bool = True
+    circuit_failure_threshold: int = 5
+    circuit_reset_seconds: float = 30.0
     timeout_seconds: int = 120
+    # Shared genai HTTP pool. HTTP/2 is used when the h2 package is
+    # installed; genai_warm_connections are opened at startup when an API
+    # key is configured.
+    genai_max_connections: int = 32
+    genai_max_keepalive: int = 16
+    genai_keepalive_seconds: float = 120.0
+    genai_http2: bool = True
+    genai_warm_connections: int = 4
+    # Model cascade: every prompt goes to cascade_fast_model first. Only the
+    # sentences holding issues below cascade_confidence_threshold go on to
+    # google_model_name, or the whole prompt if the response is invalid.
+    # cascade_fast_cost_ratio is the fast model's cost per token relative to
+    # the main model, used to estimate savings.
+    cascade_enabled: bool = False
+    cascade_fast_model: str = "gemini-2.5-flash-lite"
+    cascade_confidence_threshold: float = 0.7
+    cascade_fast_cost_ratio: float = 0.25
+    rate_limit_enabled: bool = True
+    rate_limit_rpm: int = 1000
+    rate_limit_tpm: int = 1000000
+    concurrent_agents: bool = True
+    max_concurrent_model_calls: int = 16
+    chunk_max_tokens: int = 6000
+    chunk_overlap_tokens: int = 200
+    # Prompt compaction: normalise whitespace, keep repeated boilerplate lines
+    # once and summarise code blocks for agents that ignore code. Whole
+    # prompts are cut to prompt_token_budget (estimated tokens).
+    prompt_compaction: bool = True
+    prompt_token_budget: int = 8000
+    merge_duplicate_issues: bool = True
+    duplicate_similarity: float = 0.8
+    # Indexes that resolve quoted issue text to positions, one per text
+    text_index_cache_size: int = 16
+    review_history_size: int = 256
+    # Concurrent reviews of the same content by the same agents share one
+    # execution, and every caller gets its result
+    coalesce_reviews: bool = True
+    batch_concurrency: int = 8
+    # Local spelling/grammar rules ahead of the model for error detection.
+    # local_dictionary_path: word list (one word per line). Sentences are
+    # only kept from the model when every word is in it; without one the
+    # rules still report their hits but every sentence goes to the model.
+    local_error_filter: bool = True
+    local_dictionary_path: Optional[str] = None
+    # Local readability metrics ahead of the model for comprehension review.
+    # Only sentences below readability_min_score (Flesch reading ease), in
+    # the passive voice or over the jargon density go to the model.
+    local_readability_filter: bool = True
+    readability_min_score: float = 40.0
+    jargon_density_threshold: float = 0.2
+    long_sentence_words: int = 30
+    dense_paragraph_words: int = 150
+    # Deprecated-technology catalogue for content update review; defaults to
+    # the catalogue shipped with the package and reloads when the file changes
+    local_update_filter: bool = True
+    deprecation_catalogue_path: Optional[str] = None
+    # Local parsing of code content: syntax errors are reported without the
+    # model, and only comments, docstrings and declared names go to the
+    # prose agents; deprecated APIs are matched on names resolved through
+    # the imports
+    local_code_analysis: bool = True
+    # Link and DOI checks for source verification
+    link_check_enabled: bool = True
+    link_check_max_links: int = 50
+    link_check_per_host: int = 4
+    link_check_max_connections: int = 32
+    link_check_timeout_seconds: float = 10.0
+    link_check_ttl_seconds: int = 3600
+    # Links are only checked at public addresses; hosts listed here are
+    # requested even when they resolve to a private or loopback address
+    link_check_allowed_hosts: List[str] = []
 
-    # Database (placeholder for future use)
+    # Job Queue Configuration
+    job_workers: int = 2
+    job_poll_interval_seconds: float = 1.0
+    # Running jobs are leased to their process and renewed while they run;
+    # jobs of a process that died are claimed again once the lease expires
+    job_lease_seconds: float = 60.0
+
+    # Corpus Scanner Configuration. Files below scan_roots are fingerprinted
+    # in the database and new or changed ones are queued as review jobs,
+    # every scan_interval_seconds (0: only on POST /scan).
+    scan_roots: List[str] = []
+    scan_interval_seconds: float = 0.0
+    scan_workers: int = 8
+    scan_review_type: str = "full_review"
+
+    # Document Ingestion Configuration. Uploaded PDF, PowerPoint and HTML
+    # files are spooled to disk up to ingest_max_bytes; their text is
+    # extracted by ingest_workers processes, ingest_pages_per_task pages at a
+    # time, up to ingest_max_chars characters.
+    ingest_workers: int = 2
+    ingest_max_bytes: int = 512 * 1024 * 1024
+    ingest_max_chars: int = 2_000_000
+    ingest_pages_per_task: int = 8
+
+    # Review Cache Configuration
+    review_cache_enabled: bool = True
+    review_cache_max_entries: int = 1024
+    review_cache_ttl_seconds: int = 86400
+
+    # Database (SQLite URL or path). Enables the persistent cache tier; the
+    # job queue falls back to default_database_path when unset.
     database_url: Optional[str] = None
+    default_database_path: str = "content_reviewer.db"
 
 
 settings = Settings()
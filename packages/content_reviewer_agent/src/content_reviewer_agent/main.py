@@ -1,13 +1,61 @@
 """FastAPI application for content reviewer agent."""
 
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 
-from content_reviewer_agent.api.routes import router
+from content_reviewer_agent.agents.clients import (
+    get_client_registry,
+    peek_client_registry,
+)
+from content_reviewer_agent.agents.links import peek_link_checker
+from content_reviewer_agent.agents.transport import peek_transport
+from content_reviewer_agent.api.responses import FastJSONResponse
+from content_reviewer_agent.api.routes import (
+    get_job_queue,
+    get_review_service,
+    get_scanner,
+    peek_job_queue,
+    peek_scanner,
+    router,
+)
 from content_reviewer_agent.config import settings
+from content_reviewer_agent.services.ingestion import peek_ingestor
+
+logger = logging.getLogger(__name__)
+
+
+async def prepare(app: FastAPI) -> None:
+    """Load the agents, start the job workers and mark the app ready.
+
+    Runs after startup so the server binds without waiting for the agents
+    and the model SDK to import; ``/ready`` reports when it has finished,
+    or why it failed.
+    """
+    try:
+        await _prepare(app)
+    except Exception as e:
+        logger.exception("Content Reviewer Agent API failed to start")
+        app.state.startup_error = f"{type(e).__name__}: {e}"
+
+
+async def _prepare(app: FastAPI) -> None:
+    """Do the work of ``prepare``, raising on failure."""
+    service = await asyncio.to_thread(get_review_service)
+    await asyncio.to_thread(service.prepare)
+    await get_job_queue().start()
+    if settings.scan_roots and settings.scan_interval_seconds > 0:
+        get_scanner().start()
+    if settings.google_api_key:
+        # Open the model connections now rather than on the first review
+        warmed = await asyncio.to_thread(get_client_registry().warm_up)
+        logger.info("Pre-warmed %d model API connection(s)", warmed)
+    app.state.ready = True
+    logger.info("Content Reviewer Agent API ready")
 
 
 @asynccontextmanager
@@ -15,9 +63,27 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     """Application lifespan manager."""
     # Startup
     print("Starting Content Reviewer Agent API...")
+    app.state.ready = False
+    app.state.startup_error = None
+    preparing = asyncio.create_task(prepare(app))
     yield
     # Shutdown
     print("Shutting down Content Reviewer Agent API...")
+    preparing.cancel()
+    await asyncio.gather(preparing, return_exceptions=True)
+    # Only what startup or requests created; the getters would build the rest
+    if (scanner := peek_scanner()) is not None:
+        await scanner.stop()
+    if (queue := peek_job_queue()) is not None:
+        await queue.stop()
+    if (link_checker := peek_link_checker()) is not None:
+        await link_checker.aclose()
+    if (transport := peek_transport()) is not None:
+        transport.shutdown()
+    if (registry := peek_client_registry()) is not None:
+        registry.close()
+    if (ingestor := peek_ingestor()) is not None:
+        ingestor.shutdown()
 
 
 def create_app() -> FastAPI:
@@ -27,6 +93,7 @@ def create_app() -> FastAPI:
         version=settings.api_version,
         debug=settings.debug,
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
 
     # Configure CORS
@@ -63,6 +130,23 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def readiness_check(request: Request):
+    """Readiness endpoint; 503 until the agents are loaded and jobs run."""
+    error = getattr(request.app.state, "startup_error", None)
+    if error is not None:
+        return FastJSONResponse(
+            {"status": "failed", "error": error},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+    if not getattr(request.app.state, "ready", False):
+        return FastJSONResponse(
+            {"status": "starting"},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+    return {"status": "ready"}
+
+
 if __name__ == "__main__":
     import uvicorn
 
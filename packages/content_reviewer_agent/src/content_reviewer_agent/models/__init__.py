@@ -1,6 +1,16 @@
 """Data models for content reviewer agent."""
 
 from content_reviewer_agent.models.content import Content, ReviewIssue
-from content_reviewer_agent.models.review_result import ReviewResult, ReviewType
+from content_reviewer_agent.models.review_result import (
+    BatchReviewRequest,
+    ReviewResult,
+    ReviewType,
+)
 
-__all__ = ["Content", "ReviewIssue", "ReviewResult", "ReviewType"]
+__all__ = [
+    "BatchReviewRequest",
+    "Content",
+    "ReviewIssue",
+    "ReviewResult",
+    "ReviewType",
+]
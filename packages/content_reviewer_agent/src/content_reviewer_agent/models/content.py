@@ -79,6 +79,21 @@ class ReviewIssue(BaseModel):
     severity: IssueSeverity = Field(..., description="Severity of the issue")
     description: str = Field(..., description="Description of the issue")
     location: Optional[str] = Field(None, description="Location in the content")
+    start_offset: Optional[int] = Field(
+        None, ge=0, description="Start character offset of the issue in the text"
+    )
+    end_offset: Optional[int] = Field(
+        None, ge=0, description="End character offset of the issue in the text"
+    )
+    line: Optional[int] = Field(
+        None, ge=1, description="Line of the issue in the text, starting at 1"
+    )
+    paragraph: Optional[int] = Field(
+        None, ge=1, description="Paragraph of the issue in the text, starting at 1"
+    )
+    page: Optional[int] = Field(
+        None, ge=1, description="Page or slide of an extracted document"
+    )
     original_text: Optional[str] = Field(None, description="Original problematic text")
     suggested_fix: Optional[str] = Field(None, description="Suggested correction")
     sources: List[str] = Field(
@@ -90,6 +105,10 @@ class ReviewIssue(BaseModel):
     reviewed_by_agent: Optional[str] = Field(
         None, description="Name of the AI agent that reviewed this content"
     )
+    contributing_agents: List[str] = Field(
+        default_factory=list,
+        description="Agents that reported this issue, when merged across agents",
+    )
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
     model_config = {
@@ -7,7 +7,7 @@ from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
-from content_reviewer_agent.models.content import ReviewIssue
+from content_reviewer_agent.models.content import Content, ReviewIssue
 
 
 class ReviewType(str, Enum):
@@ -27,6 +27,7 @@ class ReviewStatus(str, Enum):
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"
 
 
 class ReviewResult(BaseModel):
@@ -77,3 +78,12 @@ class ReviewResult(BaseModel):
             }
         }
     }
+
+
+class BatchReviewRequest(BaseModel):
+    """Request to review many contents in one call."""
+
+    contents: List[Content] = Field(..., description="Contents to review")
+    review_type: ReviewType = Field(
+        default=ReviewType.FULL_REVIEW, description="Type of review to perform"
+    )
@@ -1,5 +1,21 @@
-"""Services initialization."""
+"""Services initialization.
 
-from content_reviewer_agent.services.review_service import ContentReviewService
+The review service is imported on first access, so that importing the job
+queue or history does not load every agent.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from content_reviewer_agent.services.review_service import ContentReviewService
 
 __all__ = ["ContentReviewService"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the review service on first access."""
+    if name != "ContentReviewService":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from content_reviewer_agent.services.review_service import ContentReviewService
+
+    return ContentReviewService
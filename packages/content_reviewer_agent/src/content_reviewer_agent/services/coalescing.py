@@ -0,0 +1,93 @@
+"""Single-flight execution shared by concurrent identical requests."""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Generic, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Flight:
+    """An execution in progress and the number of callers awaiting it."""
+
+    task: asyncio.Task
+    callers: int = 1
+
+
+class SingleFlight(Generic[T]):
+    """Runs at most one execution per key, shared by every concurrent caller.
+
+    The first caller for a key starts the execution; callers arriving while
+    it runs wait for the same outcome, result or exception, instead of
+    starting their own. The key is forgotten once the execution finishes,
+    so later callers start afresh. A caller that is cancelled stops waiting
+    without cancelling the execution, unless it was the last one waiting.
+    """
+
+    def __init__(self):
+        """Start with no executions."""
+        self._flights: Dict[str, _Flight] = {}
+        self.executions = 0
+        self.coalesced = 0
+        self.cancelled = 0
+        self.max_waiters = 0
+
+    async def run(
+        self, key: str, execute: Callable[[], Awaitable[T]]
+    ) -> Tuple[T, bool]:
+        """Run ``execute``, or join the execution already running for ``key``.
+
+        Args:
+            key: Identity of the request
+            execute: Starts the execution when none is running for ``key``
+
+        Returns:
+            Outcome of the execution, and whether it was shared with an
+            earlier caller
+
+        Raises:
+            Exception: Whatever the shared execution raised
+        """
+        flight = self._flights.get(key)
+        shared = flight is not None
+        if flight is None:
+            flight = self._flights[key] = _Flight(asyncio.ensure_future(execute()))
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+            self.executions += 1
+        else:
+            flight.callers += 1
+            self.coalesced += 1
+            self.max_waiters = max(self.max_waiters, flight.callers - 1)
+        try:
+            return await asyncio.shield(flight.task), shared
+        except asyncio.CancelledError:
+            if flight.task.done():
+                raise
+            flight.callers -= 1
+            if flight.callers == 0:
+                self.cancelled += 1
+                flight.task.cancel()
+            raise
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        """Drop a finished execution so the next caller starts a new one."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def stats(self) -> dict:
+        """Get execution and waiter counts.
+
+        Returns:
+            Executions started, callers that joined one instead, executions
+            cancelled for lack of callers, and the most callers that joined
+            a single execution; plus executions and waiting callers now
+        """
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "cancelled": self.cancelled,
+            "max_waiters": self.max_waiters,
+            "in_flight": len(self._flights),
+            "waiting": sum(f.callers - 1 for f in self._flights.values()),
+        }
@@ -0,0 +1,57 @@
+"""Recent review history used for incremental re-reviews."""
+
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from content_reviewer_agent.models.content import Content
+from content_reviewer_agent.models.review_result import ReviewResult
+
+
+class ReviewHistory:
+    """Bounded in-memory store of reviewed contents and their results."""
+
+    def __init__(self, max_entries: int):
+        """Initialize the history.
+
+        Args:
+            max_entries: Maximum number of reviews kept
+        """
+        self.max_entries = max_entries
+        self._reviews: "OrderedDict[str, Tuple[Content, ReviewResult]]" = OrderedDict()
+        self._latest_by_content: Dict[str, str] = {}
+
+    def add(self, content: Content, result: ReviewResult) -> None:
+        """Record a completed review.
+
+        Args:
+            content: Reviewed content
+            result: Result of the review
+        """
+        self._reviews[result.review_id] = (content, result)
+        self._latest_by_content[content.content_id] = result.review_id
+        while len(self._reviews) > self.max_entries:
+            _, (old_content, old_result) = self._reviews.popitem(last=False)
+            if self._latest_by_content.get(old_content.content_id) == (
+                old_result.review_id
+            ):
+                del self._latest_by_content[old_content.content_id]
+
+    def get(self, reference: str) -> Optional[Tuple[Content, ReviewResult]]:
+        """Find a review by review_id, or the latest review of a content_id.
+
+        Args:
+            reference: review_id or content_id
+
+        Returns:
+            Reviewed content and its result, or None if unknown
+        """
+        if reference in self._reviews:
+            return self._reviews[reference]
+        review_id = self._latest_by_content.get(reference)
+        if review_id is None:
+            return None
+        return self._reviews.get(review_id)
+
+    def __len__(self) -> int:
+        """Number of stored reviews."""
+        return len(self._reviews)
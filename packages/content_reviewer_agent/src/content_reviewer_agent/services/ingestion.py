@@ -0,0 +1,226 @@
+"""Ingestion of raw PDF, PowerPoint and HTML documents into reviewable content."""
+
+import asyncio
+import multiprocessing
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Optional
+
+from content_reviewer_agent.analysis.extraction import count_pages, extract_pages
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.content import Content, ContentType
+
+#: Content types whose text is extracted from an uploaded document
+DOCUMENT_TYPES = frozenset({ContentType.PDF, ContentType.HTML, ContentType.SLIDE})
+
+# Separator between pages in the text of extracted content
+PAGE_SEPARATOR = "\n\n"
+
+
+class DocumentTooLarge(ValueError):
+    """Raised when an upload exceeds ``settings.ingest_max_bytes``."""
+
+
+@dataclass
+class ExtractedPage:
+    """Text of one page, or slide, numbered from 1."""
+
+    number: int
+    text: str
+
+
+class DocumentIngestor:
+    """Extracts document text page by page in a pool of worker processes.
+
+    Uploads are spooled to a temporary file, never held in memory. Workers
+    open that file themselves and parse ``pages_per_task`` pages per task;
+    at most two tasks per worker are in flight, and extraction stops once
+    ``max_chars`` characters have been produced, so memory stays bounded by
+    the text kept rather than by the size of the document.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        pages_per_task: Optional[int] = None,
+    ):
+        """Initialize the ingestor.
+
+        Args:
+            workers: Worker processes. Defaults to ``settings.ingest_workers``.
+            max_bytes: Largest accepted upload. Defaults to
+                ``settings.ingest_max_bytes``.
+            max_chars: Most text extracted per document. Defaults to
+                ``settings.ingest_max_chars``.
+            pages_per_task: Pages parsed per worker task. Defaults to
+                ``settings.ingest_pages_per_task``.
+        """
+        self.workers = workers or settings.ingest_workers
+        self.max_bytes = max_bytes or settings.ingest_max_bytes
+        self.max_chars = max_chars or settings.ingest_max_chars
+        self.pages_per_task = pages_per_task or settings.ingest_pages_per_task
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        """Worker processes, started on first use.
+
+        Workers are spawned rather than forked, so they do not inherit the
+        threads and sockets of the server process.
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    async def save_upload(self, chunks: AsyncIterator[bytes], suffix: str = "") -> str:
+        """Spool an upload to a temporary file.
+
+        Args:
+            chunks: Body of the upload
+            suffix: File name suffix, such as ".pdf"
+
+        Returns:
+            Path of the file; the caller removes it
+
+        Raises:
+            DocumentTooLarge: If the upload exceeds ``max_bytes``
+        """
+        fd, path = tempfile.mkstemp(prefix="upload-", suffix=suffix)
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as f:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise DocumentTooLarge(
+                            f"Document exceeds {self.max_bytes} bytes"
+                        )
+                    await asyncio.to_thread(f.write, chunk)
+        except BaseException:
+            os.remove(path)
+            raise
+        return path
+
+    async def stream_pages(
+        self, path: str, content_type: ContentType
+    ) -> AsyncIterator[ExtractedPage]:
+        """Extract a document's pages in order as the workers finish them.
+
+        Args:
+            path: Document file path
+            content_type: Declared content type
+
+        Yields:
+            Pages in order; the last one is cut short when ``max_chars`` is
+            reached, and no more follow
+
+        Raises:
+            ExtractionError: If the document cannot be read
+        """
+        loop = asyncio.get_running_loop()
+        count = await loop.run_in_executor(self.pool, count_pages, path, content_type)
+        ranges = deque(
+            (first, min(first + self.pages_per_task, count))
+            for first in range(0, count, self.pages_per_task)
+        )
+        in_flight: deque = deque()
+        remaining = self.max_chars
+        try:
+            while ranges or in_flight:
+                while ranges and len(in_flight) < 2 * self.workers:
+                    first, last = ranges.popleft()
+                    future = loop.run_in_executor(
+                        self.pool,
+                        extract_pages,
+                        path,
+                        content_type,
+                        first,
+                        last,
+                        self.max_chars,
+                    )
+                    in_flight.append((first, future))
+                first, future = in_flight.popleft()
+                for offset, text in enumerate(await future):
+                    text = text[:remaining]
+                    remaining -= len(text)
+                    yield ExtractedPage(first + offset + 1, text)
+                    if remaining <= 0:
+                        return
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+
+    async def extract(
+        self, path: str, content_type: ContentType, title: str, **fields: Any
+    ) -> Content:
+        """Extract a document into content that keeps its page provenance.
+
+        ``metadata["pages"]`` maps each page to the offset where its text
+        starts, so issues found in the text can be traced back to a page.
+
+        Args:
+            path: Document file path
+            content_type: Declared content type
+            title: Title of the content
+            **fields: Other ``Content`` fields, such as discipline
+
+        Returns:
+            Content with the text of every non-empty page
+
+        Raises:
+            ExtractionError: If the document cannot be read
+        """
+        parts = []
+        pages = []
+        offset = 0
+        size = 0
+        async for page in self.stream_pages(path, content_type):
+            size += len(page.text)
+            if not page.text:
+                continue
+            pages.append({"page": page.number, "start": offset})
+            parts.append(page.text)
+            offset += len(page.text) + len(PAGE_SEPARATOR)
+        metadata = fields.pop("metadata", {})
+        metadata.update(
+            pages=pages,
+            page_label="slide" if content_type == ContentType.SLIDE else "page",
+            truncated=size >= self.max_chars,
+        )
+        return Content(
+            title=title,
+            text=PAGE_SEPARATOR.join(parts),
+            content_type=content_type,
+            metadata=metadata,
+            **fields,
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+_ingestor: Optional[DocumentIngestor] = None
+
+
+def get_ingestor() -> DocumentIngestor:
+    """Get the process-wide document ingestor."""
+    global _ingestor
+    if _ingestor is None:
+        _ingestor = DocumentIngestor()
+    return _ingestor
+
+
+def peek_ingestor() -> Optional[DocumentIngestor]:
+    """Get the process-wide document ingestor if it has been created."""
+    return _ingestor
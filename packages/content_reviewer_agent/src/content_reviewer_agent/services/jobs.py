@@ -0,0 +1,407 @@
+"""Durable asynchronous review job queue."""
+
+import asyncio
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
+from uuid import uuid4
+
+from content_reviewer_agent import storage
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.content import Content
+from content_reviewer_agent.models.review_result import (
+    ReviewResult,
+    ReviewStatus,
+    ReviewType,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS review_jobs (
+    review_id TEXT PRIMARY KEY,
+    content_id TEXT NOT NULL,
+    content TEXT NOT NULL,
+    review_type TEXT NOT NULL,
+    use_cache INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    worker_id TEXT,
+    lease_until REAL
+)
+"""
+
+# Columns added after the first release, created on databases that lack them
+_ADDED_COLUMNS = {"worker_id": "TEXT", "lease_until": "REAL"}
+
+_FINISHED = (
+    ReviewStatus.COMPLETED.value,
+    ReviewStatus.FAILED.value,
+    ReviewStatus.CANCELLED.value,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _stored_time(timestamp: float) -> datetime:
+    """Convert a stored epoch timestamp to the naive UTC datetime of results."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+class ReviewJobQueue:
+    """Review jobs persisted in SQLite and processed by a pool of workers.
+
+    Jobs are claimed in submission order, each by exactly one queue even
+    when several processes share the database. A claimed job is leased to
+    its queue for ``settings.job_lease_seconds`` and the lease is renewed
+    while it runs; jobs whose lease ran out, because their process crashed,
+    are claimed again. A queue that stops puts its running jobs back to
+    ``pending``, so they survive restarts.
+    """
+
+    def __init__(self, service, path: str, workers: Optional[int] = None):
+        """Initialize the queue.
+
+        Args:
+            service: ContentReviewService that performs the reviews
+            path: SQLite database file path
+            workers: Number of workers. Defaults to ``settings.job_workers``.
+        """
+        self.service = service
+        self.path = path
+        self.worker_count = workers or settings.job_workers
+        self._lock = threading.Lock()
+        self._conn = storage.connect(path)
+        self._conn.execute(_SCHEMA)
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(review_jobs)")
+        }
+        for name, kind in _ADDED_COLUMNS.items():
+            if name not in columns:
+                self._conn.execute(f"ALTER TABLE review_jobs ADD COLUMN {name} {kind}")
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self.lease_seconds = settings.job_lease_seconds
+        self._workers: List[asyncio.Task] = []
+        self._running: Dict[str, asyncio.Task] = {}
+        self._cancel_requested: Set[str] = set()
+        self._wakeup = asyncio.Event()
+
+    def _execute(self, sql: str, params: tuple = ()) -> list:
+        """Run a statement under the connection lock."""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    async def _db(self, sql: str, params: tuple = ()) -> list:
+        """Run a statement in a worker thread."""
+        return await asyncio.to_thread(self._execute, sql, params)
+
+    def _claim_next(self) -> Optional[tuple]:
+        """Claim the oldest pending job, or one whose lease has expired.
+
+        The claim is a conditional UPDATE, so when queues in several
+        processes pick the same candidate only one of them gets it; the
+        others try the next candidate.
+
+        Returns:
+            review_id, content_id, content, review_type and use_cache of the
+            claimed job, or None if there is nothing to claim
+        """
+        claimable = (
+            "(status = ? OR (status = ? AND (lease_until IS NULL OR lease_until < ?)))"
+        )
+        with self._lock:
+            while True:
+                now = time.time()
+                params = (
+                    ReviewStatus.PENDING.value,
+                    ReviewStatus.IN_PROGRESS.value,
+                    now,
+                )
+                row = self._conn.execute(
+                    "SELECT review_id, content_id, content, review_type, use_cache "
+                    f"FROM review_jobs WHERE {claimable} ORDER BY created_at LIMIT 1",
+                    params,
+                ).fetchone()
+                if row is None:
+                    return None
+                cursor = self._conn.execute(
+                    "UPDATE review_jobs SET status = ?, worker_id = ?, "
+                    "lease_until = ?, updated_at = ? "
+                    f"WHERE review_id = ? AND {claimable}",
+                    (
+                        ReviewStatus.IN_PROGRESS.value,
+                        self.worker_id,
+                        now + self.lease_seconds,
+                        now,
+                        row[0],
+                        *params,
+                    ),
+                )
+                if cursor.rowcount == 1:
+                    return tuple(row)
+
+    async def submit(
+        self,
+        content: Content,
+        review_type: ReviewType = ReviewType.FULL_REVIEW,
+        use_cache: bool = True,
+    ) -> ReviewResult:
+        """Persist a new review job.
+
+        Args:
+            content: Content to review
+            review_type: Type of review to perform
+            use_cache: Reuse cached agent responses for identical content
+
+        Returns:
+            Pending ReviewResult holding the job's review_id
+        """
+        results = await self.submit_many([content], review_type, use_cache)
+        return results[0]
+
+    def _insert_many(self, rows: List[tuple]) -> None:
+        """Insert job rows in one transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO review_jobs (review_id, content_id, content, "
+                    "review_type, use_cache, status, result, created_at, "
+                    "updated_at) VALUES (?, ?, ?, ?, ?, ?, NULL, ?, ?)",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    async def submit_many(
+        self,
+        contents: List[Content],
+        review_type: ReviewType = ReviewType.FULL_REVIEW,
+        use_cache: bool = True,
+    ) -> List[ReviewResult]:
+        """Persist several review jobs in one transaction.
+
+        Args:
+            contents: Contents to review, queued in this order
+            review_type: Type of review to perform
+            use_cache: Reuse cached agent responses for identical content
+
+        Returns:
+            Pending ReviewResults, one per content
+        """
+        results = []
+        rows = []
+        now = time.time()
+        for content in contents:
+            result = ReviewResult(
+                content_id=content.content_id,
+                review_type=review_type,
+                created_at=_stored_time(now),
+            )
+            results.append(result)
+            rows.append(
+                (
+                    result.review_id,
+                    content.content_id,
+                    content.model_dump_json(),
+                    review_type.value,
+                    int(use_cache),
+                    ReviewStatus.PENDING.value,
+                    now,
+                    now,
+                )
+            )
+        await asyncio.to_thread(self._insert_many, rows)
+        self._wakeup.set()
+        return results
+
+    async def get(self, review_id: str) -> Optional[ReviewResult]:
+        """Get the current state of a job.
+
+        Args:
+            review_id: ID returned by submit
+
+        Returns:
+            ReviewResult, or None if the job is unknown
+        """
+        rows = await self._db(
+            "SELECT content_id, review_type, status, result, created_at "
+            "FROM review_jobs WHERE review_id = ?",
+            (review_id,),
+        )
+        if not rows:
+            return None
+        content_id, review_type, status, result_json, created_at = rows[0]
+        if result_json and status != ReviewStatus.CANCELLED.value:
+            return ReviewResult.model_validate_json(result_json)
+        return ReviewResult(
+            review_id=review_id,
+            content_id=content_id,
+            review_type=ReviewType(review_type),
+            status=ReviewStatus(status),
+            created_at=_stored_time(created_at),
+        )
+
+    async def cancel(self, review_id: str) -> Optional[ReviewResult]:
+        """Cancel a pending or running job.
+
+        Finished jobs are left untouched.
+
+        Args:
+            review_id: ID returned by submit
+
+        Returns:
+            Current state of the job, or None if it is unknown
+        """
+        await self._db(
+            "UPDATE review_jobs SET status = ?, updated_at = ? "
+            f"WHERE review_id = ? AND status NOT IN ({','.join('?' * len(_FINISHED))})",
+            (ReviewStatus.CANCELLED.value, time.time(), review_id, *_FINISHED),
+        )
+        task = self._running.get(review_id)
+        if task is not None:
+            self._cancel_requested.add(review_id)
+            task.cancel()
+        return await self.get(review_id)
+
+    async def _finish(self, result: ReviewResult) -> None:
+        """Store the result of a job this queue still holds."""
+        await self._db(
+            "UPDATE review_jobs SET status = ?, result = ?, updated_at = ?, "
+            "lease_until = NULL WHERE review_id = ? AND status = ? AND worker_id = ?",
+            (
+                result.status.value,
+                result.model_dump_json(),
+                time.time(),
+                result.review_id,
+                ReviewStatus.IN_PROGRESS.value,
+                self.worker_id,
+            ),
+        )
+
+    async def _process(self, job: tuple) -> None:
+        """Run one claimed job and store its result."""
+        review_id, _, content_json, review_type, use_cache = job
+        content = Content.model_validate_json(content_json)
+        task = asyncio.create_task(
+            self.service.review_content(
+                content, ReviewType(review_type), use_cache=bool(use_cache)
+            )
+        )
+        self._running[review_id] = task
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            if review_id in self._cancel_requested:
+                return
+            raise
+        finally:
+            self._running.pop(review_id, None)
+            self._cancel_requested.discard(review_id)
+
+        await self._finish(result.model_copy(update={"review_id": review_id}))
+
+    async def _fail(self, job: tuple, error: Exception) -> None:
+        """Mark a job failed after an error outside the review itself."""
+        review_id, content_id, _, review_type, _ = job
+        try:
+            await self._finish(
+                ReviewResult(
+                    review_id=review_id,
+                    content_id=content_id,
+                    review_type=ReviewType(review_type),
+                    status=ReviewStatus.FAILED,
+                    summary=f"Review failed: {error}",
+                )
+            )
+        except Exception:
+            # The lease runs out and another worker claims the job again
+            logger.exception("Could not mark job %s failed", review_id)
+
+    async def _wait_for_work(self) -> None:
+        """Wait for a submission or the poll interval."""
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(
+                self._wakeup.wait(), settings.job_poll_interval_seconds
+            )
+        except asyncio.TimeoutError:
+            pass
+
+    async def _worker(self) -> None:
+        """Claim and process jobs until cancelled.
+
+        An error claiming or processing a job is logged, the job is marked
+        failed and the worker carries on after the poll interval.
+        """
+        while True:
+            job = None
+            try:
+                job = await asyncio.to_thread(self._claim_next)
+                if job is None:
+                    await self._wait_for_work()
+                    continue
+                await self._process(job)
+            except Exception as e:
+                logger.exception("Review job worker error")
+                if job is not None:
+                    await self._fail(job, e)
+                await asyncio.sleep(settings.job_poll_interval_seconds)
+
+    async def _heartbeat(self) -> None:
+        """Renew the leases of the jobs this queue is running."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                await self._db(
+                    "UPDATE review_jobs SET lease_until = ? "
+                    "WHERE worker_id = ? AND status = ?",
+                    (
+                        time.time() + self.lease_seconds,
+                        self.worker_id,
+                        ReviewStatus.IN_PROGRESS.value,
+                    ),
+                )
+            except Exception:
+                logger.exception("Could not renew review job leases")
+
+    async def start(self) -> None:
+        """Start the workers.
+
+        Jobs another process is running are left alone; those whose lease
+        expired are claimed again by the workers.
+        """
+        if self._workers:
+            return
+        self._wakeup = asyncio.Event()
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.worker_count)
+        ]
+        self._workers.append(asyncio.create_task(self._heartbeat()))
+
+    async def stop(self) -> None:
+        """Stop the workers, putting their unfinished jobs back to pending."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        await self._db(
+            "UPDATE review_jobs SET status = ?, worker_id = NULL, lease_until = NULL "
+            "WHERE worker_id = ? AND status = ?",
+            (
+                ReviewStatus.PENDING.value,
+                self.worker_id,
+                ReviewStatus.IN_PROGRESS.value,
+            ),
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,7 +1,14 @@
 """Content review service that orchestrates multiple agents."""
 
+import asyncio
+import hashlib
+import json
+import sys
+import time
 from datetime import datetime
-from typing import List, Optional
+from functools import cached_property
+from typing import AsyncIterator, Iterable, List, Optional, Tuple
+from uuid import uuid4
 
 from content_reviewer_agent.agents import (
     ComprehensionAgent,
@@ -9,38 +16,288 @@ from content_reviewer_agent.agents import (
     ErrorDetectionAgent,
     SourceVerificationAgent,
 )
+from content_reviewer_agent.agents.base_ai import get_text_index
+from content_reviewer_agent.agents.cache import content_fingerprint, get_review_cache
+from content_reviewer_agent.agents.cascade import CascadeRouting
+from content_reviewer_agent.agents.clients import get_client_registry
+from content_reviewer_agent.agents.rate_limit import rate_limiter_stats
+from content_reviewer_agent.agents.resilience import circuit_breaker_stats
+from content_reviewer_agent.agents.telemetry import ReviewTelemetry, track_telemetry
+from content_reviewer_agent.analysis.chunking import (
+    TextChunk,
+    chunk_text,
+    estimate_tokens,
+)
+from content_reviewer_agent.analysis.dedup import merge_duplicate_issues
+from content_reviewer_agent.analysis.diff import diff_text
+from content_reviewer_agent.analysis.extraction import assign_pages
+from content_reviewer_agent.config import settings
 from content_reviewer_agent.models.content import Content, ReviewIssue
 from content_reviewer_agent.models.review_result import (
     ReviewResult,
     ReviewStatus,
     ReviewType,
 )
+from content_reviewer_agent.services.coalescing import SingleFlight
+from content_reviewer_agent.services.history import ReviewHistory
 
 
 class ContentReviewService:
     """Service that coordinates multiple review agents."""
 
-    def __init__(self):
-        """Initialize the review service with all agents."""
-        self.error_agent = ErrorDetectionAgent()
-        self.comprehension_agent = ComprehensionAgent()
-        self.source_agent = SourceVerificationAgent()
-        self.update_agent = ContentUpdateAgent()
+    def __init__(self, concurrent: Optional[bool] = None):
+        """Initialize the review service.
+
+        Agents are built on first use, see ``prepare``.
+
+        Args:
+            concurrent: Run the agents of a full review at the same time.
+                Defaults to ``settings.concurrent_agents``.
+        """
+        self.concurrent = (
+            settings.concurrent_agents if concurrent is None else concurrent
+        )
+        self.history = ReviewHistory(settings.review_history_size)
+        self.coalescer: SingleFlight[ReviewResult] = SingleFlight()
+
+    @cached_property
+    def error_agent(self) -> ErrorDetectionAgent:
+        """Agent detecting spelling, grammar and syntax errors."""
+        return ErrorDetectionAgent()
+
+    @cached_property
+    def comprehension_agent(self) -> ComprehensionAgent:
+        """Agent suggesting comprehension improvements."""
+        return ComprehensionAgent()
+
+    @cached_property
+    def source_agent(self) -> SourceVerificationAgent:
+        """Agent verifying sources and references."""
+        return SourceVerificationAgent()
+
+    @cached_property
+    def update_agent(self) -> ContentUpdateAgent:
+        """Agent finding outdated information."""
+        return ContentUpdateAgent()
+
+    def prepare(self) -> None:
+        """Build every agent and the model client ahead of the first review.
+
+        Blocking; the application runs it in a worker thread after startup
+        so that the server accepts connections meanwhile.
+        """
+        self._get_agents(ReviewType.FULL_REVIEW)
+        get_client_registry().get()
+
+    def _get_agents(self, review_type: ReviewType) -> list:
+        """Get the agents that take part in a review type.
+
+        The order of the returned list is the order in which issues are merged
+        into the result, regardless of which agent finishes first.
+
+        Args:
+            review_type: Type of review to perform
+
+        Returns:
+            List of agents
+        """
+        if review_type == ReviewType.FULL_REVIEW:
+            return [
+                self.error_agent,
+                self.comprehension_agent,
+                self.source_agent,
+                self.update_agent,
+            ]
+        if review_type == ReviewType.ERROR_DETECTION:
+            return [self.error_agent]
+        if review_type == ReviewType.COMPREHENSION:
+            return [self.comprehension_agent]
+        if review_type == ReviewType.SOURCE_VERIFICATION:
+            return [self.source_agent]
+        if review_type == ReviewType.CONTENT_UPDATE:
+            return [self.update_agent]
+        return []
+
+    @staticmethod
+    def _new_telemetry() -> ReviewTelemetry:
+        """Start recording the statistics agents report during a review."""
+        return ReviewTelemetry(CascadeRouting() if settings.cascade_enabled else None)
+
+    async def _run_agent(
+        self,
+        agent,
+        content: Content,
+        use_cache: bool = True,
+        segments: Optional[List[TextChunk]] = None,
+        telemetry: Optional[ReviewTelemetry] = None,
+    ) -> List[ReviewIssue]:
+        """Run a single agent bounded by ``settings.timeout_seconds``.
+
+        Args:
+            agent: Agent to run
+            content: Content to review
+            use_cache: Allow the agent to use the review cache
+            segments: Only review these windows of the content
+            telemetry: Records the agent's prompt and cascade statistics
+
+        Returns:
+            List of issues found by the agent
+
+        Raises:
+            TimeoutError: If the agent does not finish in time
+        """
+        if segments is None:
+            review = agent.review(content, use_cache=use_cache)
+        else:
+            review = agent.review_segments(content, segments, use_cache=use_cache)
+        try:
+            with track_telemetry(telemetry):
+                return await asyncio.wait_for(review, timeout=settings.timeout_seconds)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"{agent.name} timed out after {settings.timeout_seconds}s"
+            )
+
+    async def _run_agents(
+        self,
+        agents: list,
+        content: Content,
+        use_cache: bool = True,
+        segments: Optional[List[TextChunk]] = None,
+        telemetry: Optional[ReviewTelemetry] = None,
+    ) -> List[ReviewIssue]:
+        """Run agents and merge their issues in agent order.
+
+        Args:
+            agents: Agents to run
+            content: Content to review
+            use_cache: Allow the agents to use the review cache
+            segments: Only review these windows of the content
+            telemetry: Records the agents' prompt and cascade statistics
+
+        Returns:
+            Issues from all agents, grouped by agent in the given order
+        """
+        if self.concurrent and len(agents) > 1:
+            results = await asyncio.gather(
+                *(
+                    self._run_agent(agent, content, use_cache, segments, telemetry)
+                    for agent in agents
+                ),
+                return_exceptions=True,
+            )
+        else:
+            results = [
+                await self._run_agent(agent, content, use_cache, segments, telemetry)
+                for agent in agents
+            ]
+
+        issues: List[ReviewIssue] = []
+        for agent_result in results:
+            if isinstance(agent_result, BaseException):
+                raise agent_result
+            issues.extend(agent_result)
+        return issues
 
     async def review_content(
         self,
         content: Content,
         review_type: ReviewType = ReviewType.FULL_REVIEW,
+        use_cache: bool = True,
+        previous: Optional[str] = None,
     ) -> ReviewResult:
         """Review content using specified review type.
 
+        With ``settings.coalesce_reviews``, a review identical to one already
+        in flight (see ``_coalescing_key``) waits for that one instead of
+        calling the agents again, and gets a copy of its result under its
+        own review_id and content_id.
+
         Args:
             content: Content to review
             review_type: Type of review to perform
+            use_cache: Reuse cached agent responses for identical content
+            previous: review_id or content_id of an earlier version. Only
+                the regions that changed since it are sent to the agents.
 
         Returns:
             ReviewResult with issues found
         """
+        if not settings.coalesce_reviews:
+            return await self._review_content(content, review_type, use_cache, previous)
+        result, shared = await self.coalescer.run(
+            self._coalescing_key(content, review_type, use_cache, previous),
+            lambda: self._review_content(content, review_type, use_cache, previous),
+        )
+        if not shared:
+            return result
+        return self._share_result(result, content)
+
+    def _coalescing_key(
+        self,
+        content: Content,
+        review_type: ReviewType,
+        use_cache: bool,
+        previous: Optional[str],
+    ) -> str:
+        """Identify a review by everything its outcome depends on.
+
+        That is the content fingerprint, the metadata the agents read, the
+        set of agents and the options. The content_id is left out, so the
+        same lesson submitted under different IDs shares one review.
+
+        Args:
+            content: Content to review
+            review_type: Type of review to perform
+            use_cache: Reuse cached agent responses
+            previous: Earlier version for an incremental review
+
+        Returns:
+            Hex digest of the review request
+        """
+        payload = json.dumps(
+            [
+                content_fingerprint(content),
+                content.metadata,
+                sorted(agent.name for agent in self._get_agents(review_type)),
+                review_type.value,
+                use_cache,
+                previous,
+            ],
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _share_result(self, result: ReviewResult, content: Content) -> ReviewResult:
+        """Copy a coalesced review's result for another caller.
+
+        Args:
+            result: Result of the shared review
+            content: Content the caller submitted
+
+        Returns:
+            Copy of the result with its own review_id, for ``content``
+        """
+        shared = result.model_copy(deep=True)
+        shared.review_id = str(uuid4())
+        shared.content_id = content.content_id
+        for issue in shared.issues:
+            issue.content_id = content.content_id
+        shared.metadata["coalesced_with"] = result.review_id
+        if shared.status == ReviewStatus.COMPLETED:
+            self.history.add(content, shared)
+        return shared
+
+    async def _review_content(
+        self,
+        content: Content,
+        review_type: ReviewType,
+        use_cache: bool,
+        previous: Optional[str],
+    ) -> ReviewResult:
+        """Review content, calling the agents; see ``review_content``."""
         result = ReviewResult(
             content_id=content.content_id,
             review_type=review_type,
@@ -48,44 +305,307 @@ class ContentReviewService:
         )
 
         try:
-            issues: List[ReviewIssue] = []
-
             # Run appropriate agents based on review type
-            if review_type == ReviewType.FULL_REVIEW:
-                issues.extend(await self.error_agent.review(content))
-                issues.extend(await self.comprehension_agent.review(content))
-                issues.extend(await self.source_agent.review(content))
-                issues.extend(await self.update_agent.review(content))
+            agents = self._get_agents(review_type)
+            telemetry = self._new_telemetry()
+            incremental = self._plan_incremental(content, review_type, previous)
+            if incremental is None:
+                issues = await self._run_agents(
+                    agents, content, use_cache, None, telemetry
+                )
+            else:
+                segments, carried, stats = incremental
+                issues = carried
+                if segments:
+                    issues = carried + await self._run_agents(
+                        agents, content, use_cache, segments, telemetry
+                    )
+                issues.sort(key=self._issue_position)
+                result.metadata["incremental"] = stats
+
+            self._complete_result(result, content, issues, telemetry)
+
+        except Exception as e:
+            result.status = ReviewStatus.FAILED
+            result.summary = f"Review failed: {str(e)}"
 
-            elif review_type == ReviewType.ERROR_DETECTION:
-                issues.extend(await self.error_agent.review(content))
+        return result
 
-            elif review_type == ReviewType.COMPREHENSION:
-                issues.extend(await self.comprehension_agent.review(content))
+    def _complete_result(
+        self,
+        result: ReviewResult,
+        content: Content,
+        issues: List[ReviewIssue],
+        telemetry: Optional[ReviewTelemetry] = None,
+    ) -> None:
+        """Fill in a result from the merged issues and mark it completed.
 
-            elif review_type == ReviewType.SOURCE_VERIFICATION:
-                issues.extend(await self.source_agent.review(content))
+        Every issue is first resolved against the content's shared text
+        index, so it carries offsets, line and paragraph wherever its quoted
+        text can be found, and the page or slide for extracted documents.
+        Issues several agents reported for the same text are then merged, so
+        they are counted once in the summary and quality score.
 
-            elif review_type == ReviewType.CONTENT_UPDATE:
-                issues.extend(await self.update_agent.review(content))
+        Args:
+            result: Result to complete
+            content: Reviewed content
+            issues: Issues from all agents
+            telemetry: Statistics the agents reported during the review
+        """
+        unlocated = get_text_index(content.text).resolve_issues(issues)
+        result.metadata["unlocated_issues"] = unlocated
+        if content.metadata.get("pages"):
+            assign_pages(
+                issues,
+                content.metadata["pages"],
+                content.metadata.get("page_label", "page"),
+            )
+        if telemetry is not None:
+            result.metadata["prompts"] = telemetry.prompt_summary()
+        if telemetry is not None and telemetry.cascade is not None:
+            result.metadata["cascade"] = telemetry.cascade.summary(
+                settings.cascade_fast_model,
+                settings.google_model_name,
+                settings.cascade_fast_cost_ratio,
+            )
+        if settings.merge_duplicate_issues:
+            issues = merge_duplicate_issues(issues, settings.duplicate_similarity)
 
-            # Add all issues to result
-            result.issues = issues
+        # Add all issues to result
+        result.issues = issues
 
-            # Generate summary and recommendations
-            result.summary = self._generate_summary(issues)
-            result.recommendations = self._generate_recommendations(issues)
-            result.quality_score = self._calculate_quality_score(content, issues)
+        # Generate summary and recommendations
+        result.summary = self._generate_summary(issues)
+        result.recommendations = self._generate_recommendations(issues)
+        result.quality_score = self._calculate_quality_score(content, issues)
 
-            # Mark as completed
-            result.status = ReviewStatus.COMPLETED
-            result.completed_at = datetime.utcnow()
+        # Mark as completed
+        result.status = ReviewStatus.COMPLETED
+        result.completed_at = datetime.utcnow()
+        self.history.add(content, result)
 
-        except Exception as e:
+    async def review_content_stream(
+        self,
+        content: Content,
+        review_type: ReviewType = ReviewType.FULL_REVIEW,
+        use_cache: bool = True,
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        """Review content, yielding an event as each agent finishes.
+
+        Agents always run concurrently here, so the first event arrives after
+        the fastest agent. The final ``result`` event carries the complete
+        ReviewResult with issues merged in agent order.
+
+        Args:
+            content: Content to review
+            review_type: Type of review to perform
+            use_cache: Reuse cached agent responses for identical content
+
+        Yields:
+            ``("agent", payload)`` per agent, then ``("result", payload)``
+        """
+        result = ReviewResult(
+            content_id=content.content_id,
+            review_type=review_type,
+            status=ReviewStatus.IN_PROGRESS,
+        )
+        agents = self._get_agents(review_type)
+        telemetry = self._new_telemetry()
+
+        async def timed_run(index: int):
+            start = time.perf_counter()
+            try:
+                issues = await self._run_agent(
+                    agents[index], content, use_cache, None, telemetry
+                )
+                error = None
+            except Exception as e:
+                issues, error = [], e
+            return index, issues, error, time.perf_counter() - start
+
+        tasks = [asyncio.create_task(timed_run(i)) for i in range(len(agents))]
+        agent_issues: List[List[ReviewIssue]] = [[] for _ in agents]
+        failure: Optional[Exception] = None
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, issues, error, elapsed = await next_done
+                agent_issues[index] = issues
+                failure = failure or error
+                yield "agent", {
+                    "agent": agents[index].name,
+                    "issues": [issue.model_dump(mode="json") for issue in issues],
+                    "elapsed_ms": round(elapsed * 1000, 1),
+                    "error": str(error) if error else None,
+                }
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if failure is None:
+            self._complete_result(
+                result,
+                content,
+                [i for issues in agent_issues for i in issues],
+                telemetry,
+            )
+        else:
             result.status = ReviewStatus.FAILED
-            result.summary = f"Review failed: {str(e)}"
+            result.summary = f"Review failed: {str(failure)}"
+        yield "result", result.model_dump(mode="json")
 
-        return result
+    async def review_batch(
+        self,
+        contents: Iterable[Content],
+        review_type: ReviewType = ReviewType.FULL_REVIEW,
+        use_cache: bool = True,
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[ReviewResult]:
+        """Review many contents, yielding each result as soon as it completes.
+
+        A fixed pool of workers pulls contents from the iterable, so no more
+        than ``concurrency`` reviews are in flight and pending contents are
+        not turned into tasks up front.
+
+        Args:
+            contents: Contents to review
+            review_type: Type of review to perform
+            use_cache: Reuse cached agent responses for identical content
+            concurrency: Maximum reviews in flight. Defaults to
+                ``settings.batch_concurrency``.
+
+        Yields:
+            ReviewResult for each content, in completion order; a FAILED one,
+            with the error in its metadata, for a review that raised
+        """
+        pending = iter(contents)
+        results: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        async def worker() -> None:
+            try:
+                for content in pending:
+                    try:
+                        result = await self.review_content(
+                            content, review_type, use_cache
+                        )
+                    except Exception as e:
+                        result = ReviewResult(
+                            content_id=content.content_id,
+                            review_type=review_type,
+                            status=ReviewStatus.FAILED,
+                            summary=f"Review failed: {str(e)}",
+                            metadata={"error": f"{type(e).__name__}: {e}"},
+                        )
+                    await results.put(result)
+            finally:
+                await results.put(done)
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(concurrency or settings.batch_concurrency)
+        ]
+        try:
+            running = len(workers)
+            while running:
+                item = await results.get()
+                if item is done:
+                    running -= 1
+                else:
+                    yield item
+        finally:
+            # Stop remaining work if the consumer goes away early
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def _plan_incremental(
+        self, content: Content, review_type: ReviewType, previous: Optional[str]
+    ) -> Optional[Tuple[List[TextChunk], List[ReviewIssue], dict]]:
+        """Work out what needs reviewing relative to an earlier version.
+
+        Args:
+            content: New version of the content
+            review_type: Type of review to perform
+            previous: review_id or content_id of the earlier version
+
+        Returns:
+            Windows to review, issues carried forward from the earlier result
+            and savings statistics; None if a full review is needed
+        """
+        if previous is None:
+            return None
+        prior = self.history.get(previous)
+        if prior is None:
+            return None
+        old_content, old_result = prior
+        if (
+            old_result.review_type != review_type
+            or old_result.status != ReviewStatus.COMPLETED
+        ):
+            return None
+
+        diff = diff_text(old_content.text, content.text)
+
+        # Keep earlier issues that still sit in unchanged text
+        carried: List[ReviewIssue] = []
+        for issue in old_result.issues:
+            span = None
+            if issue.start_offset is not None and issue.end_offset is not None:
+                span = diff.map_span(issue.start_offset, issue.end_offset)
+            elif issue.original_text:
+                span = diff.find_unchanged(content.text, issue.original_text)
+            if span is None:
+                continue
+            carried.append(
+                issue.model_copy(
+                    update={
+                        "content_id": content.content_id,
+                        "start_offset": span[0],
+                        "end_offset": span[1],
+                        "location": f"chars {span[0]}-{span[1]}",
+                    }
+                )
+            )
+
+        # Changed regions still respect the per-prompt token budget
+        segments = [
+            TextChunk(region.start + piece.start, region.start + piece.end, piece.text)
+            for region in diff.changed
+            for piece in chunk_text(
+                region.text,
+                settings.chunk_max_tokens,
+                settings.chunk_overlap_tokens,
+            )
+        ]
+
+        agent_count = len(self._get_agents(review_type))
+        full_calls = agent_count * len(
+            chunk_text(
+                content.text,
+                settings.chunk_max_tokens,
+                settings.chunk_overlap_tokens,
+            )
+        )
+        calls_made = agent_count * len(segments)
+        tokens_sent = agent_count * sum(estimate_tokens(s.text) for s in segments)
+        full_tokens = agent_count * estimate_tokens(content.text)
+        stats = {
+            "previous_review_id": old_result.review_id,
+            "changed_regions": len(diff.changed),
+            "carried_issues": len(carried),
+            "calls_made": calls_made,
+            "calls_avoided": max(0, full_calls - calls_made),
+            "tokens_sent": tokens_sent,
+            "tokens_avoided": max(0, full_tokens - tokens_sent),
+        }
+        return segments, carried, stats
+
+    @staticmethod
+    def _issue_position(issue: ReviewIssue) -> int:
+        """Sort key placing located issues in document order, others last."""
+        if issue.start_offset is None:
+            return sys.maxsize
+        return issue.start_offset
 
     def _generate_summary(self, issues: List[ReviewIssue]) -> str:
         """Generate a summary of the review.
@@ -218,3 +738,18 @@ class ContentReviewService:
                 },
             ]
         }
+
+    def get_metrics(self) -> dict:
+        """Get runtime metrics of the review pipeline.
+
+        Returns:
+            Dictionary with metrics
+        """
+        cache = get_review_cache()
+        return {
+            "cache": cache.stats() if cache is not None else None,
+            "circuit_breakers": circuit_breaker_stats(),
+            "rate_limits": rate_limiter_stats(),
+            "genai_clients": get_client_registry().stats(),
+            "coalescing": self.coalescer.stats(),
+        }
@@ -0,0 +1,402 @@
+"""Corpus scanner that queues reviews of new and changed files."""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from content_reviewer_agent import storage
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.content import Content, ContentType
+from content_reviewer_agent.models.review_result import ReviewType
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scan_manifest (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    review_id TEXT,
+    scanned_at REAL NOT NULL
+)
+"""
+
+_CODE_EXTENSIONS = (
+    ".py .js .ts .java .kt .c .h .cpp .cs .go .rs .rb .php .sql .sh .r .swift"
+).split()
+
+#: File extensions scanned, by the content type they are reviewed as
+CONTENT_TYPES: Dict[str, ContentType] = {
+    ".md": ContentType.MARKDOWN,
+    ".markdown": ContentType.MARKDOWN,
+    ".html": ContentType.HTML,
+    ".htm": ContentType.HTML,
+    ".txt": ContentType.TEXT,
+    ".rst": ContentType.TEXT,
+    **{ext: ContentType.CODE for ext in _CODE_EXTENSIONS},
+}
+
+#: Directories never descended into
+SKIPPED_DIRECTORIES = frozenset(
+    {"node_modules", "__pycache__", "venv", "site-packages", "dist", "build"}
+)
+
+_HASH_CHUNK_BYTES = 1 << 20
+# Files hashed, queued and recorded in the manifest at a time
+_BATCH_SIZE = 256
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScanReport:
+    """Outcome of one scan of the content roots."""
+
+    files: int = 0
+    unchanged: int = 0
+    touched: int = 0
+    new: int = 0
+    changed: int = 0
+    deleted: int = 0
+    queued: int = 0
+    errors: Dict[str, str] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Convert the report to a JSON-compatible dict."""
+        return asdict(self)
+
+
+@dataclass
+class _Candidate:
+    """A file whose modification time or size differs from the manifest."""
+
+    path: str
+    mtime_ns: int
+    size: int
+    known_hash: Optional[str]
+    review_id: Optional[str]
+    sha256: str = ""
+    text: str = ""
+
+
+def _hash_file(path: str) -> Tuple[str, bytes]:
+    """Read a file and compute its SHA-256.
+
+    Args:
+        path: File path
+
+    Returns:
+        Hex digest and file contents
+    """
+    digest = hashlib.sha256()
+    chunks = []
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_BYTES):
+            digest.update(chunk)
+            chunks.append(chunk)
+    return digest.hexdigest(), b"".join(chunks)
+
+
+def content_type_for(path: str) -> Optional[ContentType]:
+    """Get the content type a file is reviewed as.
+
+    Args:
+        path: File path
+
+    Returns:
+        Content type, or None if the file is not scanned
+    """
+    return CONTENT_TYPES.get(os.path.splitext(path)[1].lower())
+
+
+def walk_files(root: str) -> Iterator[os.DirEntry]:
+    """Yield the scanned files below a root, skipping hidden directories.
+
+    Uses ``os.scandir`` so that file types come from the directory listing
+    and only files with a scanned extension are ever stat'ed.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        Directory entries of scanned files
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        name = entry.name
+                        if not name.startswith(".") and name not in (
+                            SKIPPED_DIRECTORIES
+                        ):
+                            stack.append(entry.path)
+                    elif content_type_for(entry.name) is not None:
+                        yield entry
+        except OSError:
+            continue
+
+
+class CorpusScanner:
+    """Walks content roots and queues reviews of new and changed files.
+
+    Every scanned file is fingerprinted in a SQLite manifest by modification
+    time, size and SHA-256. Files whose modification time and size match the
+    manifest are skipped without being read, so re-scanning an unchanged
+    corpus costs one ``stat`` per file. Other files are hashed by a pool of
+    threads, and only those whose hash changed are queued on the review job
+    queue, whose workers review them with ``ContentReviewService``.
+    """
+
+    def __init__(
+        self,
+        queue,
+        path: str,
+        roots: Optional[Iterable[str]] = None,
+        workers: Optional[int] = None,
+        review_type: Optional[ReviewType] = None,
+    ):
+        """Initialize the scanner.
+
+        Args:
+            queue: ReviewJobQueue the reviews are submitted to
+            path: SQLite database file path of the manifest
+            roots: Directories to scan. Defaults to ``settings.scan_roots``.
+            workers: Threads hashing files. Defaults to ``settings.scan_workers``.
+            review_type: Review queued for each file. Defaults to
+                ``settings.scan_review_type``.
+        """
+        self.queue = queue
+        self.path = path
+        self.roots = [os.path.abspath(r) for r in (roots or settings.scan_roots)]
+        self.workers = workers or settings.scan_workers
+        self.review_type = review_type or ReviewType(settings.scan_review_type)
+        self._lock = threading.Lock()
+        self._conn = storage.connect(path)
+        self._conn.execute(_SCHEMA)
+        self._scan_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.last_report: Optional[ScanReport] = None
+
+    def _load_manifest(self) -> Dict[str, Tuple[int, int, str, Optional[str]]]:
+        """Load every manifest row keyed by path."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, mtime_ns, size, sha256, review_id FROM scan_manifest"
+            ).fetchall()
+        return {row[0]: row[1:] for row in rows}
+
+    def _find_candidates(
+        self, report: ScanReport
+    ) -> Tuple[List[_Candidate], List[str]]:
+        """Walk the roots and compare each file's stat with the manifest.
+
+        Args:
+            report: Report to count files and errors in
+
+        Returns:
+            Files that differ from the manifest, and manifest paths that no
+            longer exist
+        """
+        manifest = self._load_manifest()
+        seen = set()
+        candidates = []
+        for root in self.roots:
+            for entry in walk_files(root):
+                try:
+                    stat = entry.stat()
+                except OSError as e:
+                    report.errors[entry.path] = str(e)
+                    continue
+                report.files += 1
+                seen.add(entry.path)
+                known = manifest.get(entry.path)
+                if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+                    report.unchanged += 1
+                    continue
+                candidates.append(
+                    _Candidate(
+                        entry.path,
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                        known[2] if known else None,
+                        known[3] if known else None,
+                    )
+                )
+        roots = tuple(os.path.join(root, "") for root in self.roots)
+        deleted = [p for p in manifest if p not in seen and p.startswith(roots)]
+        return candidates, deleted
+
+    @staticmethod
+    def _fingerprint(candidate: _Candidate) -> _Candidate:
+        """Hash a candidate, and decode it when its hash changed."""
+        candidate.sha256, data = _hash_file(candidate.path)
+        if candidate.sha256 != candidate.known_hash:
+            candidate.text = data.decode("utf-8", errors="replace")
+        return candidate
+
+    def _content_for(self, candidate: _Candidate) -> Content:
+        """Build the content reviewed for a file.
+
+        The file's path is its content ID, so every version of a file is
+        reviewed under the same ID.
+        """
+        root = next(
+            r for r in self.roots if candidate.path.startswith(os.path.join(r, ""))
+        )
+        # Only files with a known content type are ever walked
+        content_type = content_type_for(candidate.path)
+        assert content_type is not None
+        return Content(
+            content_id=candidate.path,
+            title=os.path.relpath(candidate.path, root),
+            text=candidate.text,
+            content_type=content_type,
+            metadata={"path": candidate.path, "sha256": candidate.sha256},
+        )
+
+    def _save(self, rows: List[tuple], deleted: Iterable[str] = ()) -> None:
+        """Write manifest changes in one transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO scan_manifest (path, mtime_ns, size, "
+                    "sha256, review_id, scanned_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.executemany(
+                    "DELETE FROM scan_manifest WHERE path = ?",
+                    [(p,) for p in deleted],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    async def scan(self) -> ScanReport:
+        """Scan the roots once and queue reviews of new and changed files.
+
+        A file whose contents changed while its previous review is still
+        queued has that review cancelled in favour of the new one.
+
+        Returns:
+            Counts of files by outcome
+        """
+        async with self._scan_lock:
+            start = time.perf_counter()
+            report = ScanReport()
+            candidates, deleted = await asyncio.to_thread(self._find_candidates, report)
+            if candidates:
+                loop = asyncio.get_running_loop()
+                with ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="scan"
+                ) as pool:
+                    for i in range(0, len(candidates), _BATCH_SIZE):
+                        batch = candidates[i : i + _BATCH_SIZE]
+                        hashed = await asyncio.gather(
+                            *(
+                                loop.run_in_executor(pool, self._fingerprint, c)
+                                for c in batch
+                            ),
+                            return_exceptions=True,
+                        )
+                        rows = await self._queue_changes(batch, hashed, report)
+                        await asyncio.to_thread(self._save, rows)
+            report.deleted = len(deleted)
+            await asyncio.to_thread(self._save, [], deleted)
+
+            report.elapsed_seconds = time.perf_counter() - start
+            self.last_report = report
+            return report
+
+    async def _queue_changes(
+        self, batch: List[_Candidate], hashed: list, report: ScanReport
+    ) -> List[tuple]:
+        """Queue reviews of the files in a batch whose hash changed.
+
+        Args:
+            batch: Candidates of the batch
+            hashed: Fingerprinted candidates, or the error hashing each
+            report: Report to count outcomes in
+
+        Returns:
+            Manifest rows of the batch
+        """
+        changed = []
+        for candidate, outcome in zip(batch, hashed):
+            if isinstance(outcome, BaseException):
+                report.errors[candidate.path] = str(outcome)
+            elif candidate.sha256 == candidate.known_hash:
+                report.touched += 1
+            else:
+                changed.append(candidate)
+                if candidate.known_hash is None:
+                    report.new += 1
+                else:
+                    report.changed += 1
+                    if candidate.review_id is not None:
+                        await self.queue.cancel(candidate.review_id)
+        if changed:
+            results = await self.queue.submit_many(
+                [self._content_for(c) for c in changed], self.review_type
+            )
+            for candidate, result in zip(changed, results):
+                candidate.review_id = result.review_id
+                # The text is only needed until the job is persisted
+                candidate.text = ""
+            report.queued += len(results)
+
+        now = time.time()
+        rows = [
+            (c.path, c.mtime_ns, c.size, c.sha256, c.review_id, now)
+            for c, outcome in zip(batch, hashed)
+            if not isinstance(outcome, BaseException)
+        ]
+        return rows
+
+    async def _run(self, interval: float) -> None:
+        """Scan every ``interval`` seconds until cancelled."""
+        while True:
+            try:
+                report = await self.scan()
+                logger.info(
+                    "Scanned %d files: %d queued for review in %.2fs",
+                    report.files,
+                    report.queued,
+                    report.elapsed_seconds,
+                )
+            except Exception:
+                logger.exception("Corpus scan failed")
+            await asyncio.sleep(interval)
+
+    def start(self, interval: Optional[float] = None) -> None:
+        """Start scanning periodically.
+
+        Args:
+            interval: Seconds between scans. Defaults to
+                ``settings.scan_interval_seconds``.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._run(interval or settings.scan_interval_seconds)
+            )
+
+    async def stop(self) -> None:
+        """Stop periodic scanning."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
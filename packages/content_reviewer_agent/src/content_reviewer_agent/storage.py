@@ -0,0 +1,51 @@
+"""Helpers for local SQLite storage."""
+
+import os
+import sqlite3
+from typing import Optional
+
+SQLITE_URL_PREFIX = "sqlite:///"
+
+
+def resolve_sqlite_path(
+    database_url: Optional[str], default: Optional[str] = None
+) -> Optional[str]:
+    """Resolve a database URL to a SQLite file path.
+
+    Accepts ``sqlite:///relative.db``, ``sqlite:////absolute.db`` or a plain
+    file path.
+
+    Args:
+        database_url: Database URL from settings
+        default: Path to use when no URL is configured
+
+    Returns:
+        File path, or None if no URL is configured and there is no default
+
+    Raises:
+        ValueError: If the URL points to a non-SQLite database
+    """
+    if not database_url:
+        return default
+    if database_url.startswith(SQLITE_URL_PREFIX):
+        return database_url[len(SQLITE_URL_PREFIX) :]
+    if "://" in database_url:
+        raise ValueError(f"Only SQLite database URLs are supported: {database_url}")
+    return database_url
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open a SQLite connection usable from worker threads.
+
+    Args:
+        path: Database file path
+
+    Returns:
+        SQLite connection
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    return conn
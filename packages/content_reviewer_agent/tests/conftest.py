@@ -5,6 +5,17 @@ import dotenv
 dotenv.load_dotenv()
 
 
+@pytest.fixture(autouse=True)
+def clear_review_cache():
+    """Start every test with an empty review cache."""
+    from content_reviewer_agent.agents.cache import get_review_cache
+
+    cache = get_review_cache()
+    if cache is not None:
+        cache.clear()
+    yield
+
+
 @pytest.fixture
 def sample_content_text():
     """Sample text content for testing."""
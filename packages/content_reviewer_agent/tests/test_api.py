@@ -1,17 +1,28 @@
 """Tests for FastAPI endpoints."""
 
+import asyncio
+import json
+import subprocess
+import sys
+import time
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
+from content_reviewer_agent.api import routes
+from content_reviewer_agent.api.routes import review_service
+from content_reviewer_agent.config import settings
 from content_reviewer_agent.main import app
+from content_reviewer_agent.models.ai_schema import AIReviewResponse
 from content_reviewer_agent.models.content import Content
 from content_reviewer_agent.models.review_result import (
     ReviewResult,
     ReviewStatus,
     ReviewType,
 )
+from content_reviewer_agent.services.jobs import ReviewJobQueue
 
 client = TestClient(app)
 
@@ -31,6 +42,61 @@ def test_health_check():
     assert response.json()["status"] == "healthy"
 
 
+def test_ready_after_startup(tmp_path, monkeypatch):
+    """Test /ready reports 503 until the agents and job workers are up."""
+    monkeypatch.setattr(
+        routes, "_job_queue", ReviewJobQueue(review_service, str(tmp_path / "j.db"))
+    )
+    assert client.get("/ready").status_code == 503
+
+    with TestClient(app) as started:
+        deadline = time.monotonic() + 5
+        while started.get("/ready").status_code != 200:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert started.get("/ready").json() == {"status": "ready"}
+
+
+def test_ready_reports_a_failed_startup(caplog, tmp_path, monkeypatch):
+    """Test a startup failure is logged and reported instead of hanging."""
+    monkeypatch.setattr(settings, "database_url", str(tmp_path / "jobs.db"))
+    monkeypatch.setattr(routes, "_job_queue", None)
+    failing = RuntimeError("boom")
+    with patch("content_reviewer_agent.main.get_review_service", side_effect=failing):
+        with TestClient(app) as started:
+            deadline = time.monotonic() + 5
+            while started.get("/ready").json()["status"] == "starting":
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+            response = started.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json() == {"status": "failed", "error": "RuntimeError: boom"}
+    assert "failed to start" in caplog.text
+    # Shutdown closed only what startup created
+    assert routes.peek_job_queue() is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_import_defers_agents_and_sdk():
+    """Test importing the app loads neither the agents nor the model SDK."""
+    heavy = [
+        "google.genai",
+        "numpy",
+        "content_reviewer_agent.services.review_service",
+    ]
+    code = (
+        "import sys, content_reviewer_agent.main; "
+        f"print([m for m in {heavy!r} if m in sys.modules])"
+    )
+
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == "[]"
+
+
 def test_get_agents():
     """Test agents endpoint."""
     response = client.get("/api/v1/agents")
@@ -186,3 +252,145 @@ def test_review_with_query_param():
             json=content,
         )
         assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reviews_do_not_block_event_loop():
+    """Test that concurrent reviews overlap and /health stays responsive."""
+    delay = 0.3
+    requests_count = 4
+
+    def blocking_generate_content(**kwargs):
+        # Simulates the synchronous network round-trip of the genai client
+        time.sleep(delay)
+        response = Mock()
+        response.text = AIReviewResponse(issues=[]).model_dump_json()
+        return response
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        with patch.object(
+            review_service.error_agent.client.models,
+            "generate_content",
+            side_effect=blocking_generate_content,
+        ):
+            start = time.perf_counter()
+            reviews = [
+                ac.post(
+                    "/api/v1/review?review_type=error_detection",
+                    json={"title": f"Lesson {i}", "text": f"Distinct text {i}."},
+                )
+                for i in range(requests_count)
+            ]
+            review_tasks = [asyncio.create_task(r) for r in reviews]
+
+            await asyncio.sleep(delay / 3)
+            health_start = time.perf_counter()
+            health = await ac.get("/health")
+            health_elapsed = time.perf_counter() - health_start
+
+            responses = await asyncio.gather(*review_tasks)
+            elapsed = time.perf_counter() - start
+
+    assert health.status_code == 200
+    assert health_elapsed < delay
+    assert all(r.status_code == 200 for r in responses)
+    assert all(r.json()["status"] == "completed" for r in responses)
+    # Serialised calls would take requests_count * delay
+    assert elapsed < delay * requests_count / 2
+
+
+def test_metrics_endpoint():
+    """Test that cache counters are exposed."""
+    response = client.get("/api/v1/metrics")
+    assert response.status_code == 200
+    assert "hits" in response.json()["cache"]
+    assert "misses" in response.json()["cache"]
+
+
+def test_review_batch_streams_ndjson():
+    """Test that batch results are streamed one JSON object per line."""
+    contents = [
+        {"title": f"Lesson {i}", "text": f"Text {i}.", "content_id": f"c-{i}"}
+        for i in range(3)
+    ]
+
+    async def fake_review(content, review_type, use_cache=True):
+        return ReviewResult(
+            content_id=content.content_id,
+            review_type=review_type,
+            status=ReviewStatus.COMPLETED,
+        )
+
+    with patch(
+        "content_reviewer_agent.api.routes.review_service.review_content",
+        side_effect=fake_review,
+    ):
+        response = client.post(
+            "/api/v1/review/batch?concurrency=2",
+            json={"contents": contents, "review_type": "error_detection"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [line for line in response.text.splitlines() if line]
+    assert sorted(
+        ReviewResult.model_validate_json(line).content_id for line in lines
+    ) == [
+        "c-0",
+        "c-1",
+        "c-2",
+    ]
+
+
+def test_review_stream_sends_server_sent_events():
+    """Test that the streaming endpoint emits agent and result events."""
+    content = {"title": "Test Content", "text": "I recieve emails."}
+
+    async def fake_stream(content, review_type, use_cache=True):
+        yield "agent", {"agent": "Error Detection Agent", "issues": []}
+        yield "result", {"status": "completed", "quality_score": 100.0}
+
+    with patch(
+        "content_reviewer_agent.api.routes.review_service.review_content_stream",
+        side_effect=fake_stream,
+    ):
+        response = client.post(
+            "/api/v1/review/stream?review_type=error_detection", json=content
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block for block in response.text.split("\n\n") if block]
+    assert events[0].startswith("event: agent\ndata: ")
+    assert events[-1].startswith("event: result\ndata: ")
+    assert json.loads(events[-1].split("data: ", 1)[1])["quality_score"] == 100.0
+
+
+def test_review_response_is_serialised_once():
+    """Test review results are rendered directly, matching the schema."""
+    result = ReviewResult(
+        content_id="test-123",
+        review_type=ReviewType.ERROR_DETECTION,
+        status=ReviewStatus.COMPLETED,
+        metadata={"prompts": {"truncated": False}},
+    )
+
+    with (
+        patch(
+            "content_reviewer_agent.api.routes.review_service.review_content",
+            return_value=result,
+        ),
+        patch(
+            "fastapi.routing.serialize_response",
+            side_effect=AssertionError("re-validated"),
+        ),
+    ):
+        response = client.post(
+            "/api/v1/review/errors",
+            json={"title": "Test Content", "text": "Text."},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert ReviewResult.model_validate_json(response.content) == result
@@ -0,0 +1,107 @@
+"""Tests for the review response cache."""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from content_reviewer_agent.agents.cache import (
+    MemoryCacheBackend,
+    ReviewCache,
+    SQLiteCacheBackend,
+    review_cache_key,
+)
+from content_reviewer_agent.agents.error_detection import ErrorDetectionAgent
+from content_reviewer_agent.models.ai_schema import AIReviewIssue, AIReviewResponse
+from content_reviewer_agent.models.content import Content, ContentType
+
+
+def _mock_response():
+    """Build a mocked model response with a single spelling issue."""
+    response = Mock()
+    response.text = AIReviewResponse(
+        issues=[
+            AIReviewIssue(
+                type="spelling",
+                severity="low",
+                description="Spelling error",
+                original_text="recieve",
+                suggested_fix="receive",
+            )
+        ]
+    ).model_dump_json()
+    return response
+
+
+def test_cache_key_ignores_content_id():
+    """Test that identical lessons share a key regardless of their id."""
+    first = Content(title="Lesson", text="Same text.")
+    second = Content(title="Lesson", text="Same text.")
+    changed = Content(title="Lesson", text="Other text.", content_type=ContentType.HTML)
+
+    key = review_cache_key(first, "agent", "model", "1")
+    assert key == review_cache_key(second, "agent", "model", "1")
+    assert key != review_cache_key(changed, "agent", "model", "1")
+    assert key != review_cache_key(first, "agent", "other-model", "1")
+    assert key != review_cache_key(first, "agent", "model", "2")
+
+
+def test_memory_backend_lru_and_ttl():
+    """Test size bound and expiry of the memory tier."""
+    backend = MemoryCacheBackend(max_entries=2, ttl_seconds=60)
+    backend.set("a", "1")
+    backend.set("b", "2")
+    backend.get("a")
+    backend.set("c", "3")
+
+    assert backend.get("a") == "1"
+    assert backend.get("b") is None
+    assert backend.get("c") == "3"
+
+    expiring = MemoryCacheBackend(max_entries=2, ttl_seconds=0)
+    expiring.set("a", "1")
+    time.sleep(0.01)
+    assert expiring.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_tier_promotes_to_memory(tmp_path):
+    """Test that a disk hit survives a fresh memory tier and is promoted."""
+    path = str(tmp_path / "cache.db")
+    await ReviewCache([MemoryCacheBackend(10, 60), SQLiteCacheBackend(path, 60)]).set(
+        "key", "value"
+    )
+
+    memory = MemoryCacheBackend(10, 60)
+    cache = ReviewCache([memory, SQLiteCacheBackend(path, 60)])
+
+    assert await cache.get("key") == "value"
+    assert memory.get("key") == "value"
+    assert await cache.get("missing") is None
+
+    stats = cache.stats()
+    assert stats["tiers"]["sqlite"]["hits"] == 1
+    assert stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_agent_reuses_cached_response():
+    """Test that a repeated review skips the model call."""
+    cache = ReviewCache([MemoryCacheBackend(10, 60)])
+    agent = ErrorDetectionAgent()
+    agent.cache = cache
+
+    with patch.object(agent.client.models, "generate_content") as mock_generate:
+        mock_generate.return_value = _mock_response()
+
+        first = await agent.review(Content(title="Lesson", text="I recieve mail."))
+        second = await agent.review(Content(title="Lesson", text="I recieve mail."))
+        await agent.review(
+            Content(title="Lesson", text="I recieve mail."), use_cache=False
+        )
+
+    assert mock_generate.call_count == 2
+    assert len(first) == len(second) == 1
+    assert first[0].content_id != second[0].content_id
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["bypassed"] == 1
@@ -0,0 +1,182 @@
+"""Tests for the fast-then-strong model cascade."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from content_reviewer_agent.agents.cascade import CascadeRouting
+from content_reviewer_agent.agents.comprehension import ComprehensionAgent
+from content_reviewer_agent.agents.telemetry import ReviewTelemetry, track_telemetry
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.ai_schema import AIReviewIssue, AIReviewResponse
+from content_reviewer_agent.models.content import Content
+from content_reviewer_agent.models.review_result import ReviewType
+from content_reviewer_agent.services.review_service import ContentReviewService
+
+FAST = "fast-model"
+STRONG = "strong-model"
+
+
+def _response(confidence: float, description: str) -> Mock:
+    """Build a model response with one issue."""
+    data = AIReviewResponse(
+        issues=[
+            AIReviewIssue(
+                type="comprehension",
+                severity="medium",
+                description=description,
+                original_text="Polymorphism",
+                confidence=confidence,
+            )
+        ]
+    )
+    return Mock(text=data.model_dump_json())
+
+
+@pytest.fixture
+def cascade_settings():
+    """Enable the cascade with the readability pre-filter out of the way."""
+    with (
+        patch.object(settings, "cascade_enabled", True),
+        patch.object(settings, "cascade_fast_model", FAST),
+        patch.object(settings, "google_model_name", STRONG),
+        patch.object(settings, "cascade_confidence_threshold", 0.7),
+        patch.object(settings, "local_readability_filter", False),
+    ):
+        yield
+
+
+def _content() -> Content:
+    """Build a one-sentence content."""
+    return Content(title="Test", text="Polymorphism lets objects share interfaces.")
+
+
+async def _review(agent, responses):
+    """Review with the given response per model, recording the routing."""
+    routing = CascadeRouting()
+    with patch.object(agent.client.models, "generate_content") as mock_generate:
+        mock_generate.side_effect = lambda **kwargs: responses[kwargs["model"]]
+        with track_telemetry(ReviewTelemetry(routing)):
+            issues = await agent.review(_content(), use_cache=False)
+    models = [call.kwargs["model"] for call in mock_generate.call_args_list]
+    return issues, models, routing.for_agent(agent.name)
+
+
+@pytest.mark.asyncio
+async def test_confident_fast_answer_is_kept(cascade_settings):
+    """Test the strong model is skipped when the fast model is confident."""
+    agent = ComprehensionAgent()
+
+    issues, models, stats = await _review(
+        agent, {FAST: _response(0.9, "fast"), STRONG: _response(0.9, "strong")}
+    )
+
+    assert models == [FAST]
+    assert [issue.description for issue in issues] == ["fast"]
+    assert issues[0].reviewed_by_agent == f"{agent.name} ({FAST})"
+    assert (stats.prompts, stats.escalated) == (1, 0)
+    assert stats.summary(0.25)["relative_cost"] == 0.25
+
+
+@pytest.mark.asyncio
+async def test_low_confidence_escalates(cascade_settings):
+    """Test a low-confidence issue sends its sentence to the strong model."""
+    agent = ComprehensionAgent()
+
+    issues, models, stats = await _review(
+        agent, {FAST: _response(0.4, "fast"), STRONG: _response(0.9, "strong")}
+    )
+
+    assert models == [FAST, STRONG]
+    assert [issue.description for issue in issues] == ["strong"]
+    assert issues[0].reviewed_by_agent == f"{agent.name} ({STRONG})"
+    assert (stats.escalated, stats.low_confidence) == (1, 1)
+    assert stats.strong_tokens == stats.fast_tokens > 0
+
+
+@pytest.mark.asyncio
+async def test_only_doubtful_sentences_escalate(cascade_settings):
+    """Test confident issues are kept and only doubtful sentences escalate."""
+    agent = ComprehensionAgent()
+    content = Content(
+        title="Test",
+        text="Encapsulation hides state behind methods. "
+        "Polymorphism lets objects share interfaces.\n\n"
+        "Inheritance reuses the behaviour of a parent class.",
+    )
+    fast = AIReviewResponse(
+        issues=[
+            AIReviewIssue(
+                type="comprehension",
+                severity="medium",
+                description="confident",
+                original_text="Encapsulation hides state",
+                confidence=0.9,
+            ),
+            AIReviewIssue(
+                type="comprehension",
+                severity="medium",
+                description="doubtful",
+                original_text="Polymorphism",
+                confidence=0.4,
+            ),
+        ]
+    )
+    responses = {
+        FAST: Mock(text=fast.model_dump_json()),
+        STRONG: _response(0.9, "strong"),
+    }
+    routing = CascadeRouting()
+
+    with patch.object(agent.client.models, "generate_content") as mock_generate:
+        mock_generate.side_effect = lambda **kwargs: responses[kwargs["model"]]
+        with track_telemetry(ReviewTelemetry(routing)):
+            issues = await agent.review(content, use_cache=False)
+
+    strong_prompt = mock_generate.call_args_list[1].kwargs["contents"]
+    assert "Polymorphism lets objects share interfaces." in strong_prompt
+    assert "Encapsulation" not in strong_prompt
+    assert "Inheritance" not in strong_prompt
+    assert [issue.description for issue in issues] == ["confident", "strong"]
+    assert issues[1].start_offset == content.text.index("Polymorphism")
+    stats = routing.for_agent(agent.name)
+    assert (stats.escalated, stats.low_confidence) == (1, 1)
+    assert 0 < stats.strong_tokens < stats.fast_tokens
+
+
+@pytest.mark.asyncio
+async def test_invalid_output_escalates(cascade_settings):
+    """Test a response failing validation sends the prompt to the strong model."""
+    agent = ComprehensionAgent()
+
+    issues, models, stats = await _review(
+        agent,
+        {
+            FAST: Mock(text='{"issues": [{"type": 1}]}'),
+            STRONG: _response(0.9, "strong"),
+        },
+    )
+
+    assert models == [FAST, STRONG]
+    assert [issue.description for issue in issues] == ["strong"]
+    assert (stats.escalated, stats.invalid_output) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_service_records_routing(cascade_settings):
+    """Test the routing decisions end up in the result metadata."""
+    service = ContentReviewService()
+    responses = {FAST: _response(0.4, "fast"), STRONG: _response(0.9, "strong")}
+
+    with patch.object(
+        service.comprehension_agent.client.models, "generate_content"
+    ) as mock_generate:
+        mock_generate.side_effect = lambda **kwargs: responses[kwargs["model"]]
+        result = await service.review_content(
+            _content(), ReviewType.COMPREHENSION, use_cache=False
+        )
+
+    cascade = result.metadata["cascade"]
+    assert (cascade["fast_model"], cascade["strong_model"]) == (FAST, STRONG)
+    assert (cascade["prompts"], cascade["escalated"]) == (1, 1)
+    assert cascade["agents"][service.comprehension_agent.name]["low_confidence"] == 1
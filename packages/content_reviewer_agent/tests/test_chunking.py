@@ -0,0 +1,98 @@
+"""Tests for chunked review of long documents."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from content_reviewer_agent.agents.error_detection import ErrorDetectionAgent
+from content_reviewer_agent.analysis.chunking import (
+    CHARS_PER_TOKEN,
+    chunk_text,
+    estimate_tokens,
+)
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.ai_schema import AIReviewIssue, AIReviewResponse
+from content_reviewer_agent.models.content import Content
+
+
+def _document(paragraphs: int) -> str:
+    """Build a document of numbered paragraphs."""
+    return "\n\n".join(
+        f"Paragraph {i} talks about topic {i} in some detail."
+        for i in range(paragraphs)
+    )
+
+
+def test_short_text_is_single_chunk():
+    """Test that text under the budget is not split."""
+    chunks = chunk_text("Short text.", max_tokens=100)
+    assert len(chunks) == 1
+    assert chunks[0].start == 0
+    assert chunks[0].text == "Short text."
+
+
+def test_chunks_are_paragraph_aligned_and_bounded():
+    """Test window size, alignment, coverage and overlap."""
+    text = _document(40)
+    chunks = chunk_text(text, max_tokens=50, overlap_tokens=15)
+
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert chunk.text == text[chunk.start : chunk.end]
+        assert len(chunk.text) <= 50 * CHARS_PER_TOKEN
+        assert chunk.text.startswith("Paragraph")
+        assert chunk.text.endswith("detail.")
+    # Windows cover the whole document and overlap their neighbours
+    assert chunks[0].start == 0
+    assert chunks[-1].end == len(text)
+    for previous, current in zip(chunks, chunks[1:]):
+        assert current.start < previous.end
+        assert current.start > previous.start
+
+
+def test_oversized_paragraph_is_split():
+    """Test that a paragraph over the budget is cut at sentences."""
+    text = " ".join(f"Sentence number {i}." for i in range(100))
+    chunks = chunk_text(text, max_tokens=20)
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk.text) <= 20 for chunk in chunks)
+
+
+@pytest.mark.asyncio
+async def test_agent_reviews_chunks_and_merges_overlaps():
+    """Test absolute offsets and deduplication of issues in overlaps."""
+    agent = ErrorDetectionAgent()
+    text = _document(30).replace("topic 12", "topik 12")
+    content = Content(title="Long handout", text=text)
+
+    def generate_content(**kwargs):
+        issues = []
+        if "topik 12" in kwargs["contents"]:
+            issues.append(
+                AIReviewIssue(
+                    type="spelling",
+                    severity="low",
+                    description="Misspelled word",
+                    original_text="topik 12",
+                    suggested_fix="topic 12",
+                )
+            )
+        response = Mock()
+        response.text = AIReviewResponse(issues=issues).model_dump_json()
+        return response
+
+    with (
+        patch.object(settings, "chunk_max_tokens", 60),
+        patch.object(settings, "chunk_overlap_tokens", 30),
+    ):
+        chunks = chunk_text(text, 60, 30)
+        with patch.object(
+            agent.client.models, "generate_content", side_effect=generate_content
+        ) as mock_generate:
+            issues = await agent.review(content)
+
+    assert mock_generate.call_count == len(chunks)
+    assert sum("topik 12" in chunk.text for chunk in chunks) > 1
+    assert len(issues) == 1
+    assert text[issues[0].start_offset : issues[0].end_offset] == "topik 12"
+    assert issues[0].content_id == content.content_id
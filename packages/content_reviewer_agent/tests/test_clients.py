@@ -0,0 +1,108 @@
+"""Tests for the shared genai client registry and its connection pool."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from content_reviewer_agent.agents import clients
+from content_reviewer_agent.agents.clients import ClientRegistry
+from content_reviewer_agent.agents.comprehension import ComprehensionAgent
+from content_reviewer_agent.agents.error_detection import ErrorDetectionAgent
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers every HEAD with 200 over persistent HTTP/1.1 connections."""
+
+    protocol_version = "HTTP/1.1"
+    peers = set()
+    lock = threading.Lock()
+
+    def do_HEAD(self):
+        with self.lock:
+            KeepAliveHandler.peers.add(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_url():
+    """Run the keep-alive stub server in a background thread."""
+    KeepAliveHandler.peers = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_registry_shares_one_client_per_key():
+    """Test clients are reused per key and share one HTTP pool."""
+    registry = ClientRegistry(max_connections=4, max_keepalive=2, http2=False)
+
+    first = registry.get("key-a")
+
+    assert registry.get("key-a") is first
+    assert registry.get("key-b") is not first
+    assert first._api_client._httpx_client is registry.http
+    assert registry.stats()["clients"] == 2
+    registry.close()
+    assert registry.stats()["clients"] == 0
+
+
+def test_agents_share_the_default_client():
+    """Test every agent reuses the process-wide client, fetched on first use."""
+    registry = ClientRegistry(http2=False)
+
+    with patch.object(clients, "_registry", registry):
+        error_agent = ErrorDetectionAgent()
+        comprehension_agent = ComprehensionAgent()
+        assert registry.stats()["clients"] == 0
+
+        assert error_agent.client is comprehension_agent.client
+        assert error_agent.client is registry.get()
+
+
+def test_agents_follow_the_registry_after_close():
+    """Test agents get a client on the new pool once the registry is closed."""
+    registry = ClientRegistry(http2=False)
+
+    with patch.object(clients, "_registry", registry):
+        agent = ErrorDetectionAgent()
+        before = agent.client
+        registry.close()
+
+        after = agent.client
+        assert after is not before
+        assert not after._api_client._httpx_client.is_closed
+    registry.close()
+
+
+def test_warm_up_opens_pooled_connections(stub_url):
+    """Test pre-warmed connections stay open and are reused afterwards."""
+    registry = ClientRegistry(max_connections=8, max_keepalive=3, http2=False)
+
+    with patch.object(clients, "GENAI_BASE_URL", stub_url):
+        assert registry.warm_up(5) == 3
+        warmed = set(KeepAliveHandler.peers)
+        for _ in range(3):
+            registry.http.head(stub_url)
+
+    assert len(warmed) == 3
+    assert KeepAliveHandler.peers == warmed
+    registry.close()
+
+
+def test_warm_up_survives_unreachable_host():
+    """Test a failed warm-up is reported as zero connections, not raised."""
+    registry = ClientRegistry(http2=False)
+
+    with patch.object(clients, "GENAI_BASE_URL", "http://127.0.0.1:9/"):
+        assert registry.warm_up(2) == 0
+    registry.close()
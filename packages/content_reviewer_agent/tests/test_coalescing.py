@@ -0,0 +1,101 @@
+"""Tests for single-flight coalescing of identical reviews."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from content_reviewer_agent.models.content import (
+    Content,
+    ContentType,
+    IssueSeverity,
+    IssueType,
+    ReviewIssue,
+)
+from content_reviewer_agent.models.review_result import ReviewStatus, ReviewType
+from content_reviewer_agent.services.coalescing import SingleFlight
+from content_reviewer_agent.services.review_service import ContentReviewService
+
+
+def _lesson(content_id, text="Redes conectam computadores."):
+    return Content(
+        content_id=content_id,
+        title="Aula",
+        text=text,
+        content_type=ContentType.TEXT,
+    )
+
+
+@pytest.mark.asyncio
+async def test_identical_reviews_share_one_execution():
+    """Test concurrent identical reviews call the agents once."""
+    service = ContentReviewService()
+    calls = []
+
+    async def slow_review(content, use_cache=True):
+        calls.append(content.content_id)
+        await asyncio.sleep(0.05)
+        return [
+            ReviewIssue(
+                content_id=content.content_id,
+                issue_type=IssueType.SPELLING,
+                severity=IssueSeverity.LOW,
+                description="Typo",
+                original_text="Redes",
+            )
+        ]
+
+    with patch.object(service.error_agent, "review", side_effect=slow_review):
+        results = await asyncio.gather(
+            *(
+                service.review_content(
+                    _lesson(f"aluno-{i}"), ReviewType.ERROR_DETECTION
+                )
+                for i in range(10)
+            ),
+            service.review_content(
+                _lesson("outra", "Outro texto."), ReviewType.ERROR_DETECTION
+            ),
+        )
+
+    assert sorted(calls) == ["aluno-0", "outra"]
+    assert all(r.status == ReviewStatus.COMPLETED for r in results)
+    assert [r.content_id for r in results[:10]] == [f"aluno-{i}" for i in range(10)]
+    assert all(r.issues[0].content_id == r.content_id for r in results)
+    assert len({r.review_id for r in results}) == 11
+    assert results[3].metadata["coalesced_with"] == results[0].review_id
+    assert service.history.get("aluno-3")[1] is results[3]
+    assert service.get_metrics()["coalescing"] == {
+        "executions": 2,
+        "coalesced": 9,
+        "cancelled": 0,
+        "max_waiters": 9,
+        "in_flight": 0,
+        "waiting": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_execution_outlives_cancelled_waiters():
+    """Test the execution runs on while anyone waits and stops when none do."""
+    flight = SingleFlight()
+    started = []
+
+    async def execute():
+        started.append(1)
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.create_task(flight.run("k", execute))
+    second = asyncio.create_task(flight.run("k", execute))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == ("done", True)
+    assert started == [1]
+
+    lone = asyncio.create_task(flight.run("k", execute))
+    await asyncio.sleep(0)
+    lone.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await lone
+    assert flight.stats()["cancelled"] == 1
@@ -0,0 +1,186 @@
+"""Tests for local parsing of code content."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from content_reviewer_agent.agents.content_update import ContentUpdateAgent
+from content_reviewer_agent.agents.error_detection import ErrorDetectionAgent
+from content_reviewer_agent.analysis.code import (
+    COMMENT,
+    DOCSTRING,
+    IDENTIFIER,
+    analyse_code,
+)
+from content_reviewer_agent.models.ai_schema import AIReviewResponse
+from content_reviewer_agent.models.content import (
+    Content,
+    ContentType,
+    IssueSeverity,
+    IssueType,
+)
+
+PYTHON_SOURCE = '''#!/usr/bin/env python
+"""Cálculo de médias da turma."""
+import numpy as np  # noqa: F401
+from datetime import datetime
+
+
+def calcular_media(notas):
+    """Retorna a média das notas."""
+    # Converte antes de somar
+    título = "média"; total = np.float(sum(notas))
+    return total / len(notas), datetime.utcnow()
+'''
+
+
+def _spans(text, analysis, kind):
+    return [text[s.start : s.end] for s in analysis.prose if s.kind == kind]
+
+
+def test_python_prose_and_resolved_names():
+    """Test comments, docstrings and names are found at character offsets."""
+    analysis = analyse_code(PYTHON_SOURCE, "python")
+
+    assert analysis.syntax_errors == ()
+    assert _spans(PYTHON_SOURCE, analysis, COMMENT) == ["# Converte antes de somar"]
+    assert _spans(PYTHON_SOURCE, analysis, DOCSTRING) == [
+        '"""Cálculo de médias da turma."""',
+        '"""Retorna a média das notas."""',
+    ]
+    assert _spans(PYTHON_SOURCE, analysis, IDENTIFIER) == [
+        "calcular_media",
+        "notas",
+        "título",
+        "total",
+    ]
+    names = {
+        (name.qualified, PYTHON_SOURCE[name.start : name.end])
+        for name in analysis.names
+    }
+    assert ("numpy.float()", "np.float") in names
+    assert ("datetime.datetime.utcnow()", "datetime.utcnow") in names
+    assert ("numpy", "numpy as np") in names
+
+
+def test_tokenizer_fallback_for_other_languages():
+    """Test comments skip strings and unbalanced brackets are reported."""
+    source = (
+        "// Soma dois números\n"
+        'const url = "http://exemplo.com/*";\n'
+        "function somar(a, b) {\n"
+        "  /* resultado */ return (a + b;\n"
+        "}\n"
+    )
+    analysis = analyse_code(source, "javascript")
+
+    assert analysis.names is None
+    assert _spans(source, analysis, COMMENT) == [
+        "// Soma dois números",
+        "/* resultado */",
+    ]
+    assert _spans(source, analysis, IDENTIFIER) == ["url", "somar"]
+    (problem,) = analysis.syntax_errors
+    assert (problem.line, problem.message) == (5, "Unmatched '}'")
+
+
+def test_regex_and_template_literals_are_skipped():
+    """Test brackets inside regex and template literals are not counted."""
+    source = (
+        "const re = /[(]/;\n"
+        "const half = (total / 2) / (count);\n"
+        "const label = `abre ( e ${nome} [`;\n"
+        "function fecha(s) { return s.replace(/}/g, ''); }\n"
+    )
+
+    assert analyse_code(source, "javascript").syntax_errors == ()
+
+
+@pytest.mark.asyncio
+async def test_tokenizer_problems_are_only_possible_errors():
+    """Test bracket problems outside Python are reported at low severity."""
+    agent = ErrorDetectionAgent()
+    content = Content(
+        title="soma.js",
+        text="function soma(a, b) {\n  return (a + b;\n}\n",
+        content_type=ContentType.CODE,
+    )
+
+    with patch.object(agent.client.models, "generate_content") as mock_generate:
+        mock_generate.return_value = Mock(
+            text=AIReviewResponse(issues=[]).model_dump_json()
+        )
+        issues = await agent.review(content, use_cache=False)
+
+    (issue,) = issues
+    assert issue.severity == IssueSeverity.LOW
+    assert issue.confidence == 0.5
+    assert issue.description.startswith("Possible syntax error")
+
+
+@pytest.mark.asyncio
+async def test_syntax_errors_reported_without_model():
+    """Test the parser's syntax errors need no model call."""
+    agent = ErrorDetectionAgent()
+    content = Content(
+        title="exercicio.py",
+        text="def f(x):\n    return x +\n",
+        content_type=ContentType.CODE,
+    )
+
+    with patch.object(agent.client.models, "generate_content") as mock_generate:
+        issues = await agent.review(content, use_cache=False)
+
+    mock_generate.assert_not_called()
+    (issue,) = issues
+    assert issue.issue_type == IssueType.SYNTAX
+    assert issue.line == 2
+    assert issue.confidence == 1.0
+    assert "(parser)" in issue.reviewed_by_agent
+
+
+@pytest.mark.asyncio
+async def test_only_prose_of_code_reaches_the_model():
+    """Test the prompt holds the comments and docstrings but not the code."""
+    agent = ErrorDetectionAgent()
+    content = Content(
+        title="medias.py", text=PYTHON_SOURCE, content_type=ContentType.CODE
+    )
+
+    with patch.object(agent.client.models, "generate_content") as mock_generate:
+        mock_generate.return_value = Mock(
+            text=AIReviewResponse(issues=[]).model_dump_json()
+        )
+        await agent.review(content, use_cache=False)
+
+    prompt = mock_generate.call_args.kwargs["contents"]
+    assert "# Converte antes de somar" in prompt
+    assert "Retorna a média das notas." in prompt
+    assert "calcular_media" in prompt
+    assert "return total" not in prompt
+    assert "noqa" not in prompt
+
+
+@pytest.mark.asyncio
+async def test_deprecated_apis_matched_through_imports():
+    """Test deprecated APIs are found by the names they were imported as."""
+    agent = ContentUpdateAgent()
+    text = (
+        "from asyncio import coroutine\n"
+        "import numpy as np\n\n"
+        "@coroutine\n"
+        "def tarefa():\n"
+        "    yield np.float(1)\n"
+    )
+    content = Content(title="tarefa.py", text=text, content_type=ContentType.CODE)
+
+    with patch.object(agent.client.models, "generate_content") as mock_generate:
+        issues = await agent.review(content, use_cache=False)
+
+    mock_generate.assert_not_called()
+    assert [(i.issue_type, i.original_text) for i in issues] == [
+        (IssueType.DEPRECATED, "coroutine"),
+        (IssueType.DEPRECATED, "coroutine"),
+        (IssueType.DEPRECATED, "np.float"),
+    ]
+    assert issues[1].line == 4
@@ -0,0 +1,133 @@
+"""Tests for prompt compaction and token budgeting."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from content_reviewer_agent.agents.comprehension import ComprehensionAgent
+from content_reviewer_agent.agents.error_detection import ErrorDetectionAgent
+from content_reviewer_agent.analysis.chunking import estimate_tokens
+from content_reviewer_agent.analysis.compaction import compact_text, truncate_to_budget
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.ai_schema import AIReviewResponse
+from content_reviewer_agent.models.content import Content, ContentType
+from content_reviewer_agent.models.review_result import ReviewType
+from content_reviewer_agent.services.review_service import ContentReviewService
+
+LESSON = (
+    "FIAP - Fase 2 - Redes\n"
+    "Uma   rede    conecta\tcomputadores.   \n"
+    "\n\n\n"
+    "FIAP - Fase 2 - Redes\n"
+    "Exemplo:\n"
+    "```python\n"
+    "def conectar(host):\n"
+    "    return socket.create_connection((host, 80))\n"
+    "```\n"
+    "FIAP - Fase 2 - Redes\n"
+    "Fim da aula.\n"
+)
+
+
+def test_compact_text_normalises_and_drops_boilerplate():
+    """Test whitespace and repeated headers shrink while code is kept."""
+    compacted = compact_text(LESSON)
+
+    assert compacted.text.count("FIAP - Fase 2 - Redes") == 1
+    assert "Uma rede conecta computadores." in compacted.text
+    assert "\n\n\n" not in compacted.text
+    assert "    return socket" in compacted.text
+    assert compacted.boilerplate_lines == 2
+    assert compacted.tokens_after < compacted.tokens_before
+    assert not compacted.truncated
+
+
+def test_compact_text_elides_code_blocks():
+    """Test code blocks are summarised for agents that ignore code."""
+    compacted = compact_text(LESSON, elide_code=True)
+
+    assert "socket" not in compacted.text
+    summary = "[python code block omitted: 2 lines defining conectar]"
+    assert summary in compacted.text
+    assert compacted.elided_blocks == 1
+
+
+def test_code_content_keeps_indentation():
+    """Test code content is never collapsed or elided."""
+    code = "def f():\n    if x:\n        return  1\n"
+
+    compacted = compact_text(code, elide_code=True, keep_indentation=True)
+
+    assert compacted.text == code.strip()
+
+
+def test_truncate_to_budget_cuts_at_paragraphs():
+    """Test over-budget text is cut at a paragraph break and flagged."""
+    text = "\n\n".join(f"Paragraph {i} " + "word " * 40 for i in range(20))
+
+    cut, truncated = truncate_to_budget(text, 200)
+
+    assert truncated
+    assert estimate_tokens(cut) <= 220
+    assert cut.rstrip().endswith("tokens omitted]")
+    assert cut.split("\n[...")[0].rstrip().endswith("word")
+    assert truncate_to_budget("short", 200) == ("short", False)
+
+
+@pytest.mark.asyncio
+async def test_agent_prompt_is_compacted_and_budgeted():
+    """Test the prompt sent fits the budget and reports the truncation."""
+    agent = ComprehensionAgent()
+    content = Content(
+        title="Test",
+        text="\n\n".join(f"Frase {i} sobre redes. " * 30 for i in range(30)),
+    )
+
+    with (
+        patch.object(settings, "local_readability_filter", False),
+        patch.object(settings, "chunk_max_tokens", 100000),
+        patch.object(settings, "prompt_token_budget", 1000),
+        patch.object(agent.client.models, "generate_content") as mock_generate,
+    ):
+        mock_generate.return_value = Mock(
+            text=AIReviewResponse(issues=[]).model_dump_json()
+        )
+        await agent.review(content, use_cache=False)
+
+    prompt = mock_generate.call_args.kwargs["contents"]
+    assert estimate_tokens(prompt) <= 1050
+    assert "tokens omitted]" in prompt
+
+
+@pytest.mark.asyncio
+async def test_service_reports_prompt_tokens():
+    """Test token counts before and after compaction reach the result."""
+    service = ContentReviewService()
+    content = Content(
+        title="Test",
+        text="Texto   com    espaços   demais.",
+        content_type=ContentType.TEXT,
+    )
+
+    with (
+        patch.object(settings, "local_error_filter", False),
+        patch.object(ErrorDetectionAgent, "get_review_prompt", lambda self, c: c.text),
+        patch.object(
+            service.error_agent.client.models, "generate_content"
+        ) as mock_generate,
+    ):
+        mock_generate.return_value = Mock(
+            text=AIReviewResponse(issues=[]).model_dump_json()
+        )
+        result = await service.review_content(
+            content, ReviewType.ERROR_DETECTION, use_cache=False
+        )
+
+    prompts = result.metadata["prompts"]
+    assert prompts["prompts"] == 1
+    assert prompts["tokens_after"] < prompts["tokens_before"]
+    assert prompts["truncated"] is False
+    assert service.error_agent.name in prompts["agents"]
+    assert mock_generate.call_args.kwargs["contents"].endswith(
+        "Texto com espaços demais."
+    )
@@ -0,0 +1,107 @@
+"""Tests for cross-agent issue deduplication."""
+
+import random
+import time
+
+from content_reviewer_agent.analysis.dedup import (
+    jaccard,
+    merge_duplicate_issues,
+    normalise_text,
+    shingles,
+)
+from content_reviewer_agent.models.content import (
+    IssueSeverity,
+    IssueType,
+    ReviewIssue,
+)
+
+
+def _issue(text, agent, confidence=0.8, span=None, severity=IssueSeverity.LOW):
+    """Build an issue, optionally located at a span."""
+    start, end = span or (None, None)
+    return ReviewIssue(
+        content_id="c1",
+        issue_type=IssueType.GRAMMAR,
+        severity=severity,
+        description=f"{agent} says {text}",
+        original_text=text,
+        suggested_fix=f"fix from {agent}",
+        confidence=confidence,
+        reviewed_by_agent=agent,
+        start_offset=start,
+        end_offset=end,
+    )
+
+
+def test_shingle_similarity():
+    """Test normalisation and shingle similarity."""
+    assert normalise_text("  Hello,   World! ") == "hello world"
+    a = shingles(normalise_text("This is a example."))
+    b = shingles(normalise_text("this is a example"))
+    c = shingles(normalise_text("completely different words"))
+    assert jaccard(a, b) == 1.0
+    assert jaccard(a, c) < 0.2
+
+
+def test_merge_overlapping_spans_keeps_best():
+    """Test overlapping spans merge into the most confident issue."""
+    issues = [
+        _issue("a example", "Error", 0.9, (8, 17), IssueSeverity.MEDIUM),
+        _issue("a example.", "Comprehension", 0.7, (8, 18), IssueSeverity.HIGH),
+        _issue("recieve", "Error", 0.95, (30, 37)),
+    ]
+
+    merged = merge_duplicate_issues(issues)
+
+    assert len(merged) == 2
+    assert merged[0].suggested_fix == "fix from Error"
+    assert merged[0].severity == IssueSeverity.HIGH
+    assert merged[0].contributing_agents == ["Error", "Comprehension"]
+    assert merged[1].contributing_agents == ["Error"]
+
+
+def test_same_text_at_different_places_is_kept():
+    """Test located issues far apart are not merged even with equal text."""
+    issues = [
+        _issue("recieve", "Error", span=(0, 7)),
+        _issue("recieve", "Error", span=(50, 57)),
+        _issue("This whole sentence is long", "Comprehension", span=(0, 27)),
+    ]
+
+    assert len(merge_duplicate_issues(issues)) == 3
+
+
+def test_merge_unlocated_by_text_similarity():
+    """Test unlocated issues merge with similar quotes and take a span."""
+    issues = [
+        _issue("Python 2.7 is used", "Update", 0.9),
+        _issue("python 2.7 is used.", "Error", 0.6, (10, 28)),
+        _issue("jQuery is popular", "Source", 0.7),
+    ]
+
+    merged = merge_duplicate_issues(issues)
+
+    assert len(merged) == 2
+    assert merged[0].contributing_agents == ["Update", "Error"]
+    assert (merged[0].start_offset, merged[0].end_offset) == (10, 28)
+    assert merged[0].confidence == 0.9
+
+
+def test_merge_scales_to_thousands_of_issues():
+    """Test thousands of issues merge quickly."""
+    rng = random.Random(7)
+    vocabulary = [f"word{n}" for n in range(500)]
+    issues = []
+    for index in range(2000):
+        text = " ".join(rng.sample(vocabulary, 6))
+        span = (index * 60, index * 60 + len(text))
+        issues.append(_issue(text, "Error", 0.9, span))
+        issues.append(_issue(text, "Comprehension", 0.8))
+
+    start = time.perf_counter()
+    merged = merge_duplicate_issues(issues)
+    elapsed = time.perf_counter() - start
+
+    assert len(merged) == 2000
+    assert all(len(issue.contributing_agents) == 2 for issue in merged)
+    assert elapsed < 5
@@ -0,0 +1,157 @@
+"""Tests for the deprecated-technology catalogue."""
+
+import json
+import logging
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from content_reviewer_agent.agents.content_update import (
+    ContentUpdateAgent,
+    get_deprecation_catalogue,
+)
+from content_reviewer_agent.analysis.automaton import AhoCorasick
+from content_reviewer_agent.analysis.chunking import TextChunk
+from content_reviewer_agent.analysis.deprecations import (
+    CatalogueLoader,
+    DeprecationCatalogue,
+)
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.ai_schema import AIReviewResponse
+from content_reviewer_agent.models.content import Content, ContentType, IssueType
+
+
+def _write_catalogue(path, version, patterns):
+    """Write a one-entry catalogue file."""
+    entry = {
+        "id": "legacy",
+        "name": "Legacy",
+        "patterns": patterns,
+        "type": "deprecated",
+        "severity": "high",
+        "description": "Legacy is deprecated",
+        "replacement": "Modern",
+    }
+    path.write_text(json.dumps({"version": version, "entries": [entry]}))
+
+
+def test_aho_corasick_overlapping_matches():
+    """Test all overlapping patterns are found with their offsets."""
+    automaton = AhoCorasick([("he", 1), ("she", 2), ("his", 3), ("hers", 4)])
+
+    matches = sorted(automaton.iter_matches("uSHErs"))
+
+    assert matches == [(1, 4, 2), (2, 4, 1), (2, 6, 4)]
+
+
+def test_catalogue_versions_and_boundaries(monkeypatch):
+    """Test version ranges and word boundaries of the shipped catalogue."""
+    monkeypatch.setattr(settings, "deprecation_catalogue_path", None)
+    catalogue = get_deprecation_catalogue()
+    text = "Python 2.7, Python 3.11, Python 3, JavaScript, Java 1.7 and Angular 17."
+
+    found = [match.text for match in catalogue.scan(text)]
+
+    assert found == ["Python 2.7", "Java 1.7"]
+
+
+def test_catalogue_ignores_graph_nodes(monkeypatch):
+    """Test graph and tree nodes are not taken for Node.js versions."""
+    monkeypatch.setattr(settings, "deprecation_catalogue_path", None)
+    catalogue = get_deprecation_catalogue()
+    text = "Visit node 3 before node 4; o node 5 aponta para o node 12. Node.js 16."
+
+    assert [match.text for match in catalogue.scan(text)] == ["Node.js 16"]
+
+
+def test_catalogue_hot_reload(tmp_path, caplog):
+    """Test the loader picks up edits and survives a broken file."""
+    path = tmp_path / "catalogue.json"
+    _write_catalogue(path, "1", ["OldLib"])
+    loader = CatalogueLoader(path)
+    assert loader.get().version == "1"
+    assert [m.text for m in loader.get().scan("Use OldLib or NewLib")] == ["OldLib"]
+
+    _write_catalogue(path, "2", ["NewLib"])
+    os.utime(path, ns=(1, 10**18))
+    assert loader.get().version == "2"
+    assert [m.text for m in loader.get().scan("Use OldLib or NewLib")] == ["NewLib"]
+
+    path.write_text("{not json")
+    os.utime(path, ns=(1, 2 * 10**18))
+    with caplog.at_level(logging.WARNING):
+        assert loader.get().version == "2"
+    assert "Keeping deprecation catalogue 2" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_update_agent_reports_catalogue_hits_locally():
+    """Test catalogue hits become issues without a model call."""
+    agent = ContentUpdateAgent()
+    content = Content(
+        title="Test Content",
+        text="Install Python 2.7 and open it in Internet Explorer.",
+        content_type=ContentType.TEXT,
+    )
+
+    with patch.object(agent.client.models, "generate_content") as mock_generate:
+        issues = await agent.review(content, use_cache=False)
+
+    mock_generate.assert_not_called()
+    assert [(i.issue_type, i.original_text) for i in issues] == [
+        (IssueType.DEPRECATED, "Python 2.7"),
+        (IssueType.DEPRECATED, "Internet Explorer"),
+    ]
+    assert "catalogue" in issues[0].reviewed_by_agent
+    assert content.text[issues[0].start_offset : issues[0].end_offset] == "Python 2.7"
+
+
+@pytest.mark.asyncio
+async def test_update_agent_sends_context_dependent_sentences():
+    """Test context-dependent and time-sensitive sentences reach the model."""
+    agent = ContentUpdateAgent()
+    content = Content(
+        title="Test Content",
+        text="Hash passwords with MD5. Loops repeat code. The latest survey is from 2015.",
+        content_type=ContentType.TEXT,
+    )
+
+    with patch.object(agent.client.models, "generate_content") as mock_generate:
+        mock_generate.return_value = Mock(
+            text=AIReviewResponse(issues=[]).model_dump_json()
+        )
+        issues = await agent.review(content, use_cache=False)
+
+    assert issues == []
+    prompt = mock_generate.call_args.kwargs["contents"]
+    assert "Hash passwords with MD5." in prompt
+    assert "The latest survey is from 2015." in prompt
+    assert "Loops repeat code." not in prompt
+    assert "Catalogue notes:" in prompt
+
+
+@pytest.mark.asyncio
+async def test_update_agent_scans_only_the_segments():
+    """Test catalogue hits outside the reviewed windows are not reported again."""
+    agent = ContentUpdateAgent()
+    text = "Install Python 2.7.\n\nOpen it in Internet Explorer."
+    content = Content(title="Test", text=text, content_type=ContentType.TEXT)
+    start = text.index("Open")
+    segment = TextChunk(start, len(text), text[start:])
+
+    with patch.object(agent.client.models, "generate_content") as mock_generate:
+        issues = await agent.review_segments(content, [segment], use_cache=False)
+
+    mock_generate.assert_not_called()
+    assert [i.original_text for i in issues] == ["Internet Explorer"]
+    assert issues[0].start_offset == text.index("Internet")
+
+
+def test_catalogue_rejects_invalid_entries(tmp_path):
+    """Test a catalogue without required fields is rejected."""
+    path = tmp_path / "catalogue.json"
+    path.write_text(json.dumps({"entries": [{"id": "x"}]}))
+
+    with pytest.raises(ValueError):
+        DeprecationCatalogue.from_file(path)
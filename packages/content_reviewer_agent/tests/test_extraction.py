@@ -0,0 +1,213 @@
+"""Tests for document extraction and ingestion with page provenance."""
+
+import importlib.util
+import zipfile
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from content_reviewer_agent.analysis.extraction import (
+    ExtractionError,
+    assign_pages,
+    count_pages,
+    extract_pages,
+)
+from content_reviewer_agent.main import app
+from content_reviewer_agent.models.content import (
+    ContentType,
+    IssueSeverity,
+    IssueType,
+    ReviewIssue,
+)
+from content_reviewer_agent.models.review_result import ReviewResult, ReviewType
+from content_reviewer_agent.services import ingestion
+from content_reviewer_agent.services.ingestion import DocumentIngestor
+
+HTML_PAGE = (
+    "<html><head><title>Ignorado</title><style>p {color: red}</style></head>"
+    "<body><h1>Redes</h1><script>var x = 1;</script>"
+    "<p>Uma rede conecta&nbsp;computadores.</p><ul><li>TCP</li><li>UDP</li></ul>"
+    "</body></html>"
+)
+
+_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PR = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+
+def _slide(*paragraphs):
+    runs = "".join(f"<a:p><a:r><a:t>{text}</a:t></a:r></a:p>" for text in paragraphs)
+    return (
+        f'<p:sld xmlns:p="{_P}" xmlns:a="{_A}"><p:cSld><p:spTree><p:sp>'
+        f"<p:txBody>{runs}</p:txBody></p:sp></p:spTree></p:cSld></p:sld>"
+    )
+
+
+def _deck(path, slides, order, extra_rels=""):
+    """Write a minimal deck whose presentation lists slide files in order."""
+    with zipfile.ZipFile(path, "w") as archive:
+        ids = "".join(
+            f'<p:sldId id="{256 + i}" r:id="rId{n}"/>' for i, n in enumerate(order)
+        )
+        archive.writestr(
+            "ppt/presentation.xml",
+            f'<p:presentation xmlns:p="{_P}" xmlns:r="{_R}">'
+            f"<p:sldIdLst>{ids}</p:sldIdLst></p:presentation>",
+        )
+        rels = "".join(
+            f'<Relationship Id="rId{n}" Target="slides/slide{n}.xml"/>'
+            for n in range(1, len(slides) + 1)
+        )
+        rels += extra_rels
+        archive.writestr(
+            "ppt/_rels/presentation.xml.rels",
+            f'<Relationships xmlns="{_PR}">{rels}</Relationships>',
+        )
+        for n, paragraphs in enumerate(slides, start=1):
+            archive.writestr(f"ppt/slides/slide{n}.xml", _slide(*paragraphs))
+    return str(path)
+
+
+def test_html_text_skips_hidden_elements(tmp_path):
+    """Test scripts, styles and the head are dropped and blocks split lines."""
+    path = tmp_path / "aula.html"
+    path.write_text(HTML_PAGE, encoding="utf-8")
+
+    assert count_pages(str(path), ContentType.HTML) == 1
+    (text,) = extract_pages(str(path), ContentType.HTML, 0, 1, 10_000)
+
+    assert text == "Redes\n\nUma rede conecta\xa0computadores.\n\nTCP\n\nUDP"
+
+
+def test_slides_follow_presentation_order(tmp_path):
+    """Test slides are read in the order the presentation lists them."""
+    path = _deck(
+        tmp_path / "aula.pptx",
+        [["Segundo slide"], ["Primeiro slide", "Tópicos"]],
+        order=[2, 1],
+    )
+
+    assert count_pages(path, ContentType.SLIDE) == 2
+    assert extract_pages(path, ContentType.SLIDE, 0, 2, 10_000) == [
+        "Primeiro slide\nTópicos",
+        "Segundo slide",
+    ]
+
+
+def test_relationships_without_target_are_skipped(tmp_path):
+    """Test a relationship with no target does not break the slide order."""
+    path = _deck(
+        tmp_path / "aula.pptx",
+        [["Primeiro slide"], ["Segundo slide"]],
+        order=[2, 1],
+        extra_rels='<Relationship Id="rId9" Type="theme"/>',
+    )
+
+    assert extract_pages(path, ContentType.SLIDE, 0, 2, 10_000) == [
+        "Segundo slide",
+        "Primeiro slide",
+    ]
+
+
+def test_unsupported_document_is_rejected(tmp_path):
+    """Test text that is neither PDF, PowerPoint nor HTML is refused."""
+    path = tmp_path / "notes.txt"
+    path.write_text("plain", encoding="utf-8")
+
+    with pytest.raises(ExtractionError):
+        count_pages(str(path), ContentType.SLIDE)
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("pypdf") is not None, reason="pypdf is installed"
+)
+def test_pdf_without_pypdf_explains_the_extra(tmp_path):
+    """Test PDF extraction names the optional dependency it needs."""
+    path = tmp_path / "aula.pdf"
+    path.write_bytes(b"%PDF-1.4\n")
+
+    with pytest.raises(ExtractionError, match="documents"):
+        count_pages(str(path), ContentType.PDF)
+
+
+@pytest.mark.asyncio
+async def test_ingestor_keeps_slide_provenance(tmp_path):
+    """Test pages stream in order across workers within the character cap."""
+    slides = [[f"Slide {n} texto da aula"] for n in range(1, 8)]
+    slides[2] = []
+    path = _deck(tmp_path / "deck.pptx", slides, order=range(1, 8))
+    ingestor = DocumentIngestor(workers=2, max_chars=80, pages_per_task=2)
+
+    try:
+        content = await ingestor.extract(path, ContentType.SLIDE, "Deck")
+    finally:
+        ingestor.shutdown()
+
+    pages = content.metadata["pages"]
+    assert [p["page"] for p in pages] == [1, 2, 4, 5]
+    for page in pages[:-1]:
+        assert content.text[page["start"] :].startswith(f"Slide {page['page']} ")
+    assert content.metadata["page_label"] == "slide"
+    assert content.metadata["truncated"]
+    assert len(content.text) - 2 * (len(pages) - 1) == 80
+
+
+def test_assign_pages_prefixes_locations():
+    """Test located issues get the page their offset falls on."""
+    pages = [{"page": 1, "start": 0}, {"page": 3, "start": 50}]
+    issues = [
+        ReviewIssue(
+            content_id="c",
+            issue_type=IssueType.SPELLING,
+            severity=IssueSeverity.LOW,
+            description="d",
+            start_offset=offset,
+            location=location,
+        )
+        for offset, location in ((10, None), (60, "line 2, paragraph 2"), (None, None))
+    ]
+
+    assign_pages(issues, pages, "slide")
+
+    assert [i.page for i in issues] == [1, 3, None]
+    assert issues[0].location == "slide 1"
+    assert issues[1].location == "slide 3, line 2, paragraph 2"
+
+
+def test_review_document_endpoint(tmp_path):
+    """Test raw uploads are extracted, reviewed and size-capped."""
+    client = TestClient(app)
+    reviewed = []
+
+    async def fake_review(content, review_type, use_cache=True):
+        reviewed.append(content)
+        return ReviewResult(content_id=content.content_id, review_type=review_type)
+
+    with patch(
+        "content_reviewer_agent.api.routes.review_service.review_content",
+        side_effect=fake_review,
+    ):
+        response = client.post(
+            "/api/v1/review/document?content_type=html&title=Aula&discipline=Redes",
+            content=HTML_PAGE.encode(),
+        )
+        rejected = client.post(
+            "/api/v1/review/document?content_type=text&title=Aula",
+            content=b"plain",
+        )
+        with patch.object(ingestion.get_ingestor(), "max_bytes", 10):
+            too_large = client.post(
+                "/api/v1/review/document?content_type=html&title=Aula",
+                content=HTML_PAGE.encode(),
+            )
+
+    assert response.status_code == 200
+    assert response.json()["review_type"] == ReviewType.FULL_REVIEW.value
+    (content,) = reviewed
+    assert content.text.startswith("Redes")
+    assert content.discipline == "Redes"
+    assert content.metadata["pages"] == [{"page": 1, "start": 0}]
+    assert rejected.status_code == 415
+    assert too_large.status_code == 413
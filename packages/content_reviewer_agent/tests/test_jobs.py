@@ -0,0 +1,238 @@
+"""Tests for the durable review job queue."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from content_reviewer_agent.api import routes
+from content_reviewer_agent.main import app
+from content_reviewer_agent.models.content import Content
+from content_reviewer_agent.models.review_result import (
+    ReviewResult,
+    ReviewStatus,
+    ReviewType,
+)
+from content_reviewer_agent.services.jobs import ReviewJobQueue
+
+
+class FakeService:
+    """Review service stand-in with a configurable delay."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.reviewed = []
+
+    async def review_content(self, content, review_type, use_cache=True):
+        await asyncio.sleep(self.delay)
+        self.reviewed.append(content.content_id)
+        return ReviewResult(
+            content_id=content.content_id,
+            review_type=review_type,
+            status=ReviewStatus.COMPLETED,
+            summary="done",
+        )
+
+
+async def _wait_for_status(queue, review_id, status, timeout=2.0):
+    """Poll a job until it reaches a status."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while asyncio.get_running_loop().time() < deadline:
+        result = await queue.get(review_id)
+        if result.status == status:
+            return result
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {review_id} did not reach {status}")
+
+
+@pytest.mark.asyncio
+async def test_job_runs_to_completion(tmp_path):
+    """Test that a submitted job is processed and its result stored."""
+    queue = ReviewJobQueue(FakeService(), str(tmp_path / "jobs.db"), workers=2)
+    await queue.start()
+    try:
+        pending = await queue.submit(
+            Content(title="Lesson", text="Text."), ReviewType.ERROR_DETECTION
+        )
+        assert pending.status == ReviewStatus.PENDING
+
+        result = await _wait_for_status(
+            queue, pending.review_id, ReviewStatus.COMPLETED
+        )
+        assert result.review_id == pending.review_id
+        assert result.summary == "done"
+    finally:
+        await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_jobs_survive_restart(tmp_path):
+    """Test that jobs queued before a restart are processed afterwards."""
+    path = str(tmp_path / "jobs.db")
+    first = ReviewJobQueue(FakeService(delay=10), path)
+    waiting = await first.submit(Content(title="A", text="Text."))
+    await first.start()
+    running = await first.submit(Content(title="B", text="Text."))
+    await _wait_for_status(first, running.review_id, ReviewStatus.IN_PROGRESS)
+    await first.stop()
+    first.close()
+
+    service = FakeService()
+    second = ReviewJobQueue(service, path)
+    await second.start()
+    try:
+        for job in (waiting, running):
+            await _wait_for_status(second, job.review_id, ReviewStatus.COMPLETED)
+    finally:
+        await second.stop()
+
+
+@pytest.mark.asyncio
+async def test_cancel_pending_and_running_jobs(tmp_path):
+    """Test cancelling jobs before and during processing."""
+    service = FakeService(delay=10)
+    queue = ReviewJobQueue(service, str(tmp_path / "jobs.db"), workers=1)
+    pending = await queue.submit(Content(title="Later", text="Text."))
+    cancelled = await queue.cancel(pending.review_id)
+    assert cancelled.status == ReviewStatus.CANCELLED
+
+    await queue.start()
+    try:
+        running = await queue.submit(Content(title="Now", text="Text."))
+        await _wait_for_status(queue, running.review_id, ReviewStatus.IN_PROGRESS)
+        result = await queue.cancel(running.review_id)
+        assert result.status == ReviewStatus.CANCELLED
+        await asyncio.sleep(0.05)
+        assert (await queue.get(running.review_id)).status == ReviewStatus.CANCELLED
+        assert service.reviewed == []
+    finally:
+        await queue.stop()
+
+    assert await queue.cancel("unknown") is None
+
+
+@pytest.mark.asyncio
+async def test_job_status_keeps_submission_time(tmp_path):
+    """Test polling a job reports when it was submitted, not when polled."""
+    queue = ReviewJobQueue(FakeService(), str(tmp_path / "jobs.db"))
+    pending = await queue.submit(Content(title="Later", text="Text."))
+    await asyncio.sleep(0.01)
+
+    first = await queue.get(pending.review_id)
+    await asyncio.sleep(0.01)
+    second = await queue.get(pending.review_id)
+
+    assert first.created_at == second.created_at == pending.created_at
+
+
+@pytest.mark.asyncio
+async def test_queues_sharing_a_database_claim_each_job_once(tmp_path):
+    """Test two processes' queues never run the same job."""
+    path = str(tmp_path / "jobs.db")
+    services = [FakeService(delay=0.001), FakeService(delay=0.001)]
+    queues = [ReviewJobQueue(service, path, workers=4) for service in services]
+    jobs = await queues[0].submit_many(
+        [Content(title=f"Aula {i}", text="Text.") for i in range(40)]
+    )
+    for queue in queues:
+        await queue.start()
+    try:
+        for job in jobs:
+            await _wait_for_status(queues[1], job.review_id, ReviewStatus.COMPLETED)
+    finally:
+        for queue in queues:
+            await queue.stop()
+
+    reviewed = services[0].reviewed + services[1].reviewed
+    assert sorted(reviewed) == sorted(job.content_id for job in jobs)
+
+
+@pytest.mark.asyncio
+async def test_only_expired_leases_are_reclaimed(tmp_path):
+    """Test a starting queue leaves live jobs alone and resumes dead ones."""
+    path = str(tmp_path / "jobs.db")
+    busy = ReviewJobQueue(FakeService(delay=10), path, workers=1)
+    job = await busy.submit(Content(title="A", text="Text."))
+    await busy.start()
+    await _wait_for_status(busy, job.review_id, ReviewStatus.IN_PROGRESS)
+
+    service = FakeService()
+    other = ReviewJobQueue(service, path, workers=1)
+    await other.start()
+    try:
+        await asyncio.sleep(0.05)
+        assert service.reviewed == []
+
+        # The first process dies without stopping: its lease runs out
+        for task in busy._workers:
+            task.cancel()
+        other._execute("UPDATE review_jobs SET lease_until = 0")
+        await _wait_for_status(other, job.review_id, ReviewStatus.COMPLETED)
+        assert service.reviewed == [job.content_id]
+    finally:
+        await other.stop()
+        busy.close()
+
+
+@pytest.mark.asyncio
+async def test_worker_survives_database_errors(tmp_path):
+    """Test a failing claim or job does not end the worker."""
+    queue = ReviewJobQueue(FakeService(), str(tmp_path / "jobs.db"), workers=1)
+    claim = queue._claim_next
+    calls = []
+
+    def flaky_claim():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("database is locked")
+        return claim()
+
+    broken = await queue.submit(Content(title="Broken", text="Text."))
+    queue._execute(
+        "UPDATE review_jobs SET content = '{' WHERE review_id = ?",
+        (broken.review_id,),
+    )
+    with (
+        patch.object(queue, "_claim_next", side_effect=flaky_claim),
+        patch(
+            "content_reviewer_agent.services.jobs.settings.job_poll_interval_seconds",
+            0.01,
+        ),
+    ):
+        await queue.start()
+        try:
+            failed = await _wait_for_status(
+                queue, broken.review_id, ReviewStatus.FAILED
+            )
+            good = await queue.submit(Content(title="Good", text="Text."))
+            await _wait_for_status(queue, good.review_id, ReviewStatus.COMPLETED)
+        finally:
+            await queue.stop()
+
+    assert failed.summary.startswith("Review failed:")
+
+
+def test_job_endpoints(tmp_path, monkeypatch):
+    """Test submitting, polling and cancelling jobs over HTTP."""
+    queue = ReviewJobQueue(FakeService(), str(tmp_path / "jobs.db"))
+    monkeypatch.setattr(routes, "_job_queue", queue)
+    client = TestClient(app)
+
+    response = client.post(
+        "/api/v1/jobs?review_type=error_detection",
+        json={"title": "Lesson", "text": "Text."},
+    )
+    assert response.status_code == 202
+    review_id = response.json()["review_id"]
+    assert response.json()["status"] == "pending"
+
+    response = client.get(f"/api/v1/jobs/{review_id}")
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+
+    response = client.delete(f"/api/v1/jobs/{review_id}")
+    assert response.status_code == 200
+    assert response.json()["status"] == "cancelled"
+
+    assert client.get("/api/v1/jobs/missing").status_code == 404
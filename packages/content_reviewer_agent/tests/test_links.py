@@ -0,0 +1,274 @@
+"""Tests for reference extraction and link checking against a stub server."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import pytest
+
+from content_reviewer_agent.agents.links import LinkChecker
+from content_reviewer_agent.agents.source_verification import SourceVerificationAgent
+from content_reviewer_agent.analysis.chunking import TextChunk
+from content_reviewer_agent.analysis.references import extract_references
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.ai_schema import AIReviewResponse
+from content_reviewer_agent.models.content import Content, ContentType, IssueType
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves /ok, /no-head (rejects HEAD), /slow, /forbidden, /to-metadata
+    (redirects to the cloud metadata address) and 404 for anything else."""
+
+    requests = []
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def _respond(self):
+        with self.lock:
+            StubHandler.requests.append((self.command, self.path))
+            StubHandler.active += 1
+            StubHandler.max_active = max(StubHandler.max_active, StubHandler.active)
+        path = self.path.split("?")[0]
+        try:
+            if path == "/slow":
+                time.sleep(0.05)
+        finally:
+            # Before responding, so a client that has its answer is not
+            # still counted when it sends the next request
+            with self.lock:
+                StubHandler.active -= 1
+        if path == "/to-metadata":
+            self.send_response(302)
+            self.send_header("Location", "http://169.254.169.254/latest/")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if path in ("/ok", "/slow"):
+            code = 200
+        elif path == "/no-head":
+            code = 405 if self.command == "HEAD" else 200
+        elif path == "/forbidden":
+            code = 403
+        else:
+            code = 404
+        self.send_response(code)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_HEAD = _respond
+    do_GET = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    """Run the stub HTTP server in a background thread, allowing its host."""
+    monkeypatch.setattr(settings, "link_check_allowed_hosts", ["127.0.0.1"])
+    StubHandler.requests = []
+    StubHandler.active = StubHandler.max_active = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_extract_references():
+    """Test URLs, DOIs and citations are found with exact spans."""
+    text = (
+        "See https://example.com/page. (More at https://doi.org/10.1000/abc.)\n"
+        "As shown by doi:10.5555/xyz and (Silva et al., 2020).\n"
+        "SOUZA, M. Redes de computadores. Editora, 2015."
+    )
+
+    references = extract_references(text)
+
+    assert [(r.kind, r.text) for r in references] == [
+        ("url", "https://example.com/page"),
+        ("doi", "https://doi.org/10.1000/abc"),
+        ("doi", "doi:10.5555/xyz"),
+        ("citation", "(Silva et al., 2020)"),
+        ("citation", "SOUZA, M. Redes de computadores. Editora, 2015"),
+    ]
+    assert references[2].target == "https://doi.org/10.5555/xyz"
+    for reference in references:
+        assert text[reference.start : reference.end] == reference.text
+
+
+@pytest.mark.asyncio
+async def test_link_checker_head_then_get(stub_server):
+    """Test HEAD is tried first and GET is used when HEAD is rejected."""
+    checker = LinkChecker()
+    try:
+        statuses = await checker.check_all(
+            [f"{stub_server}/ok", f"{stub_server}/no-head", f"{stub_server}/gone"]
+        )
+    finally:
+        await checker.aclose()
+
+    assert statuses[f"{stub_server}/ok"].ok
+    assert statuses[f"{stub_server}/no-head"].ok
+    gone = statuses[f"{stub_server}/gone"]
+    assert not gone.ok and gone.status_code == 404
+    assert ("HEAD", "/ok") in StubHandler.requests
+    assert ("GET", "/ok") not in StubHandler.requests
+    assert ("GET", "/no-head") in StubHandler.requests
+
+
+@pytest.mark.asyncio
+async def test_link_checker_caches_status(stub_server):
+    """Test a status is served from the cache until it expires."""
+    checker = LinkChecker(ttl_seconds=60)
+    try:
+        await checker.check(f"{stub_server}/ok")
+        await checker.check(f"{stub_server}/ok")
+        assert len(StubHandler.requests) == 1
+
+        checker.ttl_seconds = 0
+        checker.clear()
+        await checker.check(f"{stub_server}/ok")
+        await checker.check(f"{stub_server}/ok")
+        assert len(StubHandler.requests) == 3
+    finally:
+        await checker.aclose()
+
+
+@pytest.mark.asyncio
+async def test_link_checker_per_host_limit(stub_server):
+    """Test concurrent requests to one host stay within the limit."""
+    checker = LinkChecker(per_host=2)
+    urls = [f"{stub_server}/slow?{index}" for index in range(8)]
+    try:
+        statuses = await checker.check_all(urls)
+    finally:
+        await checker.aclose()
+
+    assert all(status.ok for status in statuses.values())
+    assert len(StubHandler.requests) == 8
+    assert StubHandler.max_active <= 2
+
+
+@pytest.mark.asyncio
+async def test_link_checker_unreachable():
+    """Test connection failures are reported as broken links."""
+    checker = LinkChecker(timeout=1, allowed_hosts=["127.0.0.1"])
+    try:
+        status = await checker.check("http://127.0.0.1:9/")
+    finally:
+        await checker.aclose()
+
+    assert status.broken
+    assert status.error == "ConnectError"
+
+
+@pytest.mark.asyncio
+async def test_link_checker_refuses_private_addresses(stub_server):
+    """Test private hosts and redirects to them are never requested."""
+    port = stub_server.rsplit(":", 1)[1]
+    private = [
+        f"http://127.0.0.1:{port}/ok",
+        f"http://localhost:{port}/ok",
+        "http://10.1.2.3/",
+        "http://[::1]/",
+        "http://169.254.169.254/latest/",
+        "file:///etc/passwd",
+    ]
+    checker = LinkChecker(allowed_hosts=[])
+    allowed = LinkChecker()
+    try:
+        statuses = await checker.check_all(private)
+        redirected = await allowed.check(f"{stub_server}/to-metadata")
+    finally:
+        await checker.aclose()
+        await allowed.aclose()
+
+    assert StubHandler.requests == [("HEAD", "/to-metadata")]
+    for status in [*statuses.values(), redirected]:
+        assert status.unverified and not status.broken
+        assert status.describe().startswith("not checked")
+
+
+@pytest.mark.asyncio
+async def test_forbidden_links_are_unverified(stub_server):
+    """Test servers refusing the checker are not reported as broken."""
+    checker = LinkChecker()
+    try:
+        status = await checker.check(f"{stub_server}/forbidden")
+    finally:
+        await checker.aclose()
+
+    assert status.status_code == 403
+    assert status.unverified and not status.broken
+
+
+@pytest.mark.asyncio
+async def test_source_agent_reports_broken_links(stub_server):
+    """Test broken links become issues and verified facts reach the prompt."""
+    agent = SourceVerificationAgent()
+    checker = LinkChecker()
+    content = Content(
+        title="Test Content",
+        text=(
+            f"Docs at {stub_server}/ok, {stub_server}/forbidden and "
+            f"{stub_server}/gone (Silva, 2020)."
+        ),
+        content_type=ContentType.TEXT,
+    )
+
+    with (
+        patch(
+            "content_reviewer_agent.agents.source_verification.get_link_checker",
+            return_value=checker,
+        ),
+        patch.object(agent.client.models, "generate_content") as mock_generate,
+    ):
+        mock_generate.return_value = Mock(
+            text=AIReviewResponse(issues=[]).model_dump_json()
+        )
+        issues = await agent.review(content, use_cache=False)
+        await checker.aclose()
+
+    assert len(issues) == 1
+    assert issues[0].issue_type == IssueType.SOURCE
+    assert issues[0].original_text == f"{stub_server}/gone"
+    assert content.text[issues[0].start_offset : issues[0].end_offset] == (
+        f"{stub_server}/gone"
+    )
+    prompt = mock_generate.call_args.kwargs["contents"]
+    assert f"{stub_server}/ok: reachable, HTTP 200" in prompt
+    assert f"{stub_server}/gone: BROKEN, HTTP 404" in prompt
+    assert f"{stub_server}/forbidden: unverified, HTTP 403" in prompt
+    assert "- (Silva, 2020)" in prompt
+
+
+@pytest.mark.asyncio
+async def test_source_agent_checks_only_the_segments(stub_server):
+    """Test links outside the reviewed windows are neither checked nor reported."""
+    agent = SourceVerificationAgent()
+    checker = LinkChecker()
+    unchanged = f"Old docs at {stub_server}/gone.\n\n"
+    text = unchanged + f"New docs at {stub_server}/missing."
+    content = Content(title="Test Content", text=text, content_type=ContentType.TEXT)
+    segment = TextChunk(len(unchanged), len(text), text[len(unchanged) :])
+
+    with (
+        patch(
+            "content_reviewer_agent.agents.source_verification.get_link_checker",
+            return_value=checker,
+        ),
+        patch.object(agent.client.models, "generate_content") as mock_generate,
+    ):
+        mock_generate.return_value = Mock(
+            text=AIReviewResponse(issues=[]).model_dump_json()
+        )
+        issues = await agent.review_segments(content, [segment], use_cache=False)
+        await checker.aclose()
+
+    assert [issue.original_text for issue in issues] == [f"{stub_server}/missing"]
+    assert {path for _, path in StubHandler.requests} == {"/missing"}
+    assert "/gone" not in mock_generate.call_args.kwargs["contents"]
@@ -0,0 +1,55 @@
+"""Tests for the per-model rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from content_reviewer_agent.agents.rate_limit import ModelRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_limiter_waits_for_token_quota():
+    """Test that a drained token bucket delays the next caller."""
+    limiter = ModelRateLimiter("limit-test", rpm=1000, tpm=600)
+
+    assert await limiter.acquire(600) < 0.05
+    waited = await limiter.acquire(5)
+
+    assert 0.3 < waited < 1.0
+    assert limiter.stats()["tpm_utilisation"] > 0.9
+
+
+@pytest.mark.asyncio
+async def test_limiter_serves_callers_in_arrival_order():
+    """Test that a large request is not overtaken by smaller ones."""
+    limiter = ModelRateLimiter("fair-test", rpm=1000, tpm=1200)
+    await limiter.acquire(1200)
+    finished = []
+
+    async def call(name, tokens):
+        await limiter.acquire(tokens)
+        finished.append(name)
+
+    tasks = [asyncio.create_task(call("large", 10))]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(call(n, 1)) for n in ("small-1", "small-2")]
+    await asyncio.sleep(0)
+    assert limiter.stats()["waiting"] == 3
+
+    await asyncio.gather(*tasks)
+    assert finished == ["large", "small-1", "small-2"]
+
+
+@pytest.mark.asyncio
+async def test_limiter_request_quota_and_usage_correction():
+    """Test the RPM bucket and correcting estimates with real usage."""
+    limiter = ModelRateLimiter("rpm-test", rpm=120, tpm=10000)
+    for _ in range(120):
+        await limiter.acquire(1)
+    start = time.monotonic()
+    await limiter.acquire(1)
+    assert time.monotonic() - start > 0.3
+
+    limiter.record_usage(estimated=10, actual=2010)
+    assert limiter.stats()["tpm_utilisation"] > 0.2
@@ -0,0 +1,112 @@
+"""Tests for the readability metrics and the comprehension pre-filter."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from content_reviewer_agent.agents.comprehension import ComprehensionAgent
+from content_reviewer_agent.analysis.readability import (
+    analyse_readability,
+    detect_language,
+)
+from content_reviewer_agent.models.ai_schema import AIReviewResponse
+from content_reviewer_agent.models.content import Content, ContentType
+
+
+def test_detect_language():
+    """Test English and Portuguese detection."""
+    assert detect_language("The function returns the value of the list.") == "en"
+    assert detect_language("A função retorna o valor da lista que não muda.") == "pt"
+
+
+def test_sentence_and_paragraph_metrics():
+    """Test counts and spans per sentence and paragraph."""
+    text = "Python is easy to learn. We must utilize this methodology.\n\nRead it."
+
+    report = analyse_readability(text)
+
+    assert report.language == "en"
+    assert [text[s:e] for s, e in report.sentence_spans] == [
+        "Python is easy to learn.",
+        "We must utilize this methodology.",
+        "Read it.",
+    ]
+    assert report.sentence_paragraph.tolist() == [0, 0, 1]
+    assert report.sentence_words.tolist() == [5, 5, 2]
+    assert report.paragraph_words.tolist() == [10, 2]
+    assert report.paragraph_sentences.tolist() == [2, 1]
+    # Simple sentence reads easier than the one with long words
+    assert report.sentence_score[0] > 60 > report.sentence_score[1]
+    assert report.complex_sentences(40, 0.2).tolist() == [1]
+
+
+def test_headings_are_not_complex():
+    """Test short lines are not flagged however long their words."""
+    text = "Polymorphism\n\nInheritance explained\n\nObjects share one interface."
+
+    report = analyse_readability(text)
+
+    assert report.sentence_score[0] < 40
+    assert report.complex_sentences(40, 0.2).tolist() == []
+
+
+def test_passive_voice_and_jargon():
+    """Test passive voice and jargon heuristics in both languages."""
+    english = analyse_readability("The code was written by the team. Use getUserName.")
+    assert english.sentence_passive.tolist() == [1, 0]
+    assert english.sentence_jargon.tolist() == [0, 1]
+
+    portuguese = analyse_readability("O relatório foi enviado pela equipe de TI.")
+    assert portuguese.language == "pt"
+    assert portuguese.sentence_passive.tolist() == [1]
+    assert portuguese.sentence_jargon.tolist() == [1]
+
+
+def test_empty_text():
+    """Test an empty text yields empty metrics."""
+    report = analyse_readability("")
+    assert len(report.sentence_words) == 0
+    assert report.summary()["words"] == 0
+
+
+@pytest.mark.asyncio
+async def test_comprehension_agent_reports_long_sentence_locally():
+    """Test long sentences are located locally and simple text skips the model."""
+    agent = ComprehensionAgent()
+    long_sentence = " ".join(["the cat sat on the mat"] * 6) + "."
+    content = Content(
+        title="Test Content",
+        text=f"Python is easy to learn. {long_sentence}",
+        content_type=ContentType.TEXT,
+    )
+
+    with patch.object(agent.client.models, "generate_content") as mock_generate:
+        issues = await agent.review(content, use_cache=False)
+
+    mock_generate.assert_not_called()
+    assert len(issues) == 1
+    assert issues[0].description.startswith("Long sentence: 36 words")
+    assert content.text[issues[0].start_offset : issues[0].end_offset] == (
+        long_sentence
+    )
+
+
+@pytest.mark.asyncio
+async def test_comprehension_agent_sends_only_complex_sentences():
+    """Test only complex sentences are sent to the model."""
+    agent = ComprehensionAgent()
+    content = Content(
+        title="Test Content",
+        text="Python is easy to learn. We must utilize this methodology.",
+        content_type=ContentType.TEXT,
+    )
+
+    with patch.object(agent.client.models, "generate_content") as mock_generate:
+        mock_generate.return_value = Mock(
+            text=AIReviewResponse(issues=[]).model_dump_json()
+        )
+        await agent.review(content, use_cache=False)
+
+    prompt = mock_generate.call_args.kwargs["contents"]
+    assert "We must utilize this methodology." in prompt
+    assert "Python is easy to learn." not in prompt
@@ -0,0 +1,199 @@
+"""Tests for retries and circuit breaking around model calls."""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from google.genai import errors
+
+from content_reviewer_agent.agents.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    call_with_retry,
+    retry_after_seconds,
+)
+from content_reviewer_agent.agents.transport import ModelTransport
+
+
+class FakeClient:
+    """genai client stand-in that fails a scripted number of times."""
+
+    def __init__(self, failures):
+        self.failures = list(failures)
+        self.calls = 0
+        self.models = SimpleNamespace(generate_content=self.generate_content)
+
+    def generate_content(self, **kwargs):
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return SimpleNamespace(text='{"issues": []}')
+
+
+def _unavailable():
+    return errors.ServerError(503, {"error": {"code": 503, "message": "overloaded"}})
+
+
+def _quota(retry_after: str):
+    return errors.ClientError(
+        429,
+        {"error": {"code": 429, "status": "RESOURCE_EXHAUSTED"}},
+        httpx.Response(429, headers={"Retry-After": retry_after}),
+    )
+
+
+class RecordingSleep:
+    """Sleep replacement that records requested delays."""
+
+    def __init__(self):
+        self.delays = []
+
+    async def __call__(self, delay):
+        self.delays.append(delay)
+
+
+@pytest.mark.asyncio
+async def test_transport_retries_transient_failures():
+    """Test that 503s are retried until the call succeeds."""
+    client = FakeClient([_unavailable(), _unavailable()])
+    transport = ModelTransport(retry_policy=RetryPolicy(3, 0.001, 0.01))
+
+    response = await transport.generate_content(client, model="retry-test-model")
+
+    assert response.text == '{"issues": []}'
+    assert client.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_retries_are_bounded_and_client_errors_not_retried():
+    """Test retry exhaustion and immediate failure on a bad request."""
+    policy = RetryPolicy(max_retries=2, base_delay=0.001, max_delay=0.01)
+    sleep = RecordingSleep()
+
+    failing = FakeClient([_unavailable()] * 5)
+    with pytest.raises(errors.ServerError):
+        await call_with_retry(
+            lambda: _async(failing.generate_content), policy, sleep=sleep
+        )
+    assert failing.calls == 3
+
+    bad_request = FakeClient([errors.ClientError(400, {"error": {"code": 400}})])
+    with pytest.raises(errors.ClientError):
+        await call_with_retry(
+            lambda: _async(bad_request.generate_content), policy, sleep=sleep
+        )
+    assert bad_request.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honoured():
+    """Test that the server's Retry-After overrides the computed backoff."""
+    assert retry_after_seconds(_quota("7")) == 7.0
+    body_hint = errors.ClientError(
+        429,
+        {
+            "error": {
+                "code": 429,
+                "details": [
+                    {
+                        "@type": "type.googleapis.com/google.rpc.RetryInfo",
+                        "retryDelay": "12s",
+                    }
+                ],
+            }
+        },
+    )
+    assert retry_after_seconds(body_hint) == 12.0
+
+    sleep = RecordingSleep()
+    client = FakeClient([_quota("2.5")])
+    await call_with_retry(
+        lambda: _async(client.generate_content),
+        RetryPolicy(max_retries=1, base_delay=100, max_delay=60),
+        sleep=sleep,
+    )
+    assert sleep.delays == [2.5]
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast_and_recovers():
+    """Test open, fail-fast, half-open probe and close transitions."""
+    breaker = CircuitBreaker("breaker-test", failure_threshold=2, reset_timeout=0)
+    policy = RetryPolicy(max_retries=0)
+    client = FakeClient([_unavailable(), _unavailable()])
+
+    for _ in range(2):
+        with pytest.raises(errors.ServerError):
+            await call_with_retry(
+                lambda: _async(client.generate_content), policy, breaker
+            )
+    assert breaker.state == CircuitBreaker.OPEN
+
+    breaker.reset_timeout = 60
+    with pytest.raises(CircuitOpenError):
+        await call_with_retry(lambda: _async(client.generate_content), policy, breaker)
+    assert client.calls == 2
+
+    breaker.reset_timeout = 0
+    await call_with_retry(lambda: _async(client.generate_content), policy, breaker)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert client.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_breaker_counts_calls_not_attempts():
+    """Test a call whose retries all fail counts as one failure."""
+    breaker = CircuitBreaker("attempts-test", failure_threshold=2, reset_timeout=60)
+    policy = RetryPolicy(max_retries=3, base_delay=0.001, max_delay=0.01)
+    client = FakeClient([_unavailable()] * 4)
+
+    with pytest.raises(errors.ServerError):
+        await call_with_retry(lambda: _async(client.generate_content), policy, breaker)
+
+    assert client.calls == 4
+    assert breaker.failures == 1
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_errors_leave_the_breaker_alone():
+    """Test a non-retryable error neither resets nor counts toward opening."""
+    breaker = CircuitBreaker("client-error-test", failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    client = FakeClient([ValueError("bad request")])
+
+    with pytest.raises(ValueError):
+        await call_with_retry(
+            lambda: _async(client.generate_content), RetryPolicy(), breaker
+        )
+
+    assert breaker.failures == 1
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_frees_the_circuit():
+    """Test a probe cancelled mid-call lets the next call probe."""
+    breaker = CircuitBreaker("probe-test", failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+
+    async def hang():
+        await asyncio.sleep(60)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(
+            call_with_retry(hang, RetryPolicy(max_retries=0), breaker), 0.01
+        )
+
+    client = FakeClient([])
+    await call_with_retry(
+        lambda: _async(client.generate_content), RetryPolicy(max_retries=0), breaker
+    )
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+async def _async(func):
+    """Adapt a synchronous fake call to a coroutine."""
+    return func()
@@ -0,0 +1,96 @@
+"""Tests for the corpus scanner and its change detection."""
+
+import json
+import os
+
+import pytest
+
+from content_reviewer_agent.models.content import ContentType
+from content_reviewer_agent.models.review_result import ReviewStatus, ReviewType
+from content_reviewer_agent.services.jobs import ReviewJobQueue
+from content_reviewer_agent.services.scanner import CorpusScanner
+
+
+def _write(path, text, mtime=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """A content root with scanned and ignored files."""
+    root = tmp_path / "corpus"
+    _write(root / "aula1.md", "# Aula 1\nRedes de computadores.")
+    _write(root / "site" / "index.html", "<p>Protocolos</p>")
+    _write(root / "codigo" / "main.py", "print('ola')\n")
+    _write(root / "imagem.png", "not text")
+    _write(root / ".git" / "notes.md", "hidden")
+    _write(root / "node_modules" / "pkg" / "README.md", "vendored")
+    return root
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """A job queue whose workers are not started."""
+    return ReviewJobQueue(service=None, path=str(tmp_path / "jobs.db"))
+
+
+@pytest.mark.asyncio
+async def test_first_scan_queues_every_file(corpus, queue):
+    """Test new files are queued once each, with their content type."""
+    scanner = CorpusScanner(queue, queue.path, roots=[str(corpus)])
+
+    report = await scanner.scan()
+
+    assert (report.files, report.new, report.queued) == (3, 3, 3)
+    rows = queue._execute("SELECT content, review_type FROM review_jobs")
+    assert {review_type for _, review_type in rows} == {ReviewType.FULL_REVIEW.value}
+    types = {
+        os.path.basename(c["content_id"]): c["content_type"]
+        for c in (json.loads(content) for content, _ in rows)
+    }
+    assert types == {
+        "aula1.md": ContentType.MARKDOWN.value,
+        "index.html": ContentType.HTML.value,
+        "main.py": ContentType.CODE.value,
+    }
+
+
+@pytest.mark.asyncio
+async def test_rescan_only_queues_changes(corpus, queue):
+    """Test unchanged, touched, edited and deleted files are told apart."""
+    scanner = CorpusScanner(queue, queue.path, roots=[str(corpus)])
+    await scanner.scan()
+
+    report = await scanner.scan()
+    assert (report.unchanged, report.queued) == (3, 0)
+
+    lesson = corpus / "aula1.md"
+    _write(lesson, lesson.read_text(encoding="utf-8"), mtime=1_000_000_000)
+    report = await scanner.scan()
+    assert (report.touched, report.queued) == (1, 0)
+
+    first_job = scanner._load_manifest()[str(lesson)][3]
+    _write(lesson, "# Aula 1\nRedes e protocolos.")
+    (corpus / "codigo" / "main.py").unlink()
+    report = await scanner.scan()
+
+    assert (report.changed, report.deleted, report.queued) == (1, 1, 1)
+    assert (await queue.get(first_job)).status == ReviewStatus.CANCELLED
+    assert set(scanner._load_manifest()) == {
+        str(lesson),
+        str(corpus / "site" / "index.html"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_manifest_survives_restart(corpus, queue):
+    """Test a new scanner over the same database skips known files."""
+    await CorpusScanner(queue, queue.path, roots=[str(corpus)]).scan()
+
+    scanner = CorpusScanner(queue, queue.path, roots=[str(corpus)])
+    report = await scanner.scan()
+
+    assert (report.files, report.unchanged, report.queued) == (3, 3, 0)
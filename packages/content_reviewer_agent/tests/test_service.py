@@ -1,11 +1,26 @@
 """Tests for content review service."""
 
-from unittest.mock import patch
+import asyncio
+import time
+from contextlib import ExitStack
+from unittest.mock import Mock, patch
 
 import pytest
 
-from content_reviewer_agent.models.content import Content, ContentType
-from content_reviewer_agent.models.review_result import ReviewStatus, ReviewType
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.ai_schema import AIReviewIssue, AIReviewResponse
+from content_reviewer_agent.models.content import (
+    Content,
+    ContentType,
+    IssueSeverity,
+    IssueType,
+    ReviewIssue,
+)
+from content_reviewer_agent.models.review_result import (
+    ReviewResult,
+    ReviewStatus,
+    ReviewType,
+)
 from content_reviewer_agent.services.review_service import ContentReviewService
 
 
@@ -60,3 +75,296 @@ async def test_service_get_agents():
     assert len(agents_info["agents"]) == 4
     assert all("name" in agent for agent in agents_info["agents"])
     assert all("description" in agent for agent in agents_info["agents"])
+
+
+def _make_issue(agent_name: str, content: Content) -> ReviewIssue:
+    """Build a minimal issue tagged with the agent that produced it."""
+    return ReviewIssue(
+        content_id=content.content_id,
+        issue_type=IssueType.TECHNICAL,
+        severity=IssueSeverity.LOW,
+        description=f"Issue from {agent_name}",
+        reviewed_by_agent=agent_name,
+    )
+
+
+@pytest.mark.asyncio
+async def test_service_full_review_runs_agents_concurrently():
+    """Test that a full review overlaps agents and keeps issue order stable."""
+    service = ContentReviewService(concurrent=True)
+    content = Content(title="Test Content", text="Some text.")
+    agents = [
+        service.error_agent,
+        service.comprehension_agent,
+        service.source_agent,
+        service.update_agent,
+    ]
+    # Slowest agent first so completion order differs from merge order
+    delays = [0.2, 0.15, 0.1, 0.05]
+
+    def make_review(name, delay):
+        async def review(content, **kwargs):
+            await asyncio.sleep(delay)
+            return [_make_issue(name, content)]
+
+        return review
+
+    with ExitStack() as stack:
+        for agent, delay in zip(agents, delays):
+            stack.enter_context(
+                patch.object(
+                    agent, "review", side_effect=make_review(agent.name, delay)
+                )
+            )
+        start = time.perf_counter()
+        result = await service.review_content(content, ReviewType.FULL_REVIEW)
+        elapsed = time.perf_counter() - start
+
+    assert result.status == ReviewStatus.COMPLETED
+    assert elapsed < sum(delays)
+    assert [i.reviewed_by_agent for i in result.issues] == [a.name for a in agents]
+
+
+@pytest.mark.asyncio
+async def test_service_agent_timeout():
+    """Test that an agent exceeding the timeout fails the review."""
+    service = ContentReviewService(concurrent=True)
+    content = Content(title="Test Content", text="Some text.")
+
+    async def slow_review(content, **kwargs):
+        await asyncio.sleep(1)
+        return []
+
+    with patch.object(settings, "timeout_seconds", 0.05):
+        with patch.object(service.error_agent, "review", side_effect=slow_review):
+            result = await service.review_content(content, ReviewType.ERROR_DETECTION)
+
+    assert result.status == ReviewStatus.FAILED
+    assert "timed out" in result.summary
+
+
+@pytest.mark.asyncio
+async def test_service_incremental_re_review():
+    """Test that only edited regions are re-reviewed and old issues carry over."""
+    service = ContentReviewService()
+    agent = service.error_agent
+    old_text = (
+        "Python is a language.\n\n"
+        "It has a tpyo here. The rest is fine.\n\n"
+        "Students recieve feedback quickly."
+    )
+    new_text = (
+        "A new opening paragraph.\n\n"
+        "Python is a language.\n\n"
+        "It has a typo here. The rest is fine.\n\n"
+        "Students recieve feedback quickly."
+    )
+    prompts = []
+
+    def generate_content(**kwargs):
+        prompts.append(kwargs["contents"])
+        issues = [
+            AIReviewIssue(
+                type="spelling",
+                severity="low",
+                description=f"Misspelled '{word}'",
+                original_text=word,
+            )
+            for word in ("tpyo", "recieve")
+            if word in kwargs["contents"]
+        ]
+        response = Mock()
+        response.text = AIReviewResponse(issues=issues).model_dump_json()
+        return response
+
+    with patch.object(
+        agent.client.models, "generate_content", side_effect=generate_content
+    ):
+        first = await service.review_content(
+            Content(content_id="lesson-1", title="Lesson", text=old_text),
+            ReviewType.ERROR_DETECTION,
+        )
+        prompts.clear()
+        second = await service.review_content(
+            Content(content_id="lesson-1", title="Lesson", text=new_text),
+            ReviewType.ERROR_DETECTION,
+            previous=first.review_id,
+        )
+        unchanged = await service.review_content(
+            Content(content_id="lesson-1", title="Lesson", text=new_text),
+            ReviewType.ERROR_DETECTION,
+            previous="lesson-1",
+        )
+
+    assert len(first.issues) == 2
+    # Only the new paragraph and the edited sentence were sent
+    assert len(prompts) == 2
+    assert all("Students" not in prompt for prompt in prompts)
+
+    assert second.status == ReviewStatus.COMPLETED
+    assert [i.original_text for i in second.issues] == ["recieve"]
+    carried = second.issues[0]
+    assert new_text[carried.start_offset : carried.end_offset] == "recieve"
+    stats = second.metadata["incremental"]
+    assert stats["previous_review_id"] == first.review_id
+    assert stats["carried_issues"] == 1
+    assert stats["tokens_avoided"] > 0
+
+    assert unchanged.metadata["incremental"]["calls_made"] == 0
+    assert unchanged.metadata["incremental"]["calls_avoided"] == 1
+    assert len(unchanged.issues) == 1
+
+
+@pytest.mark.asyncio
+async def test_service_review_batch_bounds_concurrency():
+    """Test that batch reviews respect the ceiling and yield every result."""
+    service = ContentReviewService()
+    contents = [Content(title=f"Lesson {i}", text=f"Text {i}.") for i in range(7)]
+    in_flight = 0
+    peak = 0
+
+    async def fake_review(content, review_type, use_cache=True):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return ReviewResult(
+            content_id=content.content_id,
+            review_type=review_type,
+            status=ReviewStatus.COMPLETED,
+        )
+
+    with patch.object(service, "review_content", side_effect=fake_review):
+        results = [
+            result
+            async for result in service.review_batch(
+                contents, ReviewType.ERROR_DETECTION, concurrency=2
+            )
+        ]
+
+    assert peak == 2
+    assert sorted(r.content_id for r in results) == sorted(
+        c.content_id for c in contents
+    )
+
+
+@pytest.mark.asyncio
+async def test_service_review_batch_reports_failed_reviews():
+    """Test a review that raises yields a FAILED result and the batch goes on."""
+    service = ContentReviewService()
+    contents = [Content(title=f"Lesson {i}", text=f"Text {i}.") for i in range(3)]
+
+    async def fake_review(content, review_type, use_cache=True):
+        if content is contents[1]:
+            raise RuntimeError("model unavailable")
+        return ReviewResult(
+            content_id=content.content_id,
+            review_type=review_type,
+            status=ReviewStatus.COMPLETED,
+        )
+
+    with patch.object(service, "review_content", side_effect=fake_review):
+        results = {
+            result.content_id: result
+            async for result in service.review_batch(
+                contents, ReviewType.ERROR_DETECTION, concurrency=1
+            )
+        }
+
+    assert set(results) == {c.content_id for c in contents}
+    failed = results[contents[1].content_id]
+    assert failed.status == ReviewStatus.FAILED
+    assert failed.metadata["error"] == "RuntimeError: model unavailable"
+    assert results[contents[2].content_id].status == ReviewStatus.COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_service_review_stream_emits_agents_as_they_finish():
+    """Test that agent events arrive in completion order before the result."""
+    service = ContentReviewService()
+    content = Content(title="Test Content", text="Some text.")
+    agents = [
+        service.error_agent,
+        service.comprehension_agent,
+        service.source_agent,
+        service.update_agent,
+    ]
+    delays = [0.08, 0.02, 0.06, 0.04]
+
+    def make_review(name, delay):
+        async def review(content, **kwargs):
+            await asyncio.sleep(delay)
+            return [_make_issue(name, content)]
+
+        return review
+
+    with ExitStack() as stack:
+        for agent, delay in zip(agents, delays):
+            stack.enter_context(
+                patch.object(
+                    agent, "review", side_effect=make_review(agent.name, delay)
+                )
+            )
+        events = [
+            event
+            async for event in service.review_content_stream(
+                content, ReviewType.FULL_REVIEW
+            )
+        ]
+
+    names = [payload["agent"] for kind, payload in events if kind == "agent"]
+    assert names == [
+        service.comprehension_agent.name,
+        service.update_agent.name,
+        service.source_agent.name,
+        service.error_agent.name,
+    ]
+    assert all(payload["elapsed_ms"] > 0 for kind, payload in events[:-1])
+
+    kind, final = events[-1]
+    assert kind == "result"
+    assert final["status"] == "completed"
+    assert final["quality_score"] is not None
+    assert [i["reviewed_by_agent"] for i in final["issues"]] == [a.name for a in agents]
+
+
+@pytest.mark.asyncio
+async def test_service_merges_duplicate_issues_across_agents():
+    """Test the same span reported by two agents counts once."""
+    service = ContentReviewService()
+    content = Content(title="Test Content", text="Use Python 2.7 for this project.")
+
+    def located(agent_name: str, confidence: float) -> ReviewIssue:
+        issue = _make_issue(agent_name, content)
+        issue.original_text = "Python 2.7"
+        issue.start_offset, issue.end_offset = 4, 14
+        issue.confidence = confidence
+        return issue
+
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch.object(
+                service.error_agent,
+                "review",
+                return_value=[located(service.error_agent.name, 0.6)],
+            )
+        )
+        stack.enter_context(
+            patch.object(
+                service.update_agent,
+                "review",
+                return_value=[located(service.update_agent.name, 0.95)],
+            )
+        )
+        for agent in (service.comprehension_agent, service.source_agent):
+            stack.enter_context(patch.object(agent, "review", return_value=[]))
+        result = await service.review_content(content, ReviewType.FULL_REVIEW)
+
+    assert len(result.issues) == 1
+    assert result.issues[0].confidence == 0.95
+    assert result.issues[0].contributing_agents == [
+        service.error_agent.name,
+        service.update_agent.name,
+    ]
+    assert result.quality_score == 99.0
@@ -0,0 +1,203 @@
+"""Tests for the local spelling and grammar pre-filter."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from content_reviewer_agent.agents import error_detection
+from content_reviewer_agent.agents.error_detection import ErrorDetectionAgent
+from content_reviewer_agent.analysis.spelling import LocalErrorChecker, Trie
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.ai_schema import AIReviewIssue, AIReviewResponse
+from content_reviewer_agent.models.content import Content, ContentType, IssueType
+
+
+def test_trie_lookup():
+    """Test trie insertion and lookups."""
+    trie = Trie()
+    trie.insert("recieve", "receive")
+    assert trie.get("recieve") == "receive"
+    assert trie.get("reci") is None
+    assert "recieve" in trie
+    assert "receive" not in trie
+
+
+def test_checker_spelling_and_grammar():
+    """Test misspellings and grammar rules produce located hits."""
+    checker = LocalErrorChecker()
+    text = "Recieve the data. This is a example. You should of read the the code."
+
+    result = checker.check(text)
+    found = {(hit.issue_type, hit.text, hit.suggestion) for hit in result.hits}
+
+    assert ("spelling", "Recieve", "Receive") in found
+    assert ("grammar", "a example", "an example") in found
+    assert ("grammar", "should of", "should have") in found
+    assert ("grammar", "the the", "the") in found
+    for hit in result.hits:
+        assert text[hit.start : hit.end] == hit.text
+    assert result.undecided == []
+
+
+def test_checker_allows_grammatical_repeats():
+    """Test repeats such as "that that" are not reported."""
+    checker = LocalErrorChecker()
+    text = "I know that that works. It had had an error. Is is correct?"
+
+    found = [hit.text for hit in checker.check(text).hits]
+
+    assert found == ["Is is"]
+
+
+def test_checker_portuguese_rules():
+    """Test Portuguese misspellings and rules; 'a' + vowel is not flagged."""
+    checker = LocalErrorChecker()
+    text = "Fazem 3 anos que a aula usa a excessão."
+
+    found = {(hit.text, hit.suggestion) for hit in checker.check(text).hits}
+
+    assert ("Fazem 3 anos", "Faz 3 anos") in found
+    assert ("excessão", "exceção") in found
+    assert not any(text == "a aula" for text, _ in found)
+
+
+def test_checker_undecided_sentences():
+    """Test sentences with unknown words are left for the model."""
+    checker = LocalErrorChecker()
+    text = "This is a test. The quixotic compiler frobnicates tokens.\nUse Python."
+
+    result = checker.check(text)
+
+    assert [text[start:end] for start, end in result.undecided] == [
+        "The quixotic compiler frobnicates tokens."
+    ]
+
+
+def test_checker_extra_words(tmp_path):
+    """Test a word list file extends the known vocabulary."""
+    words = tmp_path / "words.txt"
+    words.write_text("quixotic\ncompiler\nfrobnicates\ntokens\n", encoding="utf-8")
+    checker = LocalErrorChecker.from_word_list(str(words))
+
+    result = checker.check("The quixotic compiler frobnicates tokens.")
+
+    assert result.undecided == []
+
+
+def test_checker_without_word_list_decides_nothing():
+    """Test the built-in lists alone report hits but keep every sentence."""
+    checker = LocalErrorChecker.from_word_list(None)
+    text = "I recieve emails regularly. This is a example."
+
+    result = checker.check(text)
+
+    assert {hit.text for hit in result.hits} == {"recieve", "a example"}
+    assert [text[start:end] for start, end in result.undecided] == [
+        "I recieve emails regularly.",
+        "This is a example.",
+    ]
+
+
+@pytest.fixture
+def word_list(tmp_path):
+    """Install a word list so the agent's checker can decide sentences."""
+    words = tmp_path / "words.txt"
+    words.write_text("compiler\ntokens\n", encoding="utf-8")
+    checker = LocalErrorChecker.from_word_list(str(words))
+    with patch.object(error_detection, "_local_checker", checker):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_error_agent_skips_model_when_decided(word_list):
+    """Test fully decided content is reviewed without a model call."""
+    agent = ErrorDetectionAgent()
+    content = Content(
+        title="Test Content",
+        text="I recieve emails regularly. This is a example.",
+        content_type=ContentType.TEXT,
+    )
+
+    with patch.object(agent.client.models, "generate_content") as mock_generate:
+        issues = await agent.review(content, use_cache=False)
+
+    mock_generate.assert_not_called()
+    assert {issue.issue_type for issue in issues} == {
+        IssueType.SPELLING,
+        IssueType.GRAMMAR,
+    }
+    spelling = next(i for i in issues if i.issue_type == IssueType.SPELLING)
+    assert content.text[spelling.start_offset : spelling.end_offset] == "recieve"
+
+
+@pytest.mark.asyncio
+async def test_error_agent_sends_only_undecided_sentences(word_list):
+    """Test only undecided sentences reach the model and map back."""
+    agent = ErrorDetectionAgent()
+    content = Content(
+        title="Test Content",
+        text="I recieve emails regularly. The compiler frobnicats tokens.",
+        content_type=ContentType.TEXT,
+    )
+    response = AIReviewResponse(
+        issues=[
+            AIReviewIssue(
+                type="spelling",
+                severity="low",
+                description="Misspelled verb",
+                original_text="frobnicats",
+                suggested_fix="frobnicates",
+                confidence=0.8,
+            )
+        ]
+    )
+
+    with patch.object(agent.client.models, "generate_content") as mock_generate:
+        mock_generate.return_value = Mock(text=response.model_dump_json())
+        issues = await agent.review(content, use_cache=False)
+
+    prompt = mock_generate.call_args.kwargs["contents"]
+    assert "frobnicats" in prompt
+    assert "emails regularly" not in prompt
+    by_text = {issue.original_text: issue for issue in issues}
+    assert set(by_text) == {"recieve", "frobnicats"}
+    model_issue = by_text["frobnicats"]
+    assert content.text[model_issue.start_offset : model_issue.end_offset] == (
+        "frobnicats"
+    )
+
+
+@pytest.mark.asyncio
+async def test_configured_dictionary_shrinks_what_the_model_sees(tmp_path):
+    """Test a word list in the settings keeps known sentences from the model."""
+    text = (
+        "Variables store values. Loops repeat statements. "
+        "Recursion calls itself. The compiler frobnicats tokens."
+    )
+    words = tmp_path / "words.txt"
+    words.write_text(
+        "variables\nstore\nloops\nrepeat\nstatements\nrecursion\ncalls\nitself\n"
+        "compiler\ntokens\n",
+        encoding="utf-8",
+    )
+    response = Mock(text=AIReviewResponse(issues=[]).model_dump_json())
+
+    async def prompt_with(dictionary):
+        agent = ErrorDetectionAgent()
+        content = Content(title="Aula", text=text, content_type=ContentType.TEXT)
+        with (
+            patch.object(settings, "local_dictionary_path", dictionary),
+            patch.object(error_detection, "_local_checker", None),
+            patch.object(agent.client.models, "generate_content") as mock_generate,
+        ):
+            mock_generate.return_value = response
+            await agent.review(content, use_cache=False)
+        return mock_generate.call_args.kwargs["contents"]
+
+    without = await prompt_with(None)
+    with_words = await prompt_with(str(words))
+
+    assert "Variables store values." in without
+    assert "Variables store values." not in with_words
+    assert "frobnicats" in with_words
+    assert len(with_words) < len(without)
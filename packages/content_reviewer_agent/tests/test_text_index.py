@@ -0,0 +1,127 @@
+"""Tests for the positional text index."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from content_reviewer_agent.agents.base_ai import get_text_index
+from content_reviewer_agent.agents.comprehension import ComprehensionAgent
+from content_reviewer_agent.analysis.text_index import TextIndex, TextIndexCache
+from content_reviewer_agent.config import settings
+from content_reviewer_agent.models.ai_schema import AIReviewIssue, AIReviewResponse
+from content_reviewer_agent.models.content import (
+    Content,
+    IssueSeverity,
+    IssueType,
+    ReviewIssue,
+)
+
+TEXT = (
+    "Python is a “high-level” language.\n"
+    "It is easy   to learn.\n"
+    "\n"
+    "Functions are first-class objects.\n"
+    "It is easy to learn.\n"
+)
+
+
+def test_locate_exact_and_normalised_quotes():
+    """Test quotes resolve despite whitespace, quote, dash and case changes."""
+    index = TextIndex(TEXT)
+
+    span = index.locate("Functions are")
+    assert TEXT[span.start : span.end] == "Functions are"
+    assert (span.line, span.paragraph) == (4, 2)
+
+    span = index.locate('a "high–level" LANGUAGE')
+    assert TEXT[span.start : span.end] == "a “high-level” language"
+    assert (span.line, span.paragraph) == (1, 1)
+
+    span = index.locate("easy to\nlearn")
+    assert TEXT[span.start : span.end] == "easy   to learn"
+    assert span.line == 2
+
+    assert index.locate("not in the text") is None
+    assert index.locate("") is None
+
+
+def test_locate_prefers_the_reported_region():
+    """Test repeated quotes resolve to the occurrence in the issue's region."""
+    index = TextIndex(TEXT)
+    second = TEXT.index("It is easy to learn")
+
+    assert len(index.find_all("It is easy to learn")) == 2
+    # A verbatim occurrence wins, otherwise the first one
+    assert index.locate("It is easy to learn").start == second
+    assert index.locate("it is easy to learn").start == TEXT.index("It is easy")
+    assert index.locate("it is easy to learn", second, len(TEXT)).start == second
+    # Outside the region the nearest occurrence is used, unless strict
+    assert index.locate("Python", second, len(TEXT)).start == 0
+    assert index.locate("Python", second, len(TEXT), strict=True) is None
+
+
+def test_resolve_issues_fills_line_and_paragraph():
+    """Test located issues gain line numbers and unlocated ones are found."""
+    index = TextIndex(TEXT)
+    located = ReviewIssue(
+        content_id="c1",
+        issue_type=IssueType.GRAMMAR,
+        severity=IssueSeverity.LOW,
+        description="Located",
+        start_offset=TEXT.index("Functions"),
+        end_offset=TEXT.index("Functions") + 9,
+    )
+    quoted = located.model_copy(
+        update={"start_offset": None, "end_offset": None, "original_text": "objects"}
+    )
+    missing = quoted.model_copy(update={"original_text": "absent"})
+
+    assert index.resolve_issues([located, quoted, missing]) == 1
+    assert (located.line, located.paragraph) == (4, 2)
+    assert located.location.startswith("line 4, paragraph 2, chars ")
+    assert TEXT[quoted.start_offset : quoted.end_offset] == "objects"
+    assert quoted.line == 4
+    assert missing.start_offset is None and missing.line is None
+
+
+def test_index_cache_builds_once_per_text():
+    """Test the cache shares one index per text and evicts the oldest."""
+    cache = TextIndexCache(max_entries=2)
+    first = cache.get("alpha")
+
+    assert cache.get("alpha") is first
+    cache.get("beta")
+    cache.get("gamma")
+    assert cache.builds == 3
+    assert cache.get("alpha") is not first
+
+
+@pytest.mark.asyncio
+async def test_agent_issues_carry_line_and_paragraph():
+    """Test model issues are placed with the shared index of the content."""
+    agent = ComprehensionAgent()
+    content = Content(title="Test Content", text=TEXT)
+    response = AIReviewResponse(
+        issues=[
+            AIReviewIssue(
+                type="comprehension",
+                severity="low",
+                description="Vague",
+                original_text="first‑class  objects",
+                confidence=0.8,
+            )
+        ]
+    )
+
+    with (
+        patch.object(settings, "local_readability_filter", False),
+        patch.object(agent.client.models, "generate_content") as mock_generate,
+    ):
+        mock_generate.return_value = Mock(text=response.model_dump_json())
+        issues = await agent.review(content, use_cache=False)
+
+    assert len(issues) == 1
+    issue = issues[0]
+    assert TEXT[issue.start_offset : issue.end_offset] == "first-class objects"
+    assert (issue.line, issue.paragraph) == (4, 2)
+    assert get_text_index(TEXT) is get_text_index(TEXT)